@@ -294,6 +294,11 @@ async def async_session_example():
     print()
 
 
+async def run_async_examples():
+    """Run all async examples on a single event loop."""
+    await async_session_example()
+
+
 def session_properties_example():
     """Session properties and state checking."""
     print("=" * 60)
@@ -342,9 +347,9 @@ def main():
         transfer_example()
         session_properties_example()
         
-        # Async example
-        print("Running async example...")
-        asyncio.run(async_session_example())
+        # Async examples (one event loop for all of them)
+        print("Running async examples...")
+        asyncio.run(run_async_examples())
         
         print("=" * 60)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY!")
@@ -24,11 +24,12 @@ from .exceptions import (
 from .types import TypeConverter, register_converter
 
 # Pagination
-from .pagination import Page, Pageable
+from .pagination import CountCache, Keyset, KeysetSlice, Page, Pageable, Slice
 
 # Session management
 from .session import Session
 from .async_session import AsyncSession
+from .pool import GraphPool, get_pool, close_pool
 
 # Index and schema management
 from .indexes import IndexManager, IndexInfo
@@ -76,9 +77,16 @@ __all__ = [
     # Pagination
     "Page",
     "Pageable",
+    "Slice",
+    "CountCache",
+    "Keyset",
+    "KeysetSlice",
     # Session
     "Session",
     "AsyncSession",
+    "GraphPool",
+    "get_pool",
+    "close_pool",
     # Index management
     "IndexManager",
     "IndexInfo",
@@ -1,7 +1,9 @@
 """Async entity mapper for converting between Python objects and graph structures."""
 
+from types import SimpleNamespace
 from typing import Any, Dict, List, Tuple, Type, TypeVar
 
+from .async_relationships import RelationshipBatchLoader, create_async_lazy_proxy
 from .exceptions import MappingException
 from .metadata import EntityMetadata
 from .types import get_type_registry
@@ -20,6 +22,10 @@ class AsyncEntityMapper:
         self._query_builder = query_builder
         # Reuse sync mapper for non-async operations
         self._sync_mapper = EntityMapper(graph=graph, query_builder=query_builder)
+        # Shared by all lazy proxies created by this mapper to batch their loads
+        self._batch_loader = RelationshipBatchLoader(
+            graph=graph, mapper=self, query_builder=query_builder
+        )
 
     def get_entity_metadata(self, entity_class: Type[T]) -> EntityMetadata:
         """
@@ -75,6 +81,61 @@ class AsyncEntityMapper:
         """
         return self._sync_mapper.map_to_cypher_merge(entity)
 
+    def map_to_cypher_create_batch(self, entities: List[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate one Cypher CREATE statement for several entities of the same type.
+
+        Args:
+            entities: Non-empty list of entity instances of a single type
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        return self._sync_mapper.map_to_cypher_create_batch(entities)
+
+    def map_to_cypher_merge_batch(self, entities: List[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate one Cypher MERGE statement for several entities of the same type.
+
+        Args:
+            entities: Non-empty list of entity instances of a single type
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+
+        Raises:
+            MappingException: If the entity type or an entity has no ID
+        """
+        return self._sync_mapper.map_to_cypher_merge_batch(entities)
+
+    async def cascade_save(self, entity: Any) -> int:
+        """
+        Insert a new entity with a single query and set its generated ID.
+
+        Only the node is written; relationships set on the entity are left to the
+        caller.
+
+        Args:
+            entity: Entity instance without an ID
+
+        Returns:
+            Internal ID of the created node
+
+        Raises:
+            MappingException: If the mapper has no graph to write to
+        """
+        if self._graph is None:
+            raise MappingException("Cannot save entity: mapper has no graph")
+
+        cypher, params = self.map_to_cypher_create_batch([entity])
+        result = await self._graph.query(cypher, params)
+
+        node_id = result.result_set[0][0]  # node_id column
+        metadata = self.get_entity_metadata(type(entity))
+        if metadata.id_property:
+            setattr(entity, metadata.id_property.python_name, node_id)
+        return node_id
+
     async def _initialize_lazy_relationships(self, entity: T, entity_id: int) -> None:
         """
         Initialize async lazy relationship proxies on an entity.
@@ -89,9 +150,6 @@ class AsyncEntityMapper:
 
         metadata = self.get_entity_metadata(type(entity))
 
-        # Import here to avoid circular dependency
-        from .async_relationships import create_async_lazy_proxy
-
         for rel_meta in metadata.relationships:
             # Determine target class
             target_class = rel_meta.target_class
@@ -111,11 +169,40 @@ class AsyncEntityMapper:
                 entity_class=target_class,
                 mapper=self,
                 query_builder=self._query_builder,
+                loader=self._batch_loader,
             )
 
             # Set the proxy on the entity
             setattr(entity, rel_meta.python_name, proxy)
 
+    def _construct_slotted(
+        self, entity_class: Type[T], metadata: EntityMetadata, values: Dict[str, Any]
+    ) -> T:
+        """
+        Build a slotted entity without going through the generated __init__.
+
+        Slotted entities have no instance __dict__, so attributes are stored
+        directly into their slots instead of being validated keyword by keyword.
+
+        Args:
+            entity_class: Slotted entity class
+            metadata: Entity metadata
+            values: Property values keyed by Python attribute name
+
+        Returns:
+            Entity instance
+        """
+        entity = object.__new__(entity_class)
+        set_slot = object.__setattr__
+
+        for name, value in values.items():
+            set_slot(entity, name, value)
+
+        for rel in metadata.relationships:
+            set_slot(entity, rel.python_name, [] if rel.is_collection else None)
+
+        return entity
+
     async def map_from_node(self, node: Any, entity_class: Type[T]) -> T:
         """
         Convert FalkorDB node to entity instance.
@@ -136,20 +223,10 @@ class AsyncEntityMapper:
         # Map properties
         node_properties = node.properties if hasattr(node, "properties") else {}
 
-        for prop in metadata.properties:
+        for prop, _, from_graph in self._sync_mapper.get_property_codecs(metadata):
             # Check if property exists in node
             if prop.graph_name in node_properties:
-                graph_value = node_properties[prop.graph_name]
-
-                # Use custom converter if provided
-                if prop.converter:
-                    python_value = prop.converter.from_graph(graph_value)
-                else:
-                    python_value = self._type_registry.convert_from_graph(
-                        graph_value, prop.python_type
-                    )
-
-                kwargs[prop.python_name] = python_value
+                kwargs[prop.python_name] = from_graph(node_properties[prop.graph_name])
             elif prop.is_id and internal_id is not None and prop.id_generator is not None:
                 # Use internal ID for auto-generated ID fields
                 kwargs[prop.python_name] = internal_id
@@ -159,10 +236,13 @@ class AsyncEntityMapper:
 
         # Create instance
         try:
-            entity = entity_class(**kwargs)
+            if metadata.uses_slots:
+                entity = self._construct_slotted(entity_class, metadata, kwargs)
+            else:
+                entity = entity_class(**kwargs)
 
-            # Initialize async lazy relationships if we have an ID
-            if internal_id is not None:
+            # Initialize async lazy relationships if we have an ID and there are any
+            if internal_id is not None and metadata.relationships:
                 await self._initialize_lazy_relationships(entity, internal_id)
 
             return entity
@@ -171,6 +251,26 @@ class AsyncEntityMapper:
                 f"Failed to create instance of {entity_class.__name__}: {e}"
             ) from e
 
+    async def map_from_projection(
+        self, record: Any, entity_class: Type[T], projection: Tuple[str, ...]
+    ) -> T:
+        """
+        Convert a row of projected property columns to entity instance.
+
+        Args:
+            record: Row holding the node's internal ID followed by one value per
+                property in projection order
+            entity_class: Target entity class
+            projection: Python names of the projected properties
+
+        Returns:
+            Entity instance with properties outside the projection set to None
+        """
+        metadata = self.get_entity_metadata(entity_class)
+        graph_names = [metadata.get_property_by_python_name(name).graph_name for name in projection]
+        node = SimpleNamespace(id=record[0], properties=dict(zip(graph_names, record[1:])))
+        return await self.map_from_node(node, entity_class)
+
     async def map_from_record(
         self, record: Any, entity_class: Type[T], var_name: str = "n", header: Any = None
     ) -> T:
@@ -190,14 +290,7 @@ class AsyncEntityMapper:
         if isinstance(record, list):
             # FalkorDB returns list format - need to find column index
             if header is not None:
-                # Header format: [[column_id, column_name], ...]
-                column_index = None
-                for idx, header_item in enumerate(header):
-                    # header_item is [column_id, column_name]
-                    col_name = header_item[1] if isinstance(header_item, list) else header_item
-                    if col_name == var_name:
-                        column_index = idx
-                        break
+                column_index = self._sync_mapper.column_index(header, var_name)
 
                 if column_index is not None:
                     node = record[column_index]
@@ -224,22 +317,36 @@ class AsyncEntityMapper:
         self._sync_mapper.update_entity_id(entity, node_id)
 
     async def map_with_relationships(
-        self, record: Any, entity_class: Type[T], fetch_hints: List[str], var_name: str = "n"
+        self,
+        record: Any,
+        entity_class: Type[T],
+        fetch_hints: List[str],
+        var_name: str = "n",
+        header: Any = None,
     ) -> T:
         """
         Convert FalkorDB query result record to entity with eagerly loaded relationships.
 
         Args:
-            record: FalkorDB result record
+            record: FalkorDB result record (list or dict)
             entity_class: Target entity class
             fetch_hints: List of relationship names that were eagerly loaded
             var_name: Variable name in query (default: 'n')
+            header: Optional header from query result for column name mapping
 
         Returns:
             Entity instance with relationships populated
         """
-        # Map main entity
-        node = record[var_name]
+        # Map main entity - handle both list and dict format
+        if isinstance(record, list):
+            # Related node columns are looked up by name, through the header when given
+            columns = self._sync_mapper._header_columns(header) if header is not None else {}
+            node = record[columns.get(var_name, 0)]  # Fallback to first column
+            related = {hint: record[columns[hint]] for hint in fetch_hints if hint in columns}
+        else:
+            node = record[var_name]  # Dictionary format
+            related = record
+
         entity = await self.map_from_node(node, entity_class)
 
         # Get metadata
@@ -247,7 +354,7 @@ class AsyncEntityMapper:
 
         # Map each eagerly loaded relationship
         for hint in fetch_hints:
-            if hint not in record:
+            if hint not in related:
                 continue
 
             # Get relationship metadata
@@ -256,28 +363,31 @@ class AsyncEntityMapper:
                 continue
 
             # Get related nodes from record
-            related_nodes = record[hint]
+            related_nodes = related[hint]
 
             # Handle None or empty list
             if related_nodes is None:
                 related_nodes = []
+            elif not isinstance(related_nodes, list):
+                # A single node column rather than a collect() list
+                related_nodes = [related_nodes]
 
-            # Filter out None values (from OPTIONAL MATCH)
-            related_nodes = [n for n in related_nodes if n is not None]
+            target_class = rel_meta.target_class
+            if not target_class:
+                continue
 
-            # Map nodes to entities (async)
-            if rel_meta.target_class:
-                related_entities = []
-                for node in related_nodes:
-                    entity_obj = await self.map_from_node(node, rel_meta.target_class)
-                    related_entities.append(entity_obj)
+            # Map nodes to entities (async), skipping None values (from OPTIONAL MATCH)
+            if rel_meta.is_collection:
+                value = [
+                    await self.map_from_node(node, target_class)
+                    for node in related_nodes
+                    if node is not None
+                ]
+            else:
+                # For single relationships, map only the first node or None
+                first = next((node for node in related_nodes if node is not None), None)
+                value = None if first is None else await self.map_from_node(first, target_class)
 
-                # Set on entity based on relationship type
-                if rel_meta.is_collection:
-                    setattr(entity, rel_meta.python_name, related_entities)
-                else:
-                    # For single relationships, take first or None
-                    value = related_entities[0] if related_entities else None
-                    setattr(entity, rel_meta.python_name, value)
+            setattr(entity, rel_meta.python_name, value)
 
         return entity
@@ -1,11 +1,155 @@
 """Async relationship loading and management."""
 
-from typing import Any, Generic, List, Optional, Type, TypeVar
+import asyncio
+import functools
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar
 
 from .metadata import RelationshipMetadata
 
 T = TypeVar("T")
 
+# (id(entity), node_id) keys already handled by the save_relationships call tree running
+# in the current context; nested cascade saves share it, so reference cycles terminate
+_saving_entities: ContextVar[Optional[Set[Tuple[int, int]]]] = ContextVar(
+    "falkordb_orm_saving_entities", default=None
+)
+
+# id(entity) -> (entity, task) for cascade inserts started by the same call tree, so
+# an unsaved entity reached through several concurrent branches is created only once
+_cascade_saves: ContextVar[Optional[Dict[int, Tuple[Any, "asyncio.Task[int]"]]]] = ContextVar(
+    "falkordb_orm_cascade_saves", default=None
+)
+
+
+class RelationshipBatchLoader:
+    """
+    Coalesces async lazy relationship loads into batched queries.
+
+    Loads requested during the same event loop iteration are grouped per
+    relationship and target class, fetched with a single query, and handed
+    back to each waiting proxy by source ID.
+    """
+
+    def __init__(self, graph: Any, mapper: Any, query_builder: Any):
+        """
+        Initialize batch loader.
+
+        Args:
+            graph: FalkorDB async graph instance
+            mapper: Async entity mapper instance
+            query_builder: Query builder instance
+        """
+        self._graph = graph
+        self._mapper = mapper
+        self._query_builder = query_builder
+        # (id(relationship_meta), entity_class) -> (relationship_meta, entity_class, waiters)
+        self._pending: Dict[
+            Tuple[int, Type], Tuple[RelationshipMetadata, Type, Dict[int, List[asyncio.Future]]]
+        ] = {}
+        self._scheduled = False
+        # Running batch tasks; the event loop only keeps weak references to them
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(
+        self, relationship_meta: RelationshipMetadata, entity_class: Type[T], source_id: int
+    ) -> "asyncio.Future[List[T]]":
+        """
+        Request the related entities of one source entity.
+
+        Args:
+            relationship_meta: Relationship metadata
+            entity_class: Target entity class
+            source_id: ID of source entity
+
+        Returns:
+            Future resolved with the list of related entities
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        key = (id(relationship_meta), entity_class)
+        bucket = self._pending.get(key)
+        if bucket is None:
+            bucket = self._pending[key] = (relationship_meta, entity_class, {})
+        bucket[2].setdefault(source_id, []).append(future)
+
+        # Dispatch once everything queued in this loop iteration has been collected
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    def _dispatch(self) -> None:
+        """Start one batched query per pending relationship bucket."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+
+        for relationship_meta, entity_class, waiters in pending.values():
+            task = asyncio.ensure_future(self._load_batch(relationship_meta, entity_class, waiters))
+            self._tasks.add(task)
+            task.add_done_callback(functools.partial(self._batch_done, waiters))
+
+    def _batch_done(self, waiters: Dict[int, List[asyncio.Future]], task: asyncio.Task) -> None:
+        """
+        Release a finished batch task and fail its waiters if it did not complete.
+
+        Args:
+            waiters: Futures waiting for the batch, keyed by source ID
+            task: Finished batch task
+        """
+        self._tasks.discard(task)
+
+        cancelled = task.cancelled()
+        error = None if cancelled else task.exception()
+        if not cancelled and error is None:
+            return
+
+        for futures in waiters.values():
+            for future in futures:
+                if future.done():
+                    continue
+                if cancelled:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+
+    async def _load_batch(
+        self,
+        relationship_meta: RelationshipMetadata,
+        entity_class: Type,
+        waiters: Dict[int, List[asyncio.Future]],
+    ) -> None:
+        """
+        Load related entities for all waiting source IDs and resolve their futures.
+
+        Args:
+            relationship_meta: Relationship metadata
+            entity_class: Target entity class
+            waiters: Futures waiting for results, keyed by source ID
+        """
+        # Errors propagate to the task and are forwarded to waiters by _batch_done
+        cypher, params = self._query_builder.build_relationship_batch_load_query(
+            relationship_meta, list(waiters), entity_class
+        )
+
+        result = await self._graph.query(cypher, params)
+
+        # Demultiplex rows by source ID
+        related: Dict[int, List[Any]] = {source_id: [] for source_id in waiters}
+        for record in result.result_set:
+            source_id = record[1] if isinstance(record, list) else record["source_id"]
+            entity = await self._mapper.map_from_record(
+                record, entity_class, "target", header=getattr(result, "header", None)
+            )
+            related.setdefault(source_id, []).append(entity)
+
+        for source_id, futures in waiters.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(list(related[source_id]))
+
 
 class AsyncLazyList(Generic[T]):
     """
@@ -14,6 +158,19 @@ class AsyncLazyList(Generic[T]):
     Loads related entities on first access and caches them.
     """
 
+    __slots__ = (
+        "_graph",
+        "_source_id",
+        "_relationship_meta",
+        "_entity_class",
+        "_mapper",
+        "_query_builder",
+        "_loaded",
+        "_loader",
+        "_only",
+        "_items",
+    )
+
     def __init__(
         self,
         graph: Any,
@@ -22,6 +179,8 @@ class AsyncLazyList(Generic[T]):
         entity_class: Type[T],
         mapper: Any,
         query_builder: Any,
+        loader: Optional[RelationshipBatchLoader] = None,
+        only: Optional[Tuple[str, ...]] = None,
     ):
         """
         Initialize async lazy list proxy.
@@ -33,6 +192,9 @@ class AsyncLazyList(Generic[T]):
             entity_class: Target entity class
             mapper: Async entity mapper instance
             query_builder: Query builder instance
+            loader: Optional batch loader shared by proxies of the same mapper
+            only: Optional Python names of the only properties to fetch; the others
+                are left as None on the loaded entities
         """
         self._graph = graph
         self._source_id = source_id
@@ -40,40 +202,82 @@ class AsyncLazyList(Generic[T]):
         self._entity_class = entity_class
         self._mapper = mapper
         self._query_builder = query_builder
+        self._loader = loader
+        self._only = only
         self._loaded = False
         self._items: List[T] = []
 
-    async def _load(self) -> None:
+    async def _load_all(self) -> None:
         """Load related entities from database."""
         if self._loaded:
             return
 
-        # Build and execute query
+        # Coalesce with other pending loads when a batch loader is available;
+        # projected loads need their own query
+        if self._loader is not None and self._only is None:
+            self._items = await self._loader.load(
+                self._relationship_meta, self._entity_class, self._source_id
+            )
+            self._loaded = True
+            return
+
+        self._items = [entity async for entity in self._query()]
+        self._loaded = True
+
+    async def _query(self) -> AsyncIterator[T]:
+        """
+        Run the relationship query and map its rows one at a time.
+
+        Yields:
+            Related entity instances
+        """
         cypher, params = self._query_builder.build_relationship_load_query(
-            self._relationship_meta, self._source_id, self._entity_class
+            self._relationship_meta, self._source_id, self._entity_class, self._only
         )
 
         result = await self._graph.query(cypher, params)
 
-        # Map results to entities
-        self._items = []
         for record in result.result_set:
-            entity = await self._mapper.map_from_record(record, self._entity_class, "target")
-            self._items.append(entity)
-
-        self._loaded = True
+            if self._only is not None:
+                yield await self._mapper.map_from_projection(record, self._entity_class, self._only)
+            else:
+                yield await self._mapper.map_from_record(record, self._entity_class, "target")
 
     async def load(self) -> List[T]:
         """Explicitly load and return the list."""
-        await self._load()
+        await self._load_all()
         return self._items
 
-    async def __aiter__(self):
-        """Async iteration over related entities."""
-        await self._load()
+    async def stream(self) -> AsyncIterator[T]:
+        """
+        Yield related entities, mapping rows one at a time on the first pass.
+
+        Once the list has been loaded, the cached entities are yielded instead.
+        Loads that can be coalesced go through the batch loader; otherwise rows
+        are yielded as they are mapped and cached when the iteration completes.
+
+        Yields:
+            Related entity instances
+        """
+        if not self._loaded:
+            if self._loader is not None and self._only is None:
+                await self._load_all()
+            else:
+                items: List[T] = []
+                async for entity in self._query():
+                    items.append(entity)
+                    yield entity
+                self._items = items
+                self._loaded = True
+                return
+
         for item in self._items:
             yield item
 
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Async iteration over related entities."""
+        return self.stream()
+
     def __repr__(self) -> str:
         """String representation."""
         if self._loaded:
@@ -88,6 +292,18 @@ class AsyncLazySingle(Generic[T]):
     Loads related entity on first access and caches it.
     """
 
+    __slots__ = (
+        "_graph",
+        "_source_id",
+        "_relationship_meta",
+        "_entity_class",
+        "_mapper",
+        "_query_builder",
+        "_loaded",
+        "_loader",
+        "_item",
+    )
+
     def __init__(
         self,
         graph: Any,
@@ -96,6 +312,7 @@ class AsyncLazySingle(Generic[T]):
         entity_class: Type[T],
         mapper: Any,
         query_builder: Any,
+        loader: Optional[RelationshipBatchLoader] = None,
     ):
         """
         Initialize async lazy single proxy.
@@ -107,6 +324,7 @@ class AsyncLazySingle(Generic[T]):
             entity_class: Target entity class
             mapper: Async entity mapper instance
             query_builder: Query builder instance
+            loader: Optional batch loader shared by proxies of the same mapper
         """
         self._graph = graph
         self._source_id = source_id
@@ -114,6 +332,7 @@ class AsyncLazySingle(Generic[T]):
         self._entity_class = entity_class
         self._mapper = mapper
         self._query_builder = query_builder
+        self._loader = loader
         self._loaded = False
         self._item: Optional[T] = None
 
@@ -122,6 +341,15 @@ class AsyncLazySingle(Generic[T]):
         if self._loaded:
             return
 
+        # Coalesce with other pending loads when a batch loader is available
+        if self._loader is not None:
+            items = await self._loader.load(
+                self._relationship_meta, self._entity_class, self._source_id
+            )
+            self._item = items[0] if items else None
+            self._loaded = True
+            return
+
         # Build and execute query
         cypher, params = self._query_builder.build_relationship_load_query(
             self._relationship_meta, self._source_id, self._entity_class
@@ -158,6 +386,7 @@ def create_async_lazy_proxy(
     entity_class: Type[T],
     mapper: Any,
     query_builder: Any,
+    loader: Optional[RelationshipBatchLoader] = None,
 ) -> Any:
     """
     Create appropriate async lazy proxy based on relationship metadata.
@@ -169,9 +398,11 @@ def create_async_lazy_proxy(
         entity_class: Target entity class
         mapper: Async entity mapper instance
         query_builder: Query builder instance
+        loader: Optional batch loader used to coalesce loads across proxies
 
     Returns:
-        AsyncLazyList for collections, AsyncLazySingle for single relationships
+        AsyncLazyList for collections, AsyncLazySingle for single relationships;
+        collections fetch only the relationship's ``only`` properties when set
     """
     if relationship_meta.is_collection:
         return AsyncLazyList(
@@ -181,6 +412,8 @@ def create_async_lazy_proxy(
             entity_class=entity_class,
             mapper=mapper,
             query_builder=query_builder,
+            loader=loader,
+            only=relationship_meta.only,
         )
     else:
         return AsyncLazySingle(
@@ -190,6 +423,7 @@ def create_async_lazy_proxy(
             entity_class=entity_class,
             mapper=mapper,
             query_builder=query_builder,
+            loader=loader,
         )
 
 
@@ -210,7 +444,7 @@ class AsyncRelationshipManager:
         self._graph = graph
         self._mapper = mapper
         self._query_builder = query_builder
-        self._entity_tracker: set = set()
+        self._related_cache: Dict[type, Tuple[Any, Optional[str]]] = {}
 
     async def save_relationships(self, source_entity: Any, source_id: int, metadata: Any) -> None:
         """
@@ -221,12 +455,22 @@ class AsyncRelationshipManager:
             source_id: Source entity's database ID
             metadata: Entity metadata
         """
-        # Track this entity to avoid infinite loops
+        # Track this entity to avoid infinite loops; the outermost call owns the set
+        visited = _saving_entities.get()
+        token = saves_token = None
+        if visited is None:
+            visited = set()
+            token = _saving_entities.set(visited)
+            saves_token = _cascade_saves.set({})
+
         entity_key = (id(source_entity), source_id)
-        if entity_key in self._entity_tracker:
+        if entity_key in visited:
             return
 
-        self._entity_tracker.add(entity_key)
+        visited.add(entity_key)
+
+        # Target IDs collected per relationship, created in one query per relationship
+        edge_batches: List[Tuple[RelationshipMetadata, List[int]]] = []
 
         try:
             for rel_meta in metadata.relationships:
@@ -241,25 +485,70 @@ class AsyncRelationshipManager:
                 if isinstance(rel_value, (AsyncLazyList, AsyncLazySingle)):
                     continue
 
+                target_ids: List[int] = []
+
                 # Handle collection relationships
                 if rel_meta.is_collection:
                     if not isinstance(rel_value, (list, tuple)):
                         continue
 
+                    # Save related entities concurrently; an entity listed twice is saved once
+                    distinct = list({id(related): related for related in rel_value}.values())
+                    saved_ids = await asyncio.gather(
+                        *(
+                            self._get_or_save_related_entity(related, rel_meta)
+                            for related in distinct
+                        )
+                    )
+                    id_by_entity = {
+                        id(related): saved for related, saved in zip(distinct, saved_ids)
+                    }
+
                     for related_entity in rel_value:
-                        target_id = await self._get_or_save_related_entity(related_entity, rel_meta)
+                        target_id = id_by_entity[id(related_entity)]
                         if target_id is not None:
-                            await self._create_relationship_edge(source_id, target_id, rel_meta)
+                            target_ids.append(target_id)
 
                 # Handle single relationships
                 else:
                     target_id = await self._get_or_save_related_entity(rel_value, rel_meta)
                     if target_id is not None:
-                        await self._create_relationship_edge(source_id, target_id, rel_meta)
+                        target_ids.append(target_id)
+
+                if target_ids:
+                    edge_batches.append((rel_meta, target_ids))
+
+            # Relationship types are independent, so their batches can run concurrently
+            await asyncio.gather(
+                *(
+                    self._create_relationship_edges(source_id, target_ids, rel_meta)
+                    for rel_meta, target_ids in edge_batches
+                )
+            )
 
         finally:
-            # Clean up tracker for this entity
-            self._entity_tracker.discard(entity_key)
+            # Drop the visited set once the outermost save completes
+            if token is not None:
+                _saving_entities.reset(token)
+                _cascade_saves.reset(saves_token)
+
+    def _related_metadata(self, entity_type: type) -> Tuple[Any, Optional[str]]:
+        """
+        Get metadata and ID attribute name for a related entity type, using cache.
+
+        Args:
+            entity_type: Related entity class
+
+        Returns:
+            Tuple of (entity metadata, ID property python name or None)
+        """
+        cached = self._related_cache.get(entity_type)
+        if cached is None:
+            entity_metadata = self._mapper.get_entity_metadata(entity_type)
+            id_property = entity_metadata.id_property
+            cached = (entity_metadata, id_property.python_name if id_property else None)
+            self._related_cache[entity_type] = cached
+        return cached
 
     async def _get_or_save_related_entity(
         self, entity: Any, rel_meta: RelationshipMetadata
@@ -277,48 +566,65 @@ class AsyncRelationshipManager:
         if entity is None:
             return None
 
-        # Get entity metadata
-        entity_metadata = self._mapper.get_entity_metadata(type(entity))
+        entity_metadata, id_name = self._related_metadata(type(entity))
 
         # Check if entity has an ID
-        if entity_metadata.id_property:
-            entity_id = getattr(entity, entity_metadata.id_property.python_name, None)
+        if id_name is not None:
+            entity_id = getattr(entity, id_name, None)
 
             # If has ID, return it
             if entity_id is not None:
                 return entity_id
 
-            # If no ID and cascade enabled, save the entity
+            # If no ID and cascade enabled, insert the entity and its own relationships,
+            # joining an insert of the same entity already started by another branch
             if rel_meta.cascade:
-                # Import here to avoid circular dependency
-                from .async_repository import AsyncRepository
+                saves = _cascade_saves.get()
+                if saves is None:
+                    return await self._cascade_save(entity, entity_metadata)
 
-                # Create temporary repository for the target entity
-                target_repo = AsyncRepository(self._graph, type(entity))
-                saved_entity = await target_repo.save(entity)
-
-                # Return the saved entity's ID
-                return getattr(saved_entity, entity_metadata.id_property.python_name, None)
+                pending = saves.get(id(entity))
+                if pending is None:
+                    task = asyncio.ensure_future(self._cascade_save(entity, entity_metadata))
+                    pending = saves[id(entity)] = (entity, task)
+                return await pending[1]
 
         return None
 
-    async def _create_relationship_edge(
-        self, source_id: int, target_id: int, rel_meta: RelationshipMetadata
+    async def _cascade_save(self, entity: Any, entity_metadata: Any) -> int:
+        """
+        Insert a new related entity, then save its own relationships.
+
+        Args:
+            entity: Related entity instance without an ID
+            entity_metadata: Metadata of the entity's class
+
+        Returns:
+            Internal ID of the created node
+        """
+        node_id = await self._mapper.cascade_save(entity)
+        if entity_metadata.relationships:
+            await self.save_relationships(entity, node_id, entity_metadata)
+        return node_id
+
+    async def _create_relationship_edges(
+        self, source_id: int, target_ids: List[int], rel_meta: RelationshipMetadata
     ) -> None:
         """
-        Create relationship edge in the graph.
+        Create all relationship edges from a source node in a single query.
 
         Args:
             source_id: Source node ID
-            target_id: Target node ID
+            target_ids: Target node IDs
             rel_meta: Relationship metadata
         """
-        cypher, params = self._query_builder.build_relationship_create_query(
-            rel_meta, source_id, target_id
-        )
+        pairs = [{"source_id": source_id, "target_id": target_id} for target_id in target_ids]
+        cypher, params = self._query_builder.build_relationship_create_batch_query(rel_meta, pairs)
 
         await self._graph.query(cypher, params)
 
     def clear_tracker(self) -> None:
-        """Clear the entity tracker."""
-        self._entity_tracker.clear()
+        """Clear the entity tracker of the save in progress in the current context."""
+        visited = _saving_entities.get()
+        if visited is not None:
+            visited.clear()
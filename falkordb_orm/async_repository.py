@@ -287,7 +287,7 @@ class AsyncRepository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN sum(n.{property_name}) as total"
 
             result = await self.graph.query(cypher, {})
@@ -314,7 +314,7 @@ class AsyncRepository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN avg(n.{property_name}) as average"
 
             result = await self.graph.query(cypher, {})
@@ -341,7 +341,7 @@ class AsyncRepository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN min(n.{property_name}) as minimum"
 
             result = await self.graph.query(cypher, {})
@@ -368,7 +368,7 @@ class AsyncRepository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN max(n.{property_name}) as maximum"
 
             result = await self.graph.query(cypher, {})
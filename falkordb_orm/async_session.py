@@ -1,15 +1,121 @@
 """Async session management for transactional operations."""
 
-from typing import Any, Dict, Optional, Set, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+import asyncio
 import copy
+import time
 
 from .exceptions import EntityNotFoundException, QueryException
 from .async_mapper import AsyncEntityMapper
 from .query_builder import QueryBuilder
-from .metadata import get_entity_metadata
+from .metadata import EntityMetadata, get_entity_metadata
+from .pool import GraphPool
 
 T = TypeVar("T")
 
+# Sentinel distinguishing "not in identity map" from a cached value
+_MISSING = object()
+
+# Values of these types cannot change in place, so snapshots store them as-is
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, complex, type(None))
+
+
+class _FrozenList(tuple):
+    """Snapshot of a list property; never equal to a tuple with the same items."""
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _FrozenList and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+
+class _FrozenDict(tuple):
+    """Snapshot of a dict property, stored as (key, value) pairs in any order."""
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _FrozenDict and dict(self) == dict(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(frozenset(key for key, _ in self))
+
+
+class _FrozenSet(frozenset):
+    """Snapshot of a set property; never equal to a frozenset with the same items."""
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _FrozenSet and frozenset.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = frozenset.__hash__
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Build a comparable snapshot of a property value without deep copying it.
+
+    Args:
+        value: Property value
+
+    Returns:
+        The value itself for immutable scalars, a frozen container otherwise
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, set):
+        return _FrozenSet(value)
+    # Arbitrary objects: fall back to a private copy, or the reference if not copyable
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
+
+
+def _thaw(snapshot: Any) -> Any:
+    """
+    Rebuild a property value from its snapshot.
+
+    Args:
+        snapshot: Value produced by _freeze
+
+    Returns:
+        A fresh value equal to the one that was frozen
+    """
+    if isinstance(snapshot, _FrozenList):
+        return [_thaw(item) for item in snapshot]
+    if isinstance(snapshot, _FrozenDict):
+        return {key: _thaw(item) for key, item in snapshot}
+    if isinstance(snapshot, _FrozenSet):
+        return set(snapshot)
+    if isinstance(snapshot, tuple):
+        return tuple(_thaw(item) for item in snapshot)
+    return snapshot
+
 
 class AsyncSession:
     """
@@ -36,27 +142,62 @@ class AsyncSession:
         ...     await session.commit()
     """
 
-    def __init__(self, graph: Any):
+    def __init__(
+        self,
+        graph: Any = None,
+        max_concurrency: Optional[int] = None,
+        *,
+        pool: Optional[GraphPool] = None,
+        graph_name: Optional[str] = None,
+        absent_ttl: float = 0.0,
+    ):
         """
         Initialize async session.
 
         Args:
             graph: FalkorDB async graph instance
-        """
+            max_concurrency: Maximum number of queries a flush phase runs at once
+                (None means unbounded)
+            pool: Connection pool to take the graph from when no graph is given
+            graph_name: Name of the graph to select from the pool
+            absent_ttl: Seconds a get() miss is remembered before the ID is
+                queried again; 0 (the default) never remembers misses
+        """
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        if absent_ttl < 0:
+            raise ValueError("absent_ttl must be >= 0")
+
+        if graph is None:
+            if pool is None or graph_name is None:
+                raise ValueError("Either graph or both pool and graph_name must be given")
+            graph = pool.select_graph(graph_name)
+
         self.graph = graph
+        self.pool = pool
         self.query_builder = QueryBuilder()
         self.mapper = AsyncEntityMapper(graph=graph, query_builder=self.query_builder)
+        self.max_concurrency = max_concurrency
+        self.absent_ttl = absent_ttl
 
         # Identity map: (Type, id) -> entity instance
         self._identity_map: Dict[Tuple[Type, Any], Any] = {}
 
+        # (Type, id) keys that get() found missing -> monotonic time the miss expires
+        self._absent: Dict[Tuple[Type, Any], float] = {}
+
         # Track entity states
-        self._new: Set[Any] = set()  # Entities to INSERT
-        self._dirty: Set[Any] = set()  # Entities to UPDATE
-        self._deleted: Set[Any] = set()  # Entities to DELETE
+        # Keyed by id(entity) so tracking never calls user-defined __hash__/__eq__;
+        # holding the entity as the value keeps its id from being reused
+        self._new: Dict[int, Any] = {}  # Entities to INSERT
+        self._dirty: Dict[int, Any] = {}  # Entities to UPDATE
+        self._deleted: Dict[int, Any] = {}  # Entities to DELETE
+
+        # Track original state for dirty checking: one frozen value per property
+        self._original_state: Dict[int, Tuple[Any, ...]] = {}
 
-        # Track original state for dirty checking
-        self._original_state: Dict[int, Dict[str, Any]] = {}
+        # Per-type cache for metadata used by change tracking
+        self._metadata_cache: Dict[Type, Optional[EntityMetadata]] = {}
 
         # Transaction state
         self._in_transaction = False
@@ -98,13 +239,12 @@ class AsyncSession:
         if self._closed:
             raise RuntimeError("Session is closed")
 
-        # Check if already tracked
-        id(entity)
-        if entity in self._deleted:
-            self._deleted.remove(entity)
-            self._dirty.add(entity)
-        elif entity not in self._dirty and entity not in self._new:
-            self._new.add(entity)
+        # Check if already tracked; pop() both tests and removes in one lookup
+        entity_key = id(entity)
+        if self._deleted.pop(entity_key, None) is not None:
+            self._dirty[entity_key] = entity
+        elif entity_key not in self._dirty and entity_key not in self._new:
+            self._new[entity_key] = entity
             # Capture original state
             self._capture_state(entity)
 
@@ -124,33 +264,36 @@ class AsyncSession:
             raise RuntimeError("Session is closed")
 
         # Remove from new/dirty if present
-        if entity in self._new:
-            self._new.discard(entity)
-        else:
-            self._dirty.discard(entity)
-            self._deleted.add(entity)
+        entity_key = id(entity)
+        if self._new.pop(entity_key, None) is None:
+            self._dirty.pop(entity_key, None)
+            self._deleted[entity_key] = entity
 
         # Remove from identity map
-        metadata = get_entity_metadata(type(entity))
+        metadata = self._get_metadata(type(entity))
         if metadata and metadata.id_property:
             entity_id = getattr(entity, metadata.id_property.python_name, None)
             if entity_id is not None:
                 key = (type(entity), entity_id)
                 self._identity_map.pop(key, None)
 
-    async def get(self, entity_class: Type[T], entity_id: Any) -> Optional[T]:
+    async def get(
+        self, entity_class: Type[T], entity_id: Any, prefetch: Sequence[str] = ()
+    ) -> Optional[T]:
         """
         Get entity by ID, using identity map if available.
 
         Args:
             entity_class: Entity class type
             entity_id: ID value
+            prefetch: Relationship names to load in the same query as the entity,
+                when it is not already in the identity map
 
         Returns:
             Entity instance if found, None otherwise
 
         Example:
-            >>> person = await session.get(Person, 1)
+            >>> person = await session.get(Person, 1, prefetch=("friends",))
             >>> # Subsequent calls return same instance
             >>> same_person = await session.get(Person, 1)
             >>> assert person is same_person
@@ -158,24 +301,45 @@ class AsyncSession:
         if self._closed:
             raise RuntimeError("Session is closed")
 
-        # Check identity map first
+        # Check identity map first (single lookup), then known-absent IDs
         key = (entity_class, entity_id)
-        if key in self._identity_map:
-            return self._identity_map[key]
+        entity = self._identity_map.get(key, _MISSING)
+        if entity is not _MISSING:
+            return entity
+        expires = self._absent.get(key)
+        if expires is not None:
+            if time.monotonic() < expires:
+                return None
+            del self._absent[key]
 
         # Load from database
         metadata = self.mapper.get_entity_metadata(entity_class)
-        cypher, params = self.query_builder.build_match_by_id_query(metadata, entity_id)
+        if prefetch:
+            cypher, params = self.query_builder.build_eager_loading_query(
+                metadata, entity_id, list(prefetch)
+            )
+        else:
+            cypher, params = self.query_builder.build_match_by_id_query(metadata, entity_id)
 
         try:
             result = await self.graph.query(cypher, params)
 
             if not result.result_set:
+                # Remember the miss; only a plain lookup is trusted to mean "absent"
+                if not prefetch and self.absent_ttl:
+                    self._absent[key] = time.monotonic() + self.absent_ttl
                 return None
 
             # Map entity
             record = result.result_set[0]
-            entity = self.mapper.map_from_record(record, entity_class, header=result.header)
+            if prefetch:
+                entity = await self.mapper.map_with_relationships(
+                    record, entity_class, list(prefetch), header=result.header
+                )
+            else:
+                entity = await self.mapper.map_from_record(
+                    record, entity_class, header=result.header
+                )
 
             # Add to identity map
             self._identity_map[key] = entity
@@ -197,6 +361,9 @@ class AsyncSession:
         2. UPDATEs for dirty entities
         3. DELETEs for deleted entities
 
+        Phases run in order; the queries within a phase run concurrently,
+        bounded by ``max_concurrency``.
+
         Example:
             >>> session.add(person1)
             >>> await session.flush()  # Execute INSERT
@@ -208,26 +375,65 @@ class AsyncSession:
 
         try:
             # Process new entities (INSERTs)
-            for entity in list(self._new):
-                await self._insert_entity(entity)
+            await self._run_phase(self._insert_entities, self._group_by_type(self._new.values()))
             self._new.clear()
 
             # Process dirty entities (UPDATEs)
-            for entity in list(self._dirty):
-                if self._is_entity_modified(entity):
-                    await self._update_entity(entity)
-                    # Update original state
-                    self._capture_state(entity)
+            modified = [
+                entity for entity in self._dirty.values() if self._is_entity_modified(entity)
+            ]
+            await self._run_phase(self._update_entities, self._group_by_type(modified))
+            for entity in modified:
+                # Update original state
+                self._capture_state(entity)
             self._dirty.clear()
 
             # Process deleted entities (DELETEs)
-            for entity in list(self._deleted):
-                await self._delete_entity(entity)
+            await self._run_phase(
+                self._delete_entities, self._group_by_type(self._deleted.values())
+            )
             self._deleted.clear()
 
         except Exception as e:
             raise QueryException(f"Failed to flush session: {e}") from e
 
+    def _group_by_type(self, entities: Iterable[Any]) -> List[List[Any]]:
+        """
+        Group entities by their class, preserving order within each group.
+
+        Args:
+            entities: Entities to group
+
+        Returns:
+            One list of entities per entity class
+        """
+        groups: Dict[Type, List[Any]] = {}
+        for entity in entities:
+            groups.setdefault(type(entity), []).append(entity)
+        return list(groups.values())
+
+    async def _run_phase(
+        self, operation: Callable[[List[Any]], Awaitable[None]], batches: Iterable[List[Any]]
+    ) -> None:
+        """
+        Run one flush operation for many entity batches concurrently.
+
+        Args:
+            operation: Coroutine function to apply to each batch
+            batches: Batches of same-type entities to process
+        """
+        if self.max_concurrency is None:
+            await asyncio.gather(*(operation(batch) for batch in batches))
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(batch: List[Any]) -> None:
+            async with semaphore:
+                await operation(batch)
+
+        await asyncio.gather(*(bounded(batch) for batch in batches))
+
     async def commit(self) -> None:
         """
         Flush changes and commit transaction.
@@ -271,6 +477,9 @@ class AsyncSession:
         """
         Close session and release resources.
 
+        A pool passed to the session stays open so later sessions can reuse its
+        connections.
+
         Example:
             >>> session = AsyncSession(graph)
             >>> try:
@@ -281,6 +490,7 @@ class AsyncSession:
         """
         if not self._closed:
             self._identity_map.clear()
+            self._absent.clear()
             self._new.clear()
             self._dirty.clear()
             self._deleted.clear()
@@ -288,6 +498,35 @@ class AsyncSession:
             self._closed = True
             self._in_transaction = False
 
+    def _get_metadata(self, entity_class: Type) -> Optional[EntityMetadata]:
+        """
+        Get entity metadata for a class, caching the lookup per session.
+
+        Args:
+            entity_class: Entity class
+
+        Returns:
+            EntityMetadata if the class is decorated with @node, None otherwise
+        """
+        try:
+            return self._metadata_cache[entity_class]
+        except KeyError:
+            metadata = self._metadata_cache[entity_class] = get_entity_metadata(entity_class)
+            return metadata
+
+    def _snapshot(self, entity: Any, property_names: Tuple[str, ...]) -> Tuple[Any, ...]:
+        """
+        Build a frozen snapshot of an entity's property values.
+
+        Args:
+            entity: Entity to snapshot
+            property_names: Names of the entity's properties
+
+        Returns:
+            Tuple of frozen values, in property order
+        """
+        return tuple(_freeze(getattr(entity, name, None)) for name in property_names)
+
     def _capture_state(self, entity: Any) -> None:
         """
         Capture current state of entity for change tracking.
@@ -295,22 +534,10 @@ class AsyncSession:
         Args:
             entity: Entity to capture state for
         """
-        entity_id = id(entity)
-        metadata = get_entity_metadata(type(entity))
-
-        if metadata:
-            state = {}
-            for prop in metadata.properties:
-                value = getattr(entity, prop.python_name, None)
-                # Deep copy to detect changes
-                if value is not None:
-                    try:
-                        state[prop.python_name] = copy.deepcopy(value)
-                    except Exception:
-                        # If can't deep copy, store reference
-                        state[prop.python_name] = value
-
-            self._original_state[entity_id] = state
+        metadata = self._get_metadata(type(entity))
+
+        if metadata is not None:
+            self._original_state[id(entity)] = self._snapshot(entity, metadata.property_names)
 
     def _restore_state(self, entity: Any) -> None:
         """
@@ -320,10 +547,11 @@ class AsyncSession:
             entity: Entity to restore
         """
         entity_id = id(entity)
-        if entity_id in self._original_state:
+        metadata = self._get_metadata(type(entity))
+        if entity_id in self._original_state and metadata is not None:
             state = self._original_state[entity_id]
-            for prop_name, value in state.items():
-                setattr(entity, prop_name, value)
+            for prop_name, value in zip(metadata.property_names, state):
+                setattr(entity, prop_name, _thaw(value))
 
     def _is_entity_modified(self, entity: Any) -> bool:
         """
@@ -339,66 +567,69 @@ class AsyncSession:
         if entity_id not in self._original_state:
             return True  # Assume modified if no original state
 
-        original = self._original_state[entity_id]
-        metadata = get_entity_metadata(type(entity))
-
-        if metadata:
-            for prop in metadata.properties:
-                current_value = getattr(entity, prop.python_name, None)
-                original_value = original.get(prop.python_name)
+        metadata = self._get_metadata(type(entity))
+        if metadata is None:
+            return False
 
-                if current_value != original_value:
-                    return True
+        return self._snapshot(entity, metadata.property_names) != self._original_state[entity_id]
 
-        return False
-
-    async def _insert_entity(self, entity: Any) -> None:
+    async def _insert_entities(self, entities: List[Any]) -> None:
         """
-        Insert new entity into database.
+        Insert new entities of one type into database with a single query.
 
         Args:
-            entity: Entity to insert
+            entities: Entities to insert
         """
-        cypher, params = self.mapper.map_to_cypher_create(entity)
+        cypher, params = self.mapper.map_to_cypher_create_batch(entities)
         result = await self.graph.query(cypher, params)
 
-        # Update entity ID
-        if result.result_set:
-            node_id = result.result_set[0][1]  # node_id column
-            metadata = get_entity_metadata(type(entity))
-            if metadata and metadata.id_property:
-                self.mapper.update_entity_id(entity, node_id)
+        entity_class = type(entities[0])
+        metadata = self._get_metadata(entity_class)
+        if not metadata or not metadata.id_property:
+            return
+
+        # Rows come back in input order: set entity IDs and fill the identity map
+        # in one pass, without going through the mapper per entity
+        id_attr = metadata.id_property.python_name
+        identity_map = self._identity_map
+        absent = self._absent
+        for entity, record in zip(entities, result.result_set):
+            node_id = record[0]  # node_id column
+            setattr(entity, id_attr, node_id)
 
-                # Add to identity map
-                key = (type(entity), node_id)
-                self._identity_map[key] = entity
+            key = (entity_class, node_id)
+            identity_map[key] = entity
+            absent.pop(key, None)
 
-    async def _update_entity(self, entity: Any) -> None:
+    async def _update_entities(self, entities: List[Any]) -> None:
         """
-        Update existing entity in database.
+        Update existing entities of one type in database with a single query.
 
         Args:
-            entity: Entity to update
+            entities: Entities to update
         """
-        cypher, params = self.mapper.map_to_cypher_merge(entity)
+        cypher, params = self.mapper.map_to_cypher_merge_batch(entities)
         await self.graph.query(cypher, params)
 
-    async def _delete_entity(self, entity: Any) -> None:
+    async def _delete_entities(self, entities: List[Any]) -> None:
         """
-        Delete entity from database.
+        Delete entities of one type from database with a single query.
 
         Args:
-            entity: Entity to delete
+            entities: Entities to delete
         """
-        metadata = get_entity_metadata(type(entity))
+        metadata = self._get_metadata(type(entities[0]))
         if not metadata or not metadata.id_property:
             raise EntityNotFoundException("Entity has no ID property")
 
-        entity_id = getattr(entity, metadata.id_property.python_name, None)
-        if entity_id is None:
-            raise EntityNotFoundException("Entity has no ID value")
+        entity_ids = []
+        for entity in entities:
+            entity_id = getattr(entity, metadata.id_property.python_name, None)
+            if entity_id is None:
+                raise EntityNotFoundException("Entity has no ID value")
+            entity_ids.append(entity_id)
 
-        cypher, params = self.query_builder.build_delete_by_id_query(metadata, entity_id)
+        cypher, params = self.query_builder.build_delete_by_ids_query(metadata, entity_ids)
         await self.graph.query(cypher, params)
 
     @property
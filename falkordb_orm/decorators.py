@@ -1,11 +1,17 @@
 """Decorators for entity mapping."""
 
-import inspect
+import types
 from typing import (
+    Annotated,
     Any,
     Callable,
+    Dict,
+    ForwardRef,
     List,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -19,8 +25,166 @@ from .metadata import EntityMetadata, PropertyMetadata, RelationshipMetadata
 
 T = TypeVar("T")
 
+_NONE_TYPE = type(None)
+_VALID_DIRECTIONS = frozenset({"OUTGOING", "INCOMING", "BOTH"})
+_LIST_ORIGINS = frozenset({list, List})
 
-class PropertyDescriptor:
+
+def _describe_target(target_type: Any) -> Tuple[Optional[Type], Optional[str]]:
+    """
+    Get the class and class name a relationship type argument refers to.
+
+    Args:
+        target_type: Type argument of List[...] or Optional[...]
+
+    Returns:
+        Tuple of (target_class, target_class_name); the class is None for
+        string and forward references
+    """
+    target_kind = type(target_type)
+    if target_kind is str:
+        return None, target_type
+    if target_kind is ForwardRef:
+        return None, target_type.__forward_arg__
+    name = getattr(target_type, "__name__", None)
+    if name is not None:
+        return target_type, name
+    return None, str(target_type)
+
+
+def _resolve_target(python_type: Any) -> Tuple[Optional[Type], Optional[str], bool]:
+    """
+    Resolve the target of a relationship from its type hint.
+
+    The result is stored on the relationship's metadata, so each hint is
+    resolved once per decorated class.
+
+    Args:
+        python_type: Type hint of the relationship attribute
+
+    Returns:
+        Tuple of (target_class, target_class_name, is_collection); class and name
+        are None when the hint is not List[T] or Optional[T]
+    """
+    origin = get_origin(python_type)
+    if origin in _LIST_ORIGINS:
+        args = get_args(python_type)
+        if args:
+            return (*_describe_target(args[0]), True)
+        return None, None, True
+
+    if origin is Union:
+        # Optional[T] is Union[T, None]; take the non-None type
+        target_type = next((arg for arg in get_args(python_type) if arg is not _NONE_TYPE), None)
+        if target_type:
+            return (*_describe_target(target_type), False)
+
+    return None, None, False
+
+
+def _collect_annotations(cls: Type) -> Dict[str, Any]:
+    """
+    Merge the raw annotations of a class and its bases, as get_type_hints would.
+
+    Args:
+        cls: Class to read
+
+    Returns:
+        Annotations by attribute name; subclasses override their bases
+    """
+    annotations: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        annotations.update(klass.__dict__.get("__annotations__", {}))
+    return annotations
+
+
+def _needs_evaluation(hint: Any) -> bool:
+    """
+    Check whether get_type_hints would return something other than the raw hint.
+
+    That is the case for string and ForwardRef parts, which it evaluates, and for
+    None and Annotated[...], which it normalizes.
+
+    Args:
+        hint: Annotation value
+
+    Returns:
+        True if the hint has to go through get_type_hints
+    """
+    if hint is None or isinstance(hint, (str, ForwardRef)):
+        return True
+    if get_origin(hint) is Annotated:
+        return True
+    return any(_needs_evaluation(arg) for arg in get_args(hint))
+
+
+def _class_attributes(cls: Type) -> Dict[str, Any]:
+    """
+    Collect the raw attributes of a class and its bases.
+
+    Reads the class __dict__ of each class in the MRO, so no descriptor
+    __get__ runs; the nearest definition of a name wins.
+
+    Args:
+        cls: Class to scan
+
+    Returns:
+        Attribute values by name
+    """
+    found: Dict[str, Any] = {}
+    for klass in cls.__mro__:
+        for attr_name, attr_value in klass.__dict__.items():
+            if attr_name not in found:
+                found[attr_name] = attr_value
+    return found
+
+
+def _iter_descriptors(class_attrs: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """
+    Select the mapping descriptors from a class's attributes.
+
+    Args:
+        class_attrs: Raw class attributes from _class_attributes
+
+    Returns:
+        (name, descriptor) pairs sorted by name
+    """
+    return sorted(
+        (name, value) for name, value in class_attrs.items() if isinstance(value, FieldDescriptor)
+    )
+
+
+def _is_method(attr_value: Any) -> bool:
+    """
+    Check whether a raw class attribute is a method rather than a field default.
+
+    Args:
+        attr_value: Value from the class __dict__
+
+    Returns:
+        True for functions, static/class methods and other callables
+    """
+    return isinstance(attr_value, (staticmethod, classmethod)) or callable(attr_value)
+
+
+class FieldDescriptor:
+    """Base descriptor for mapped entity fields."""
+
+    _python_name: Optional[str] = None
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        """Called when the descriptor is assigned to a class attribute."""
+        self._python_name = name
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        # Values live in the instance __dict__ under the attribute's own name, which
+        # shadows this non-data descriptor; it is only reached while the value is unset
+        if instance is None:
+            return self
+        return None
+
+
+class PropertyDescriptor(FieldDescriptor):
     """Descriptor for property mapping."""
 
     def __init__(
@@ -40,44 +204,16 @@ class PropertyDescriptor:
         self.indexed = indexed
         self.unique = unique
         self.index_type = index_type
-        self._python_name: Optional[str] = None
-        self._attr_name = f"_property_{id(self)}"
 
-    def __set_name__(self, owner: Type, name: str) -> None:
-        """Called when the descriptor is assigned to a class attribute."""
-        self._python_name = name
 
-    def __get__(self, instance: Any, owner: Type) -> Any:
-        if instance is None:
-            return self
-        return getattr(instance, self._attr_name, None)
-
-    def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, self._attr_name, value)
-
-
-class GeneratedIDDescriptor:
+class GeneratedIDDescriptor(FieldDescriptor):
     """Descriptor for generated ID fields."""
 
     def __init__(self, generator: Optional[Callable] = None):
         self.generator = generator
-        self._python_name: Optional[str] = None
-        self._attr_name = f"_id_{id(self)}"
 
-    def __set_name__(self, owner: Type, name: str) -> None:
-        """Called when the descriptor is assigned to a class attribute."""
-        self._python_name = name
 
-    def __get__(self, instance: Any, owner: Type) -> Any:
-        if instance is None:
-            return self
-        return getattr(instance, self._attr_name, None)
-
-    def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, self._attr_name, value)
-
-
-class RelationshipDescriptor:
+class RelationshipDescriptor(FieldDescriptor):
     """Descriptor for relationship mapping."""
 
     def __init__(
@@ -87,31 +223,19 @@ class RelationshipDescriptor:
         target: Optional[Union[Type, str]] = None,
         lazy: bool = True,
         cascade: bool = False,
+        only: Optional[Sequence[str]] = None,
     ):
         self.relationship_type = relationship_type
         self.direction = direction.upper()
         self.target = target
         self.lazy = lazy
         self.cascade = cascade
-        self._python_name: Optional[str] = None
-        self._attr_name = f"_relationship_{id(self)}"
+        self.only = tuple(only) if only is not None else None
 
         # Validate direction
-        if self.direction not in ("OUTGOING", "INCOMING", "BOTH"):
+        if self.direction not in _VALID_DIRECTIONS:
             raise ValueError(f"Invalid direction: {direction}. Must be OUTGOING, INCOMING, or BOTH")
 
-    def __set_name__(self, owner: Type, name: str) -> None:
-        """Called when the descriptor is assigned to a class attribute."""
-        self._python_name = name
-
-    def __get__(self, instance: Any, owner: Type) -> Any:
-        if instance is None:
-            return self
-        return getattr(instance, self._attr_name, None)
-
-    def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, self._attr_name, value)
-
 
 def property(
     name: Optional[str] = None,
@@ -297,6 +421,7 @@ def relationship(
     target: Optional[Union[Type, str]] = None,
     lazy: bool = True,
     cascade: bool = False,
+    only: Optional[Sequence[str]] = None,
 ) -> Any:
     """
     Define a relationship to another entity.
@@ -307,6 +432,8 @@ def relationship(
         target: Target entity class or class name string for forward references
         lazy: Whether to use lazy loading (default: True)
         cascade: Whether to cascade save/delete operations (default: False)
+        only: Target property names that async lazy collections fetch; the other
+            properties are left as None on loaded entities (default: all)
 
     Returns:
         Relationship descriptor
@@ -325,6 +452,7 @@ def relationship(
         target=target,
         lazy=lazy,
         cascade=cascade,
+        only=only,
     )
 
 
@@ -372,16 +500,21 @@ def node(
         properties: List[PropertyMetadata] = []
         relationships: List[RelationshipMetadata] = []
         id_property: Optional[PropertyMetadata] = None
+        # Python names already mapped as properties or relationships
+        mapped_names: Set[str] = set()
 
         # Get type hints for the class
-        try:
-            type_hints = get_type_hints(cls)
-        except Exception:
-            # If get_type_hints fails (e.g., forward references), use __annotations__
-            type_hints = getattr(cls, "__annotations__", {})
+        type_hints = _collect_annotations(cls)
+        if any(_needs_evaluation(hint) for hint in type_hints.values()):
+            try:
+                type_hints = get_type_hints(cls)
+            except Exception:
+                # If get_type_hints fails (e.g., forward references), use __annotations__
+                type_hints = getattr(cls, "__annotations__", {})
 
         # Scan class attributes
-        for attr_name, attr_value in inspect.getmembers(cls):
+        class_attrs = _class_attributes(cls)
+        for attr_name, attr_value in _iter_descriptors(class_attrs):
             if attr_name.startswith("_"):
                 continue
 
@@ -390,47 +523,7 @@ def node(
                 # Get type hint to determine target class and if it's a collection
                 python_type = type_hints.get(attr_name, Any)
 
-                # Determine if it's a collection (List) or single (Optional)
-                is_collection = False
-                target_class = None
-                target_class_name = None
-
-                # Check if type is List[T] or Optional[T]
-                origin = get_origin(python_type)
-                if origin is list or (hasattr(origin, "__name__") and origin.__name__ == "list"):
-                    is_collection = True
-                    args = get_args(python_type)
-                    if args:
-                        target_type = args[0]
-                        if isinstance(target_type, str):
-                            target_class_name = target_type
-                        else:
-                            # Handle ForwardRef objects
-                            if hasattr(target_type, "__forward_arg__"):
-                                target_class_name = target_type.__forward_arg__
-                            elif hasattr(target_type, "__name__"):
-                                target_class = target_type
-                                target_class_name = target_type.__name__
-                            else:
-                                target_class_name = str(target_type)
-                elif origin is Union:
-                    # Optional[T] is Union[T, None]
-                    args = get_args(python_type)
-                    if args:
-                        # Get the non-None type
-                        target_type = next((arg for arg in args if arg is not type(None)), None)
-                        if target_type:
-                            if isinstance(target_type, str):
-                                target_class_name = target_type
-                            else:
-                                # Handle ForwardRef objects
-                                if hasattr(target_type, "__forward_arg__"):
-                                    target_class_name = target_type.__forward_arg__
-                                elif hasattr(target_type, "__name__"):
-                                    target_class = target_type
-                                    target_class_name = target_type.__name__
-                                else:
-                                    target_class_name = str(target_type)
+                target_class, target_class_name, is_collection = _resolve_target(python_type)
 
                 # If target not determined from type hint, use descriptor's target
                 if target_class is None and target_class_name is None:
@@ -454,8 +547,10 @@ def node(
                     is_collection=is_collection,
                     lazy=attr_value.lazy,
                     cascade=attr_value.cascade,
+                    only=attr_value.only,
                 )
                 relationships.append(rel_meta)
+                mapped_names.add(rel_meta.python_name)
 
             # Check if it's a PropertyDescriptor
             elif isinstance(attr_value, PropertyDescriptor):
@@ -475,6 +570,7 @@ def node(
                     index_type=attr_value.index_type,
                 )
                 properties.append(prop_meta)
+                mapped_names.add(prop_meta.python_name)
 
             # Check if it's a GeneratedIDDescriptor
             elif isinstance(attr_value, GeneratedIDDescriptor):
@@ -489,6 +585,7 @@ def node(
                     id_generator=attr_value.generator,
                 )
                 properties.append(prop_meta)
+                mapped_names.add(prop_meta.python_name)
                 id_property = prop_meta
 
         # If no explicit ID descriptor, look for 'id' field in type hints
@@ -497,6 +594,7 @@ def node(
                 python_name="id", graph_name="id", python_type=type_hints["id"], is_id=True
             )
             properties.append(prop_meta)
+            mapped_names.add(prop_meta.python_name)
             id_property = prop_meta
 
         # Add remaining type-hinted attributes as properties (skip relationships)
@@ -505,13 +603,11 @@ def node(
                 continue
 
             # Skip if already processed as property or relationship
-            if any(p.python_name == attr_name for p in properties):
-                continue
-            if any(r.python_name == attr_name for r in relationships):
+            if attr_name in mapped_names:
                 continue
 
             # Skip if it's a method or special attribute
-            if hasattr(cls, attr_name) and callable(getattr(cls, attr_name)):
+            if attr_name in class_attrs and _is_method(class_attrs[attr_name]):
                 continue
 
             prop_meta = PropertyMetadata(
@@ -525,6 +621,11 @@ def node(
             if attr_name == "id" and id_property is None:
                 id_property = prop_meta
 
+        # Slotted classes relying on the generated __init__ can be populated directly
+        # by the mappers; a zero __dictoffset__ means no base class provides __dict__
+        generates_init = "__init__" not in cls.__dict__
+        uses_slots = generates_init and hasattr(cls, "__slots__") and cls.__dictoffset__ == 0
+
         # Create and attach metadata
         metadata = EntityMetadata(
             entity_class=cls,
@@ -533,6 +634,7 @@ def node(
             properties=properties,
             id_property=id_property,
             relationships=relationships,
+            uses_slots=uses_slots,
         )
 
         setattr(cls, "__node_metadata__", metadata)
@@ -543,11 +645,11 @@ def node(
         register_entity(cls.__name__, cls)
 
         # Generate __init__ if not already defined by user
-        if "__init__" not in cls.__dict__:
+        if generates_init:
             # Collect all field names from properties and relationships
-            all_fields = [p.python_name for p in properties] + [
-                r.python_name for r in relationships
-            ]
+            all_fields = frozenset(
+                [p.python_name for p in properties] + [r.python_name for r in relationships]
+            )
 
             def __init__(self, **kwargs):
                 # Set all provided values
@@ -565,11 +667,10 @@ def node(
                         # Check if class has a default value
                         if hasattr(cls, prop.python_name):
                             default_val = getattr(cls, prop.python_name)
-                            # Don't set descriptor objects as values
-                            if not isinstance(
-                                default_val,
-                                (PropertyDescriptor, GeneratedIDDescriptor, RelationshipDescriptor),
-                            ):
+                            # Don't set descriptor objects (or unset slots) as values
+                            if isinstance(default_val, types.MemberDescriptorType):
+                                setattr(self, prop.python_name, None)
+                            elif not isinstance(default_val, FieldDescriptor):
                                 setattr(self, prop.python_name, default_val)
                         else:
                             setattr(self, prop.python_name, None)
@@ -579,10 +680,7 @@ def node(
                         # Set default for relationships
                         if hasattr(cls, rel.python_name):
                             default_val = getattr(cls, rel.python_name)
-                            if not isinstance(
-                                default_val,
-                                (PropertyDescriptor, GeneratedIDDescriptor, RelationshipDescriptor),
-                            ):
+                            if not isinstance(default_val, FieldDescriptor):
                                 setattr(self, rel.python_name, default_val)
                         else:
                             # Default to None for Optional, empty list for List
@@ -3,6 +3,12 @@
 from typing import Optional, Any
 
 
+def _present(**details: Any) -> Optional[dict[str, Any]]:
+    """Keep only the details that were given, or None if there are none."""
+    present = {k: v for k, v in details.items() if v is not None}
+    return present or None
+
+
 class FalkorDBORMException(Exception):
     """Base exception for all falkordb-orm exceptions.
 
@@ -14,7 +20,14 @@ class FalkorDBORMException(Exception):
     def __init__(self, message: str, details: Optional[dict[str, Any]] = None):
         self.message = message
         self.details = details or {}
-        super().__init__(self._format_message())
+        # Details are only formatted when the exception is actually displayed
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self._format_message()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._format_message()!r})"
 
     def _format_message(self) -> str:
         """Format the error message with details."""
@@ -41,9 +54,7 @@ class EntityNotFoundException(FalkorDBORMException):
         entity_id: Optional[Any] = None,
         **kwargs: Any,
     ):
-        details = {"entity_type": entity_type, "entity_id": entity_id, **kwargs}
-        details = {k: v for k, v in details.items() if v is not None}
-        super().__init__(message, details)
+        super().__init__(message, _present(entity_type=entity_type, entity_id=entity_id, **kwargs))
 
 
 class InvalidEntityException(FalkorDBORMException):
@@ -89,9 +100,7 @@ class QueryException(FalkorDBORMException):
         params: Optional[dict[str, Any]] = None,
         **kwargs: Any,
     ):
-        details = {"query": query, "params": params, **kwargs}
-        details = {k: v for k, v in details.items() if v is not None}
-        super().__init__(message, details)
+        super().__init__(message, _present(query=query, params=params, **kwargs))
 
 
 class MetadataException(FalkorDBORMException):
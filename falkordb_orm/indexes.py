@@ -1,12 +1,131 @@
 """Index management for FalkorDB entities."""
 
-from typing import Any, List, Optional, Type
+import re
+from functools import lru_cache
+from typing import Any, List, Optional, Set, Tuple, Type
 from dataclasses import dataclass
 
-from .metadata import get_entity_metadata
+from .metadata import EntityMetadata, get_entity_metadata
 from .exceptions import QueryException
 
 
+# Labels and property names are interpolated into DDL, so only plain identifiers are allowed
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+def _check_identifiers(label: str, property_name: str) -> None:
+    """
+    Reject labels and property names that are not plain identifiers.
+
+    Args:
+        label: Node label
+        property_name: Property name
+
+    Raises:
+        ValueError: If either name could alter the generated query
+    """
+    for kind, name in (("label", label), ("property name", property_name)):
+        if not isinstance(name, str) or not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid {kind} for index: {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _index_query(label: str, property_name: str, index_type: Optional[str]) -> str:
+    """
+    Build Cypher query to create an index.
+
+    The text only depends on the arguments, so each query is built and its
+    names validated once.
+
+    Args:
+        label: Node label
+        property_name: Property name
+        index_type: Type of index (RANGE, FULLTEXT, VECTOR, or None for default)
+
+    Returns:
+        Cypher CREATE INDEX query
+
+    Raises:
+        ValueError: If the label or property name is not a plain identifier
+    """
+    _check_identifiers(label, property_name)
+    if index_type and index_type.upper() == "FULLTEXT":
+        # Full-text index
+        return f"CALL db.idx.fulltext.createNodeIndex('{label}', '{property_name}')"
+    elif index_type and index_type.upper() == "VECTOR":
+        # Vector index (requires dimension specification, using default 1536 for now)
+        return f"CALL db.idx.vector.createNodeIndex('{label}', '{property_name}')"
+    else:
+        # Default RANGE index
+        return f"CREATE INDEX FOR (n:{label}) ON (n.{property_name})"
+
+
+@lru_cache(maxsize=None)
+def _unique_constraint_query(label: str, property_name: str) -> str:
+    """
+    Build Cypher query to create a unique constraint.
+
+    Args:
+        label: Node label
+        property_name: Property name
+
+    Returns:
+        Cypher CREATE CONSTRAINT query
+
+    Raises:
+        ValueError: If the label or property name is not a plain identifier
+    """
+    _check_identifiers(label, property_name)
+    # FalkorDB unique constraint syntax
+    return f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.{property_name} IS UNIQUE"
+
+
+@lru_cache(maxsize=None)
+def _drop_index_query(label: str, property_name: str) -> str:
+    """
+    Build Cypher query to drop an index.
+
+    Args:
+        label: Node label
+        property_name: Property name
+
+    Returns:
+        Cypher DROP INDEX query
+
+    Raises:
+        ValueError: If the label or property name is not a plain identifier
+    """
+    _check_identifiers(label, property_name)
+    return f"DROP INDEX ON :{label}({property_name})"
+
+
+# Index listing for a single label, filtered by the server
+_LABEL_INDEXES_QUERY = (
+    "CALL db.indexes() YIELD label, properties, types "
+    "WHERE label = $label RETURN label, properties, types"
+)
+
+# Constraint listing; unique constraints are not reported by db.indexes()
+_CONSTRAINTS_QUERY = (
+    "CALL db.constraints() YIELD type, label, properties RETURN type, label, properties"
+)
+
+
+def _index_type_name(types: Any) -> str:
+    """
+    Get a display name for the index types reported for one property.
+
+    Args:
+        types: Type value from db.indexes(): a string, a list of strings or None
+
+    Returns:
+        Comma-separated type names, RANGE when none are reported
+    """
+    if isinstance(types, (list, tuple)):
+        return ",".join(str(t) for t in types) or "RANGE"
+    return str(types) if types else "RANGE"
+
+
 @dataclass
 class IndexInfo:
     """Information about a database index."""
@@ -77,33 +196,34 @@ class IndexManager:
         if not metadata:
             raise ValueError(f"{entity_class.__name__} is not a decorated entity")
 
-        queries = []
-        label = metadata.primary_label
+        return self._create(self._entity_index_queries(metadata), if_not_exists)
 
-        for prop in metadata.properties:
-            if prop.unique:
-                # Create unique constraint (also creates an index)
-                query = self._build_unique_constraint_query(label, prop.graph_name)
-                queries.append(query)
+    def _create(self, index_queries: List[Tuple[str, str, bool]], if_not_exists: bool) -> List[str]:
+        """
+        Run index and constraint creation queries.
 
-                try:
-                    self.graph.query(query)
-                except Exception as e:
-                    if not if_not_exists:
-                        raise QueryException(f"Failed to create unique constraint: {e}") from e
-                    # Ignore if constraint already exists
+        Args:
+            index_queries: (graph_name, query, is_unique) tuples to run
+            if_not_exists: Whether to ignore failures for existing indexes
 
-            elif prop.indexed:
-                # Create regular index
-                query = self._build_index_query(label, prop.graph_name, prop.index_type)
-                queries.append(query)
+        Returns:
+            List of Cypher queries executed
 
-                try:
-                    self.graph.query(query)
-                except Exception as e:
-                    if not if_not_exists:
-                        raise QueryException(f"Failed to create index: {e}") from e
-                    # Ignore if index already exists
+        Raises:
+            QueryException: If a query fails and if_not_exists is False
+        """
+        queries = []
+
+        for _, query, is_unique in index_queries:
+            queries.append(query)
+
+            try:
+                self.graph.query(query)
+            except Exception as e:
+                if not if_not_exists:
+                    kind = "unique constraint" if is_unique else "index"
+                    raise QueryException(f"Failed to create {kind}: {e}") from e
+                # Ignore if index or constraint already exists
 
         return queries
 
@@ -134,7 +254,7 @@ class IndexManager:
         for prop in metadata.properties:
             if prop.indexed or prop.unique:
                 # Drop index
-                query = f"DROP INDEX ON :{label}({prop.graph_name})"
+                query = _drop_index_query(label, prop.graph_name)
                 queries.append(query)
 
                 try:
@@ -149,7 +269,9 @@ class IndexManager:
         """
         Ensure indexes exist, creating them if missing.
 
-        This is a safe operation that won't fail if indexes already exist.
+        This is a safe operation that won't fail if indexes already exist. Existing
+        indexes are read with a single db.indexes() call and only the missing ones
+        are created, so no query is sent per property once everything exists.
 
         Args:
             entity_class: Entity class with metadata
@@ -160,7 +282,54 @@ class IndexManager:
         Example:
             >>> manager.ensure_indexes(Person)
         """
-        return self.create_indexes(entity_class, if_not_exists=True)
+        metadata = get_entity_metadata(entity_class)
+        if not metadata:
+            raise ValueError(f"{entity_class.__name__} is not a decorated entity")
+
+        index_queries = self._entity_index_queries(metadata)
+        if not index_queries:
+            return []
+
+        indexes = self.list_indexes(entity_class)
+        indexed = {idx.property_name for idx in indexes}
+        constrained = {idx.property_name for idx in indexes if idx.is_unique}
+
+        # Unique constraints are listed by db.constraints(); read it only when needed
+        if any(
+            is_unique and graph_name not in constrained
+            for graph_name, _, is_unique in index_queries
+        ):
+            constrained |= self._unique_properties(metadata.primary_label)
+
+        missing = [
+            (graph_name, query, is_unique)
+            for graph_name, query, is_unique in index_queries
+            if graph_name not in (constrained if is_unique else indexed)
+        ]
+        return self._create(missing, if_not_exists=True)
+
+    def _unique_properties(self, label: str) -> Set[str]:
+        """
+        Get the properties of a label that have a unique constraint.
+
+        Args:
+            label: Node label
+
+        Returns:
+            Property names with a unique constraint; empty if constraints cannot be
+            listed, in which case creation is left to if_not_exists
+        """
+        try:
+            result = self.graph.query(_CONSTRAINTS_QUERY)
+        except Exception:
+            return set()
+
+        properties: Set[str] = set()
+        for record in result.result_set:
+            if len(record) >= 3 and str(record[0]).upper() == "UNIQUE" and record[1] == label:
+                props = record[2] if isinstance(record[2], (list, tuple)) else [record[2]]
+                properties.update(str(prop) for prop in props)
+        return properties
 
     def list_indexes(self, entity_class: Optional[Type] = None) -> List[IndexInfo]:
         """
@@ -179,9 +348,6 @@ class IndexManager:
         """
         # Get indexes using CALL db.indexes()
         try:
-            result = self.graph.query("CALL db.indexes()")
-
-            indexes = []
             label_filter = None
 
             if entity_class:
@@ -189,31 +355,36 @@ class IndexManager:
                 if metadata:
                     label_filter = metadata.primary_label
 
+            result = self._query_indexes(label_filter)
+            indexes = []
+
             # Parse index results
-            # FalkorDB returns: label, property, type
+            # FalkorDB returns: label, properties (a list), types (per property)
             for record in result.result_set:
                 # Extract index information
                 # Format varies by FalkorDB version, handle both
                 if len(record) >= 3:
                     label = str(record[0])
-                    prop_name = str(record[1])
-                    idx_type = str(record[2]) if record[2] else "RANGE"
-
-                    # Check if this is a unique constraint
-                    is_unique = "UNIQUE" in idx_type.upper() if idx_type else False
 
-                    # Filter by label if specified
+                    # Filter by label if specified (needed when the server did not filter)
                     if label_filter and label != label_filter:
                         continue
 
-                    indexes.append(
-                        IndexInfo(
-                            label=label,
-                            property_name=prop_name,
-                            index_type=idx_type,
-                            is_unique=is_unique,
+                    props = record[1] if isinstance(record[1], (list, tuple)) else [record[1]]
+                    types = record[2]
+                    for prop in props:
+                        prop_types = types.get(prop) if isinstance(types, dict) else types
+                        idx_type = _index_type_name(prop_types)
+
+                        indexes.append(
+                            IndexInfo(
+                                label=label,
+                                property_name=str(prop),
+                                index_type=idx_type,
+                                # Check if this is a unique constraint
+                                is_unique="UNIQUE" in idx_type.upper(),
+                            )
                         )
-                    )
 
             return indexes
 
@@ -221,6 +392,25 @@ class IndexManager:
             # If db.indexes() not available, return empty list
             return []
 
+    def _query_indexes(self, label: Optional[str]) -> Any:
+        """
+        Run db.indexes(), filtered by label on the server when one is given.
+
+        Args:
+            label: Optional node label to filter by
+
+        Returns:
+            Query result with label, property and type columns first
+        """
+        if label:
+            try:
+                return self.graph.query(_LABEL_INDEXES_QUERY, {"label": label})
+            except Exception:
+                # Older servers may not accept YIELD ... WHERE on procedures
+                pass
+
+        return self.graph.query("CALL db.indexes()")
+
     def _build_index_query(self, label: str, property_name: str, index_type: Optional[str]) -> str:
         """
         Build Cypher query to create an index.
@@ -233,15 +423,7 @@ class IndexManager:
         Returns:
             Cypher CREATE INDEX query
         """
-        if index_type and index_type.upper() == "FULLTEXT":
-            # Full-text index
-            return f"CALL db.idx.fulltext.createNodeIndex('{label}', '{property_name}')"
-        elif index_type and index_type.upper() == "VECTOR":
-            # Vector index (requires dimension specification, using default 1536 for now)
-            return f"CALL db.idx.vector.createNodeIndex('{label}', '{property_name}')"
-        else:
-            # Default RANGE index
-            return f"CREATE INDEX FOR (n:{label}) ON (n.{property_name})"
+        return _index_query(label, property_name, index_type)
 
     def _build_unique_constraint_query(self, label: str, property_name: str) -> str:
         """
@@ -254,8 +436,30 @@ class IndexManager:
         Returns:
             Cypher CREATE CONSTRAINT query
         """
-        # FalkorDB unique constraint syntax
-        return f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.{property_name} IS UNIQUE"
+        return _unique_constraint_query(label, property_name)
+
+    def _entity_index_queries(self, metadata: EntityMetadata) -> List[Tuple[str, str, bool]]:
+        """
+        Build the index and constraint queries for an entity.
+
+        Args:
+            metadata: Entity metadata
+
+        Returns:
+            List of (graph_name, query, is_unique) tuples in property order
+        """
+        label = metadata.primary_label
+        queries = []
+
+        for prop in metadata.properties:
+            name = prop.graph_name
+            if prop.unique:
+                # Unique constraint (also creates an index)
+                queries.append((name, _unique_constraint_query(label, name), True))
+            elif prop.indexed:
+                queries.append((name, _index_query(label, name, prop.index_type), False))
+
+        return queries
 
     def create_index_for_property(
         self,
@@ -276,6 +480,10 @@ class IndexManager:
         Returns:
             Cypher query executed
 
+        Raises:
+            ValueError: If the label or property name is not a plain identifier
+            QueryException: If index creation fails
+
         Example:
             >>> manager.create_index_for_property("Person", "email", unique=True)
         """
@@ -301,10 +509,13 @@ class IndexManager:
         Returns:
             Cypher query executed
 
+        Raises:
+            ValueError: If the label or property name is not a plain identifier
+
         Example:
             >>> manager.drop_index_for_property("Person", "email")
         """
-        query = f"DROP INDEX ON :{label}({property_name})"
+        query = _drop_index_query(label, property_name)
 
         try:
             self.graph.query(query)
@@ -1,19 +1,39 @@
 """Entity mapper for converting between Python objects and graph structures."""
 
-from typing import Any, Dict, List, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from .exceptions import InvalidEntityException, MappingException
-from .metadata import EntityMetadata, get_entity_metadata
+from .metadata import EntityMetadata, PropertyMetadata, get_entity_metadata
+from .registry import get_entity_class
+from .relationships import create_lazy_proxy
 from .types import get_type_registry
 
 T = TypeVar("T")
 
+# A property with its resolved to-graph and from-graph conversion functions
+PropertyCodec = Tuple[PropertyMetadata, Callable[[Any], Any], Callable[[Any], Any]]
+
+
+def _none_safe(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a registry converter so None passes through, as convert_from_graph does."""
+
+    def wrapper(value: Any) -> Any:
+        return None if value is None else convert(value)
+
+    return wrapper
+
 
 class EntityMapper:
     """Handles bidirectional conversion between Python objects and FalkorDB graph structures."""
 
     def __init__(self, graph: Any = None, query_builder: Any = None) -> None:
         self._metadata_cache: Dict[Type, EntityMetadata] = {}
+        # Per-class codecs, tagged with the type registry version they were built for
+        self._codec_cache: Dict[Type, Tuple[int, List[PropertyCodec]]] = {}
+        # Rendered CREATE/MERGE statements keyed by (kind, labels, SET clauses)
+        self._statement_cache: Dict[Tuple[str, str, Tuple[str, ...]], str] = {}
+        # Last result header seen and its column name -> index map
+        self._last_header: Tuple[Any, Dict[str, int]] = (None, {})
         self._type_registry = get_type_registry()
         self._graph = graph
         self._query_builder = query_builder
@@ -54,40 +74,59 @@ class EntityMapper:
         """
         return metadata.is_relationship_field(field_name)
 
-    def map_to_properties(self, entity: Any) -> Dict[str, Any]:
+    def get_property_codecs(self, metadata: EntityMetadata) -> List[PropertyCodec]:
         """
-        Extract properties from entity for graph storage.
+        Get the properties of an entity class with their conversion functions.
+
+        Converters are looked up once per class rather than once per value, and
+        looked up again after a converter is registered.
 
         Args:
-            entity: Python entity instance
+            metadata: Entity metadata
 
         Returns:
-            Dictionary of property names to values (graph format)
+            List of (property, to_graph, from_graph) tuples; relationship fields
+            are left out
         """
-        metadata = self.get_entity_metadata(type(entity))
-        properties: Dict[str, Any] = {}
+        version = self._type_registry.version
+        cached = self._codec_cache.get(metadata.entity_class)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
+        codecs: List[PropertyCodec] = []
         for prop in metadata.properties:
             # Skip relationship fields - they're not regular properties
             if self._is_relationship_field(prop.python_name, metadata):
                 continue
 
-            # Skip ID property if it's auto-generated and None
-            if prop.is_id and prop.id_generator is not None:
-                value = getattr(entity, prop.python_name, None)
-                if value is None:
-                    continue
+            if prop.converter:
+                # Custom converters see every value, including None
+                codecs.append((prop, prop.converter.to_graph, prop.converter.from_graph))
+            else:
+                converter = self._type_registry.get_converter(prop.python_type)
+                codecs.append((prop, converter.to_graph, _none_safe(converter.from_graph)))
 
-            value = getattr(entity, prop.python_name, None)
+        self._codec_cache[metadata.entity_class] = (version, codecs)
+        return codecs
 
-            if value is not None:
-                # Use custom converter if provided
-                if prop.converter:
-                    graph_value = prop.converter.to_graph(value)
-                else:
-                    graph_value = self._type_registry.convert_to_graph(value, prop.python_type)
+    def map_to_properties(self, entity: Any) -> Dict[str, Any]:
+        """
+        Extract properties from entity for graph storage.
+
+        Args:
+            entity: Python entity instance
 
-                properties[prop.graph_name] = graph_value
+        Returns:
+            Dictionary of property names to values (graph format)
+        """
+        metadata = self.get_entity_metadata(type(entity))
+        properties: Dict[str, Any] = {}
+
+        for prop, to_graph, _ in self.get_property_codecs(metadata):
+            # None values are never stored, which also skips unsaved generated IDs
+            value = getattr(entity, prop.python_name, None)
+            if value is not None:
+                properties[prop.graph_name] = to_graph(value)
 
         return properties
 
@@ -104,32 +143,33 @@ class EntityMapper:
         metadata = self.get_entity_metadata(type(entity))
         properties = self.map_to_properties(entity)
 
-        # Build labels string
-        labels_str = ":".join(metadata.labels)
-
         # Handle interned properties by wrapping with intern() function
         set_clauses = []
         params: Dict[str, Any] = {}
 
-        for prop in metadata.properties:
-            if prop.python_name in properties or prop.graph_name in properties:
-                value = properties.get(prop.graph_name, properties.get(prop.python_name))
-                param_name = f"prop_{prop.graph_name}"
-
-                if prop.interned and isinstance(value, str):
-                    # Use intern() function for interned string properties
-                    set_clauses.append(f"n.{prop.graph_name} = intern(${param_name})")
-                else:
-                    set_clauses.append(f"n.{prop.graph_name} = ${param_name}")
-
-                params[param_name] = value
+        # map_to_properties keys values by graph name, in declaration order
+        for graph_name, value in properties.items():
+            prop = metadata.get_property_by_graph_name(graph_name)
 
-        # Generate Cypher
-        if set_clauses:
-            set_statement = ", ".join(set_clauses)
-            cypher = f"CREATE (n:{labels_str}) SET {set_statement} RETURN n, id(n) as node_id"
-        else:
-            cypher = f"CREATE (n:{labels_str}) RETURN n, id(n) as node_id"
+            if prop.interned and isinstance(value, str):
+                # Use intern() function for interned string properties
+                set_clauses.append(prop.interned_set_clause)
+            else:
+                set_clauses.append(prop.set_clause)
+
+            params[prop.param_name] = value
+
+        # The statement only depends on which clauses are set; values are parameters
+        labels_str = metadata.labels_str
+        key = ("create", labels_str, tuple(set_clauses))
+        cypher = self._statement_cache.get(key)
+        if cypher is None:
+            if set_clauses:
+                set_statement = ", ".join(set_clauses)
+                cypher = f"CREATE (n:{labels_str}) SET {set_statement} RETURN n, id(n) as node_id"
+            else:
+                cypher = f"CREATE (n:{labels_str}) RETURN n, id(n) as node_id"
+            self._statement_cache[key] = cypher
 
         return cypher, params
 
@@ -157,45 +197,152 @@ class EntityMapper:
 
         properties = self.map_to_properties(entity)
 
-        # Build labels string
-        labels_str = ":".join(metadata.labels)
-
         # Handle interned properties by wrapping with intern() function
         set_clauses = []
         params: Dict[str, Any] = {"id": entity_id}
 
-        for prop in metadata.properties:
+        # map_to_properties keys values by graph name, in declaration order
+        for graph_name, value in properties.items():
+            prop = metadata.get_property_by_graph_name(graph_name)
             if prop.is_id:
                 continue  # Skip ID property as it's in the MERGE clause
 
-            if prop.python_name in properties or prop.graph_name in properties:
-                value = properties.get(prop.graph_name, properties.get(prop.python_name))
-                param_name = f"prop_{prop.graph_name}"
-
-                if prop.interned and isinstance(value, str):
-                    # Use intern() function for interned string properties
-                    set_clauses.append(f"n.{prop.graph_name} = intern(${param_name})")
-                else:
-                    set_clauses.append(f"n.{prop.graph_name} = ${param_name}")
-
-                params[param_name] = value
-
-        # Generate Cypher
-        if set_clauses:
-            set_statement = ", ".join(set_clauses)
-            cypher = f"""
-            MERGE (n:{labels_str} {{id: $id}})
-            SET {set_statement}
-            RETURN n, id(n) as node_id
-            """
-        else:
-            cypher = f"""
-            MERGE (n:{labels_str} {{id: $id}})
-            RETURN n, id(n) as node_id
-            """
+            if prop.interned and isinstance(value, str):
+                # Use intern() function for interned string properties
+                set_clauses.append(prop.interned_set_clause)
+            else:
+                set_clauses.append(prop.set_clause)
+
+            params[prop.param_name] = value
+
+        # The statement only depends on which clauses are set; values are parameters
+        labels_str = metadata.labels_str
+        key = ("merge", labels_str, tuple(set_clauses))
+        cypher = self._statement_cache.get(key)
+        if cypher is None:
+            if set_clauses:
+                set_statement = ", ".join(set_clauses)
+                cypher = (
+                    f"MERGE (n:{labels_str} {{id: $id}}) "
+                    f"SET {set_statement} "
+                    "RETURN n, id(n) as node_id"
+                )
+            else:
+                cypher = f"MERGE (n:{labels_str} {{id: $id}}) RETURN n, id(n) as node_id"
+            self._statement_cache[key] = cypher
 
         return cypher, params
 
+    def _map_to_batch_row(self, entity: Any, interned_names: List[str]) -> Dict[str, Any]:
+        """
+        Build the UNWIND row for one entity of a batched write.
+
+        Interned string values go into a separate map so the query can wrap them
+        with intern(); everything else is applied with a single map update.
+
+        Args:
+            entity: Python entity instance
+            interned_names: Graph names of interned properties
+
+        Returns:
+            Row dictionary with 'props' and 'interned' maps
+        """
+        props = self.map_to_properties(entity)
+        interned: Dict[str, Any] = {}
+
+        for graph_name in interned_names:
+            if isinstance(props.get(graph_name), str):
+                interned[graph_name] = props.pop(graph_name)
+
+        return {"props": props, "interned": interned}
+
+    def _batch_set_clause(self, interned_names: List[str]) -> str:
+        """
+        Build the SET clause applying an UNWIND row to node 'n'.
+
+        Args:
+            interned_names: Graph names of interned properties
+
+        Returns:
+            SET clause string
+        """
+        set_clauses = ["n += row.props"]
+        for graph_name in interned_names:
+            # Leave the property untouched when this row has no interned value for it
+            set_clauses.append(
+                f"n.{graph_name} = CASE WHEN row.interned.{graph_name} IS NULL "
+                f"THEN n.{graph_name} ELSE intern(row.interned.{graph_name}) END"
+            )
+        return "SET " + ", ".join(set_clauses)
+
+    def map_to_cypher_create_batch(self, entities: List[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate one Cypher CREATE statement for several entities of the same type.
+
+        The query returns one 'node_id' row per entity, in input order.
+
+        Args:
+            entities: Non-empty list of entity instances of a single type
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        metadata = self.get_entity_metadata(type(entities[0]))
+        labels_str = metadata.labels_str
+        interned_names = [prop.graph_name for prop in metadata.properties if prop.interned]
+
+        rows = [self._map_to_batch_row(entity, interned_names) for entity in entities]
+        set_statement = self._batch_set_clause(interned_names)
+
+        cypher = (
+            f"UNWIND $rows AS row CREATE (n:{labels_str}) {set_statement} "
+            f"RETURN id(n) as node_id"
+        )
+
+        return cypher, {"rows": rows}
+
+    def map_to_cypher_merge_batch(self, entities: List[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Generate one Cypher MERGE statement for several entities of the same type.
+
+        Args:
+            entities: Non-empty list of entity instances of a single type
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+
+        Raises:
+            MappingException: If the entity type or an entity has no ID
+        """
+        metadata = self.get_entity_metadata(type(entities[0]))
+
+        if metadata.id_property is None:
+            raise MappingException(f"Entity {metadata.entity_class.__name__} has no ID property")
+
+        labels_str = metadata.labels_str
+        id_name = metadata.id_property.python_name
+        id_graph_name = metadata.id_property.graph_name
+        interned_names = [
+            prop.graph_name for prop in metadata.properties if prop.interned and not prop.is_id
+        ]
+
+        rows = []
+        for entity in entities:
+            entity_id = getattr(entity, id_name, None)
+            if entity_id is None:
+                raise MappingException(f"Entity {metadata.entity_class.__name__} has no ID value")
+
+            row = self._map_to_batch_row(entity, interned_names)
+            # ID is matched by the MERGE pattern, not SET
+            row["props"].pop(id_graph_name, None)
+            row["id"] = entity_id
+            rows.append(row)
+
+        set_statement = self._batch_set_clause(interned_names)
+        cypher = f"UNWIND $rows AS row MERGE (n:{labels_str} {{id: row.id}}) {set_statement}"
+
+        return cypher, {"rows": rows}
+
     def _initialize_lazy_relationships(self, entity: T, entity_id: int) -> None:
         """
         Initialize lazy relationship proxies on an entity.
@@ -210,17 +357,12 @@ class EntityMapper:
 
         metadata = self.get_entity_metadata(type(entity))
 
-        # Import here to avoid circular dependency
-        from .relationships import create_lazy_proxy
-
         for rel_meta in metadata.relationships:
             # Determine target class
             target_class = rel_meta.target_class
 
             # If target_class is not resolved, try to resolve it from the registry
             if target_class is None and rel_meta.target_class_name:
-                from .registry import get_entity_class
-
                 target_class = get_entity_class(rel_meta.target_class_name)
                 if target_class is None:
                     # Still not resolved - skip this relationship
@@ -262,20 +404,10 @@ class EntityMapper:
         # Map properties
         node_properties = node.properties if hasattr(node, "properties") else {}
 
-        for prop in metadata.properties:
+        for prop, _, from_graph in self.get_property_codecs(metadata):
             # Check if property exists in node
             if prop.graph_name in node_properties:
-                graph_value = node_properties[prop.graph_name]
-
-                # Use custom converter if provided
-                if prop.converter:
-                    python_value = prop.converter.from_graph(graph_value)
-                else:
-                    python_value = self._type_registry.convert_from_graph(
-                        graph_value, prop.python_type
-                    )
-
-                kwargs[prop.python_name] = python_value
+                kwargs[prop.python_name] = from_graph(node_properties[prop.graph_name])
             elif prop.is_id and internal_id is not None and hasattr(prop, "id_generator"):
                 # Use internal ID for auto-generated ID fields (fields created with generated_id())
                 kwargs[prop.python_name] = internal_id
@@ -287,8 +419,8 @@ class EntityMapper:
         try:
             entity = entity_class(**kwargs)
 
-            # Initialize lazy relationships if we have an ID
-            if internal_id is not None:
+            # Initialize lazy relationships if we have an ID and there are any
+            if internal_id is not None and metadata.relationships:
                 self._initialize_lazy_relationships(entity, internal_id)
 
             return entity
@@ -316,14 +448,7 @@ class EntityMapper:
         if isinstance(record, list):
             # FalkorDB returns list format - need to find column index
             if header is not None:
-                # Header format: [[column_id, column_name], ...]
-                column_index = None
-                for idx, header_item in enumerate(header):
-                    # header_item is [column_id, column_name]
-                    col_name = header_item[1] if isinstance(header_item, list) else header_item
-                    if col_name == var_name:
-                        column_index = idx
-                        break
+                column_index = self.column_index(header, var_name)
 
                 if column_index is not None:
                     node = record[column_index]
@@ -339,6 +464,43 @@ class EntityMapper:
 
         return self.map_from_node(node, entity_class)
 
+    def column_index(self, header: Any, var_name: str) -> Optional[int]:
+        """
+        Find the column holding a query variable.
+
+        All rows of a result share one header, so its column map is built once
+        and reused while the same header keeps being passed in.
+
+        Args:
+            header: Header from query result, as [[column_id, column_name], ...]
+            var_name: Variable name in query
+
+        Returns:
+            Index of the first column named var_name, or None if there is none
+        """
+        return self._header_columns(header).get(var_name)
+
+    def _header_columns(self, header: Any) -> Dict[str, int]:
+        """
+        Get the column name -> index map of a result header.
+
+        Args:
+            header: Header from query result, as [[column_id, column_name], ...]
+
+        Returns:
+            Index of the first column with each name
+        """
+        cached_header, columns = self._last_header
+        if cached_header is not header:
+            columns = {}
+            for idx, header_item in enumerate(header):
+                # header_item is [column_id, column_name]
+                col_name = header_item[1] if isinstance(header_item, list) else header_item
+                columns.setdefault(col_name, idx)
+            self._last_header = (header, columns)
+
+        return columns
+
     def update_entity_id(self, entity: Any, node_id: int) -> None:
         """
         Update entity's ID after creation.
@@ -374,19 +536,14 @@ class EntityMapper:
             Entity instance with relationships populated
         """
         # Map main entity - handle both list and dict format
-        if isinstance(record, list) and header is not None:
-            # Find column index for var_name
-            column_index = 0
-            for idx, header_item in enumerate(header):
-                col_name = header_item[1] if isinstance(header_item, list) else header_item
-                if col_name == var_name:
-                    column_index = idx
-                    break
-            node = record[column_index]
-        elif isinstance(record, list):
-            node = record[0]  # Fallback to first column
+        if isinstance(record, list):
+            # Related node columns are looked up by name, through the header when given
+            columns = self._header_columns(header) if header is not None else {}
+            node = record[columns.get(var_name, 0)]  # Fallback to first column
+            related = {hint: record[columns[hint]] for hint in fetch_hints if hint in columns}
         else:
             node = record[var_name]  # Dictionary format
+            related = record
 
         entity = self.map_from_node(node, entity_class)
 
@@ -395,7 +552,7 @@ class EntityMapper:
 
         # Map each eagerly loaded relationship
         for hint in fetch_hints:
-            if hint not in record:
+            if hint not in related:
                 continue
 
             # Get relationship metadata
@@ -404,27 +561,31 @@ class EntityMapper:
                 continue
 
             # Get related nodes from record
-            related_nodes = record[hint]
+            related_nodes = related[hint]
 
             # Handle None or empty list
             if related_nodes is None:
                 related_nodes = []
+            elif not isinstance(related_nodes, list):
+                # A single node column rather than a collect() list
+                related_nodes = [related_nodes]
 
-            # Filter out None values (from OPTIONAL MATCH)
-            related_nodes = [n for n in related_nodes if n is not None]
+            target_class = rel_meta.target_class
+            if not target_class:
+                continue
 
-            # Map nodes to entities
-            if rel_meta.target_class:
-                related_entities = [
-                    self.map_from_node(node, rel_meta.target_class) for node in related_nodes
+            # Map nodes to entities, skipping None values (from OPTIONAL MATCH)
+            if rel_meta.is_collection:
+                value = [
+                    self.map_from_node(node, target_class)
+                    for node in related_nodes
+                    if node is not None
                 ]
+            else:
+                # For single relationships, map only the first node or None
+                first = next((node for node in related_nodes if node is not None), None)
+                value = None if first is None else self.map_from_node(first, target_class)
 
-                # Set on entity based on relationship type
-                if rel_meta.is_collection:
-                    setattr(entity, rel_meta.python_name, related_entities)
-                else:
-                    # For single relationships, take first or None
-                    value = related_entities[0] if related_entities else None
-                    setattr(entity, rel_meta.python_name, value)
+            setattr(entity, rel_meta.python_name, value)
 
         return entity
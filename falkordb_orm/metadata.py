@@ -1,7 +1,8 @@
 """Metadata structures for entity mapping."""
 
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Type, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass  # For forward reference resolution
@@ -44,6 +45,29 @@ class PropertyMetadata:
     index_type: Optional[str] = None
     """Type of index (e.g., 'RANGE', 'FULLTEXT', 'VECTOR'). None means default RANGE index."""
 
+    param_name: str = field(init=False, repr=False, compare=False)
+    """Query parameter name used when writing this property (computed)."""
+
+    set_clause: str = field(init=False, repr=False, compare=False)
+    """SET clause assigning the parameter to node 'n' (computed)."""
+
+    interned_set_clause: str = field(init=False, repr=False, compare=False)
+    """SET clause assigning the interned parameter to node 'n' (computed)."""
+
+    def __post_init__(self) -> None:
+        """Precompute the query parameter name and SET clauses."""
+        self.param_name = f"prop_{self.graph_name}"
+        self.set_clause = f"n.{self.graph_name} = ${self.param_name}"
+        self.interned_set_clause = f"n.{self.graph_name} = intern(${self.param_name})"
+
+
+# Edge arrow fragments around the relationship type, by direction
+_DIRECTION_ARROWS: Dict[str, Tuple[str, str]] = {
+    "OUTGOING": ("-", "->"),
+    "INCOMING": ("<-", "-"),
+    "BOTH": ("-", "-"),
+}
+
 
 @dataclass
 class RelationshipMetadata:
@@ -73,6 +97,25 @@ class RelationshipMetadata:
     cascade: bool = False
     """Whether to cascade save/delete operations to related entities."""
 
+    only: Optional[Tuple[str, ...]] = None
+    """Target properties fetched by async lazy collections; None fetches whole nodes."""
+
+    pattern: Optional[str] = field(init=False, repr=False, compare=False)
+    """Edge pattern for the direction, e.g. '-[:KNOWS]->'; None if invalid (computed)."""
+
+    bound_pattern: Optional[str] = field(init=False, repr=False, compare=False)
+    """Edge pattern binding the edge to 'r', e.g. '-[r:KNOWS]->' (computed)."""
+
+    def __post_init__(self) -> None:
+        """Precompute the Cypher edge patterns for the relationship's direction."""
+        arrows = _DIRECTION_ARROWS.get(self.direction)
+        if arrows is None:
+            self.pattern = self.bound_pattern = None
+        else:
+            left, right = arrows
+            self.pattern = f"{left}[:{self.relationship_type}]{right}"
+            self.bound_pattern = f"{left}[r:{self.relationship_type}]{right}"
+
 
 @dataclass
 class EntityMetadata:
@@ -96,30 +139,99 @@ class EntityMetadata:
     relationships: List[RelationshipMetadata] = field(default_factory=list)
     """List of relationship metadata."""
 
+    uses_slots: bool = False
+    """Whether instances are slotted (no __dict__) and built with the generated __init__."""
+
+    labels_str: str = field(init=False, repr=False, compare=False)
+    """Labels joined for use in a Cypher node pattern, e.g. 'Person:Individual' (computed)."""
+
+    property_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    """Python names of all properties, in declaration order (computed)."""
+
+    eager_fragments: Dict[str, Tuple[str, str]] = field(init=False, repr=False, compare=False)
+    """Relationship name -> (edge pattern, target labels) for eager loading (filled on use)."""
+
+    _properties_by_python_name: Mapping[str, PropertyMetadata] = field(
+        init=False, repr=False, compare=False
+    )
+    _properties_by_graph_name: Mapping[str, PropertyMetadata] = field(
+        init=False, repr=False, compare=False
+    )
+    _relationships_by_python_name: Mapping[str, RelationshipMetadata] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute lookup structures derived from the labels, properties and relationships."""
+        self.labels_str = ":".join(self.labels)
+        self.property_names = tuple(prop.python_name for prop in self.properties)
+        self.eager_fragments = {}
+
+        # First definition wins, matching a linear scan of the lists
+        by_python: Dict[str, PropertyMetadata] = {}
+        by_graph: Dict[str, PropertyMetadata] = {}
+        for prop in self.properties:
+            by_python.setdefault(prop.python_name, prop)
+            by_graph.setdefault(prop.graph_name, prop)
+        rels: Dict[str, RelationshipMetadata] = {}
+        for rel in self.relationships:
+            rels.setdefault(rel.python_name, rel)
+
+        self._properties_by_python_name = MappingProxyType(by_python)
+        self._properties_by_graph_name = MappingProxyType(by_graph)
+        self._relationships_by_python_name = MappingProxyType(rels)
+
     def get_property_by_python_name(self, name: str) -> Optional[PropertyMetadata]:
         """Get property metadata by Python attribute name."""
-        for prop in self.properties:
-            if prop.python_name == name:
-                return prop
-        return None
+        return self._properties_by_python_name.get(name)
 
     def get_property_by_graph_name(self, name: str) -> Optional[PropertyMetadata]:
         """Get property metadata by graph property name."""
-        for prop in self.properties:
-            if prop.graph_name == name:
-                return prop
-        return None
+        return self._properties_by_graph_name.get(name)
 
     def get_relationship_by_python_name(self, name: str) -> Optional[RelationshipMetadata]:
         """Get relationship metadata by Python attribute name."""
-        for rel in self.relationships:
-            if rel.python_name == name:
-                return rel
-        return None
+        return self._relationships_by_python_name.get(name)
+
+    def get_eager_fragment(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the edge pattern and target labels used to eagerly load a relationship.
+
+        Targets may be forward references registered after this entity, so a
+        fragment is resolved on first use and cached once the target is known.
+
+        Args:
+            name: Python attribute name of the relationship
+
+        Returns:
+            (edge pattern, target labels) tuple, or None if the relationship
+            does not exist or its target cannot be resolved yet
+        """
+        fragment = self.eager_fragments.get(name)
+        if fragment is not None:
+            return fragment
+
+        rel = self._relationships_by_python_name.get(name)
+        if rel is None or rel.pattern is None:
+            return None
+
+        target_class = rel.target_class
+        if target_class is None and rel.target_class_name:
+            from .registry import get_entity_class
+
+            target_class = get_entity_class(rel.target_class_name)
+
+        target_metadata = get_entity_metadata(target_class) if target_class else None
+        if target_metadata is None:
+            return None
+
+        fragment = (rel.pattern, target_metadata.labels_str)
+        self.eager_fragments[name] = fragment
+        return fragment
 
     def is_relationship_field(self, name: str) -> bool:
         """Check if a field is a relationship."""
-        return any(rel.python_name == name for rel in self.relationships)
+        return name in self._relationships_by_python_name
 
 
 def get_entity_metadata(entity_class: Type) -> Optional[EntityMetadata]:
@@ -1,10 +1,14 @@
 """Pagination support for query results."""
 
-from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# Accepted sort directions
+_SORT_DIRECTIONS = frozenset({"ASC", "DESC"})
+
 
 @dataclass
 class Pageable:
@@ -33,7 +37,7 @@ class Pageable:
             raise ValueError("Page number must be >= 0")
         if self.size <= 0:
             raise ValueError("Page size must be > 0")
-        if self.direction not in ("ASC", "DESC"):
+        if self.direction not in _SORT_DIRECTIONS:
             raise ValueError("Direction must be 'ASC' or 'DESC'")
 
     def skip(self) -> int:
@@ -52,9 +56,7 @@ class Pageable:
         Returns:
             New Pageable instance for next page
         """
-        return Pageable(
-            page=self.page + 1, size=self.size, sort_by=self.sort_by, direction=self.direction
-        )
+        return replace(self, page=self.page + 1)
 
     def previous(self) -> "Pageable":
         """
@@ -68,9 +70,7 @@ class Pageable:
         """
         if self.page == 0:
             raise ValueError("Already on first page")
-        return Pageable(
-            page=self.page - 1, size=self.size, sort_by=self.sort_by, direction=self.direction
-        )
+        return replace(self, page=self.page - 1)
 
     def first(self) -> "Pageable":
         """
@@ -79,7 +79,55 @@ class Pageable:
         Returns:
             New Pageable instance for first page
         """
-        return Pageable(page=0, size=self.size, sort_by=self.sort_by, direction=self.direction)
+        return replace(self, page=0)
+
+
+@dataclass
+class Keyset:
+    """
+    Cursor for keyset (seek) pagination.
+
+    Instead of skipping ``page * size`` rows, each request starts right after
+    the last sort value seen, so deep pages cost the same as the first one.
+    The tradeoff is that pages can only be walked in order; there is no
+    random access to page N. Prefer it over Pageable once callers page
+    further than a handful of pages.
+
+    Attributes:
+        sort_by: Property to order by; its values should be unique
+        last_value: Sort value of the last item seen (None for the first page)
+        direction: Sort direction ('ASC' or 'DESC')
+        size: Number of items per page
+
+    Example:
+        >>> page = repo.find_all_keyset(Keyset(sort_by="email", size=50))
+        >>> while page.has_next():
+        ...     page = repo.find_all_keyset(page.next_keyset())
+    """
+
+    sort_by: str
+    last_value: Any = None
+    direction: str = "ASC"
+    size: int = 50
+
+    def __post_init__(self):
+        """Validate keyset parameters."""
+        if self.size <= 0:
+            raise ValueError("Page size must be > 0")
+        if self.direction not in _SORT_DIRECTIONS:
+            raise ValueError("Direction must be 'ASC' or 'DESC'")
+
+    def after(self, last_value: Any) -> "Keyset":
+        """
+        Get Keyset for the page following the given sort value.
+
+        Args:
+            last_value: Sort value of the last item on the current page
+
+        Returns:
+            New Keyset instance starting after last_value
+        """
+        return replace(self, last_value=last_value)
 
 
 @dataclass
@@ -156,7 +204,7 @@ class Page(Generic[T]):
         Returns:
             True if this is the last page
         """
-        return self.page_number + 1 >= self.total_pages
+        return not self.has_next()
 
     def __len__(self) -> int:
         """
@@ -187,3 +235,211 @@ class Page(Generic[T]):
             f"Page(page={self.page_number + 1}/{self.total_pages}, "
             f"items={len(self.content)}/{self.total_elements})"
         )
+
+
+@dataclass
+class Slice(Generic[T]):
+    """
+    A page of query results without a total count.
+
+    Whether a next page exists is inferred from fetching one row more than the
+    page size, so no count query is needed.
+
+    Type Parameters:
+        T: Entity type
+
+    Attributes:
+        content: List of entities on this page
+        page_number: Current page number (0-indexed)
+        page_size: Number of items per page
+        has_more: Whether more items follow this page
+
+    Example:
+        >>> page = repo.find_all_slice(Pageable(page=0, size=10))
+        >>> if page.has_next():
+        ...     page = repo.find_all_slice(Pageable(page=1, size=10))
+    """
+
+    content: List[T]
+    page_number: int
+    page_size: int
+    has_more: bool
+
+    def has_next(self) -> bool:
+        """
+        Check if there is a next page.
+
+        Returns:
+            True if there are more items after this page
+        """
+        return self.has_more
+
+    def has_previous(self) -> bool:
+        """
+        Check if there is a previous page.
+
+        Returns:
+            True if there are pages before this one
+        """
+        return self.page_number > 0
+
+    def is_first(self) -> bool:
+        """
+        Check if this is the first page.
+
+        Returns:
+            True if this is page 0
+        """
+        return self.page_number == 0
+
+    def is_last(self) -> bool:
+        """
+        Check if this is the last page.
+
+        Returns:
+            True if no items follow this page
+        """
+        return not self.has_more
+
+    def __len__(self) -> int:
+        """
+        Get number of items on this page.
+
+        Returns:
+            Number of items in content
+        """
+        return len(self.content)
+
+    def __iter__(self):
+        """
+        Iterate over items on this page.
+
+        Yields:
+            Each item in content
+        """
+        return iter(self.content)
+
+    def __repr__(self) -> str:
+        """
+        String representation of slice.
+
+        Returns:
+            Human-readable slice description
+        """
+        return (
+            f"Slice(page={self.page_number + 1}, items={len(self.content)}, "
+            f"has_more={self.has_more})"
+        )
+
+
+class CountCache:
+    """
+    Short-lived cache for pagination count queries.
+
+    Counts are keyed on the count query and its parameters, so each label set
+    and filter is cached separately. Entries expire after ``ttl`` seconds;
+    writes made in the meantime are not reflected until then.
+
+    Example:
+        >>> repo = Repository(graph, Person, count_cache=CountCache(ttl=30.0))
+        >>> page = repo.find_all_paginated(Pageable(page=0, size=10))
+    """
+
+    def __init__(self, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached count stays valid
+            clock: Monotonic time source
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+    def get_or_load(self, cypher: str, params: Dict[str, Any], load: Callable[[], int]) -> int:
+        """
+        Get a cached count, running the count query when missing or expired.
+
+        Args:
+            cypher: Count query
+            params: Count query parameters
+            load: Function that runs the count query
+
+        Returns:
+            Number of matching items
+        """
+        key = (cypher, repr(sorted(params.items())))
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        count = load()
+        self._entries[key] = (now + self.ttl, count)
+        return count
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+        self._entries.clear()
+
+
+@dataclass
+class KeysetSlice(Generic[T]):
+    """
+    A page of results fetched with keyset pagination.
+
+    Type Parameters:
+        T: Entity type
+
+    Attributes:
+        content: List of entities on this page
+        keyset: Keyset used to fetch this page
+        has_more: Whether more items follow this page
+        last_value: Sort value of the last item on this page
+    """
+
+    content: List[T]
+    keyset: Keyset
+    has_more: bool
+    last_value: Any = None
+
+    def has_next(self) -> bool:
+        """
+        Check if there is a next page.
+
+        Returns:
+            True if there are more items after this page
+        """
+        return self.has_more
+
+    def next_keyset(self) -> Optional[Keyset]:
+        """
+        Get Keyset for the next page.
+
+        Returns:
+            Keyset starting after this page, or None on the last page
+        """
+        if not self.has_more:
+            return None
+        return self.keyset.after(self.last_value)
+
+    def __len__(self) -> int:
+        """
+        Get number of items on this page.
+
+        Returns:
+            Number of items in content
+        """
+        return len(self.content)
+
+    def __iter__(self):
+        """
+        Iterate over items on this page.
+
+        Yields:
+            Each item in content
+        """
+        return iter(self.content)
@@ -0,0 +1,103 @@
+"""Shared async connection pool for sessions and repositories."""
+
+from typing import Any, Dict, Optional
+
+
+class GraphPool:
+    """
+    Async FalkorDB client backed by a bounded, reusable connection pool.
+
+    Sessions created per request can share one pool instead of opening new
+    connections each time; every query borrows a pooled connection and returns
+    it when done.
+
+    Example:
+        >>> pool = GraphPool(host="localhost", port=6379, max_connections=16)
+        >>> async with AsyncSession(pool=pool, graph_name="social") as session:
+        ...     person = await session.get(Person, 1)
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        max_connections: int = 16,
+        **connection_kwargs: Any,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            host: FalkorDB host
+            port: FalkorDB port
+            max_connections: Maximum number of open connections
+            **connection_kwargs: Extra arguments for the redis connection pool
+                (e.g. password, username, ssl)
+        """
+        if max_connections <= 0:
+            raise ValueError("max_connections must be > 0")
+
+        from falkordb.asyncio import FalkorDB
+        from redis.asyncio import BlockingConnectionPool
+
+        connection_kwargs.setdefault("decode_responses", True)
+        self.max_connections = max_connections
+        self._connection_pool = BlockingConnectionPool(
+            host=host,
+            port=port,
+            max_connections=max_connections,
+            timeout=None,
+            **connection_kwargs,
+        )
+        self._db = FalkorDB(connection_pool=self._connection_pool)
+        self._graphs: Dict[str, Any] = {}
+
+    def select_graph(self, graph_name: str) -> Any:
+        """
+        Get a graph handle that runs its queries on pooled connections.
+
+        Args:
+            graph_name: Name of the graph
+
+        Returns:
+            FalkorDB async graph instance, reused across calls
+        """
+        graph = self._graphs.get(graph_name)
+        if graph is None:
+            graph = self._db.select_graph(graph_name)
+            self._graphs[graph_name] = graph
+        return graph
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        self._graphs.clear()
+        await self._connection_pool.disconnect()
+
+
+# Process-wide pool returned by get_pool()
+_default_pool: Optional[GraphPool] = None
+
+
+def get_pool(**kwargs: Any) -> GraphPool:
+    """
+    Get the process-wide pool, creating it on first use.
+
+    Args:
+        **kwargs: GraphPool arguments, used only when the pool is created
+
+    Returns:
+        Shared GraphPool instance
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = GraphPool(**kwargs)
+    return _default_pool
+
+
+async def close_pool() -> None:
+    """Close the process-wide pool, if one was created."""
+    global _default_pool
+    if _default_pool is not None:
+        pool, _default_pool = _default_pool, None
+        await pool.close()
@@ -1,17 +1,147 @@
 """Query builder for generating Cypher queries."""
 
-from typing import Any, Dict, List, Type, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, TYPE_CHECKING
 
 from .metadata import EntityMetadata, RelationshipMetadata, get_entity_metadata
 from .query_parser import QuerySpec, Condition, OrderClause, Operation, Operator, LogicalOperator
 
 if TYPE_CHECKING:
-    from .pagination import Pageable
+    from .pagination import Keyset, Pageable
+
+
+# Clause template and parameter count per operator; {0} is the property, {1}/{2} the parameters
+_CONDITION_TEMPLATES: Dict[Operator, Tuple[str, int]] = {
+    Operator.EQUALS: ("{0} = ${1}", 1),
+    Operator.NOT_EQUALS: ("{0} <> ${1}", 1),
+    Operator.GREATER_THAN: ("{0} > ${1}", 1),
+    Operator.GREATER_THAN_EQUAL: ("{0} >= ${1}", 1),
+    Operator.LESS_THAN: ("{0} < ${1}", 1),
+    Operator.LESS_THAN_EQUAL: ("{0} <= ${1}", 1),
+    Operator.BETWEEN: ("{0} >= ${1} AND {0} <= ${2}", 2),
+    Operator.IN: ("{0} IN ${1}", 1),
+    Operator.NOT_IN: ("NOT {0} IN ${1}", 1),
+    Operator.IS_NULL: ("{0} IS NULL", 0),
+    Operator.IS_NOT_NULL: ("{0} IS NOT NULL", 0),
+    Operator.CONTAINING: ("{0} CONTAINS ${1}", 1),
+    Operator.STARTING_WITH: ("{0} STARTS WITH ${1}", 1),
+    Operator.ENDING_WITH: ("{0} ENDS WITH ${1}", 1),
+    Operator.LIKE: ("{0} =~ ${1}", 1),
+}
+
+# Clause ending a query that matches one entity by ID, per operation
+_ID_SCOPED_TAILS: Dict[str, str] = {
+    "find": " RETURN n",
+    "delete": " DELETE n",
+    "exists": " RETURN count(n) > 0 as exists",
+}
+
+
+@lru_cache(maxsize=1024)
+def _id_scoped_query(labels_str: str, internal_id: bool, operation: str) -> str:
+    """
+    Build the query text for an operation on one entity matched by ID.
+
+    Args:
+        labels_str: Labels joined for a node pattern
+        internal_id: Match on the internal FalkorDB ID instead of the id property
+        operation: Key into _ID_SCOPED_TAILS
+
+    Returns:
+        Cypher query string
+    """
+    return _id_match(labels_str, internal_id) + _ID_SCOPED_TAILS[operation]
+
+
+def _id_match(labels_str: str, internal_id: bool) -> str:
+    """
+    Build the MATCH clause binding one entity, found by ID, as n.
+
+    Args:
+        labels_str: Labels joined for a node pattern
+        internal_id: Match on the internal FalkorDB ID instead of the id property
+
+    Returns:
+        Cypher MATCH clause
+    """
+    if internal_id:
+        return f"MATCH (n:{labels_str}) WHERE id(n) = $id"
+    return f"MATCH (n:{labels_str} {{id: $id}})"
+
+
+def _uses_internal_id(metadata: EntityMetadata) -> bool:
+    """
+    Check whether an entity is matched by its internal FalkorDB ID.
+
+    Args:
+        metadata: Entity metadata
+
+    Returns:
+        True if lookups by ID should use id(n)
+    """
+    # Use internal FalkorDB ID if field was marked with generated_id()
+    # id_generator being None means use default (FalkorDB internal ID)
+    # If id_property doesn't exist or wasn't created via generated_id(), use property-based ID
+    return bool(metadata.id_property and hasattr(metadata.id_property, "id_generator"))
+
+
+# Clause ending a derived query, per non-FIND operation
+_DERIVED_TAILS: Dict[Operation, str] = {
+    Operation.COUNT: " RETURN count(n) as count",
+    Operation.EXISTS: " RETURN count(n) > 0 as exists",
+    Operation.DELETE: " DELETE n",
+}
+
+# Upper bound on cached derived query templates per builder
+_MAX_DERIVED_TEMPLATES = 1024
+
+
+@lru_cache(maxsize=256)
+def _eager_loading_query(
+    match: str, fragments: Tuple[Tuple[str, str, str], ...], order_by_clause: str = ""
+) -> str:
+    """
+    Build an eager loading query around a root match.
+
+    The text depends only on its arguments, so repeated loads with the same
+    fetch hints reuse the cached string.
+
+    Args:
+        match: Root MATCH (plus WHERE/WITH) binding the entity as n
+        fragments: (hint, edge pattern, target labels) per relationship to fetch
+        order_by_clause: Optional ORDER BY applied after RETURN
+
+    Returns:
+        Cypher query string
+    """
+    cypher_parts = [match]
+
+    # Add OPTIONAL MATCH for each relationship to fetch
+    return_parts = ["n"]
+
+    for hint, rel_pattern, target_labels in fragments:
+        var_name = f"{hint}_target"
+
+        # Add OPTIONAL MATCH
+        cypher_parts.append(f"OPTIONAL MATCH (n){rel_pattern}({var_name}:{target_labels})")
+
+        # Add to RETURN with collection
+        return_parts.append(f"collect(DISTINCT {var_name}) as {hint}")
+
+    # Build final query
+    cypher_parts.append("RETURN " + ", ".join(return_parts))
+    if order_by_clause:
+        cypher_parts.append(order_by_clause)
+    return " ".join(cypher_parts)
 
 
 class QueryBuilder:
     """Generates Cypher queries for common operations."""
 
+    def __init__(self) -> None:
+        # Derived query text and parameter names, keyed by label and query shape
+        self._derived_templates: Dict[Tuple[Any, ...], Tuple[str, Tuple[str, ...]]] = {}
+
     def build_match_by_id_query(
         self, metadata: EntityMetadata, entity_id: Any
     ) -> tuple[str, Dict[str, Any]]:
@@ -25,17 +155,23 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        return self._build_id_scoped(metadata, "find", entity_id)
 
-        # Use internal FalkorDB ID if field was marked with generated_id()
-        # id_generator being None means use default (FalkorDB internal ID)
-        # If id_property doesn't exist or wasn't created via generated_id(), use property-based ID
-        if metadata.id_property and hasattr(metadata.id_property, "id_generator"):
-            # This ID field was created via generated_id() - use internal FalkorDB ID
-            cypher = f"MATCH (n:{labels_str}) WHERE id(n) = $id RETURN n"
-        else:
-            # Use property-based ID
-            cypher = f"MATCH (n:{labels_str} {{id: $id}}) RETURN n"
+    def _build_id_scoped(
+        self, metadata: EntityMetadata, operation: str, entity_id: Any
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build a query that matches one entity by ID and applies an operation to it.
+
+        Args:
+            metadata: Entity metadata
+            operation: Key into _ID_SCOPED_TAILS ('find', 'delete' or 'exists')
+            entity_id: ID value to match
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        cypher = _id_scoped_query(metadata.labels_str, _uses_internal_id(metadata), operation)
 
         params = {"id": entity_id}
         return cypher, params
@@ -50,7 +186,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        labels_str = metadata.labels_str
         cypher = f"MATCH (n:{labels_str}) RETURN n"
         params: Dict[str, Any] = {}
         return cypher, params
@@ -65,7 +201,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        labels_str = metadata.labels_str
         cypher = f"MATCH (n:{labels_str}) RETURN count(n) as count"
         params: Dict[str, Any] = {}
         return cypher, params
@@ -83,17 +219,29 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        return self._build_id_scoped(metadata, "delete", entity_id)
+
+    def build_delete_by_ids_query(
+        self, metadata: EntityMetadata, entity_ids: List[Any]
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build DELETE query to remove several entities by ID in one statement.
+
+        Args:
+            metadata: Entity metadata
+            entity_ids: ID values to match
 
-        # Use internal FalkorDB ID if field was marked with generated_id()
-        if metadata.id_property and hasattr(metadata.id_property, "id_generator"):
-            # This ID field was created via generated_id() - use internal FalkorDB ID
-            cypher = f"MATCH (n:{labels_str}) WHERE id(n) = $id DELETE n"
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        labels_str = metadata.labels_str
+
+        if _uses_internal_id(metadata):
+            cypher = f"UNWIND $ids AS node_id MATCH (n:{labels_str}) WHERE id(n) = node_id DELETE n"
         else:
-            # Use property-based ID
-            cypher = f"MATCH (n:{labels_str} {{id: $id}}) DELETE n"
+            cypher = f"UNWIND $ids AS node_id MATCH (n:{labels_str} {{id: node_id}}) DELETE n"
 
-        params = {"id": entity_id}
+        params = {"ids": entity_ids}
         return cypher, params
 
     def build_delete_all_query(self, metadata: EntityMetadata) -> tuple[str, Dict[str, Any]]:
@@ -106,7 +254,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        labels_str = metadata.labels_str
         cypher = f"MATCH (n:{labels_str}) DELETE n"
         params: Dict[str, Any] = {}
         return cypher, params
@@ -124,18 +272,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
-
-        # Use internal FalkorDB ID if field was marked with generated_id()
-        if metadata.id_property and hasattr(metadata.id_property, "id_generator"):
-            # This ID field was created via generated_id() - use internal FalkorDB ID
-            cypher = f"MATCH (n:{labels_str}) WHERE id(n) = $id RETURN count(n) > 0 as exists"
-        else:
-            # Use property-based ID
-            cypher = f"MATCH (n:{labels_str} {{id: $id}}) RETURN count(n) > 0 as exists"
-
-        params = {"id": entity_id}
-        return cypher, params
+        return self._build_id_scoped(metadata, "exists", entity_id)
 
     def build_derived_query(
         self, metadata: EntityMetadata, spec: QuerySpec, param_values: List[Any]
@@ -150,8 +287,35 @@ class QueryBuilder:
 
         Returns:
             Tuple of (cypher_query, parameters)
-        """
-        labels_str = ":".join(metadata.labels)
+
+        Raises:
+            ValueError: If the query limit is not a non-negative integer
+        """
+        labels_str = metadata.labels_str
+
+        # The limit is bound as $__limit, so every limit value shares one plan
+        limited = spec.limit is not None and spec.operation == Operation.FIND
+        if limited and (
+            not isinstance(spec.limit, int) or isinstance(spec.limit, bool) or spec.limit < 0
+        ):
+            raise ValueError(f"Query limit must be a non-negative integer, got {spec.limit!r}")
+
+        # The query text depends only on the query shape; calls differ in values
+        key = (
+            labels_str,
+            spec.operation,
+            tuple((cond.property_name, cond.operator) for cond in spec.conditions),
+            spec.logical_operator,
+            tuple((order.property_name, order.direction) for order in spec.ordering),
+            limited,
+        )
+        template = self._derived_templates.get(key)
+        if template is not None:
+            cypher, param_names = template
+            params = dict(zip(param_names, param_values))
+            if limited:
+                params["__limit"] = spec.limit
+            return cypher, params
 
         # Build WHERE clause
         where_clause, params = self.build_where_clause(
@@ -161,41 +325,30 @@ class QueryBuilder:
         # Build ORDER BY clause
         order_by_clause = self.build_order_by_clause(spec.ordering)
 
-        # Build LIMIT clause
-        limit_clause = f" LIMIT {spec.limit}" if spec.limit else ""
+        # Build query: shared MATCH/WHERE prefix, then the operation's tail
+        parts = [f"MATCH (n:{labels_str})"]
+        if where_clause:
+            parts.append(f" WHERE {where_clause}")
 
-        # Build query based on operation
         if spec.operation == Operation.FIND:
-            cypher = f"MATCH (n:{labels_str})"
-            if where_clause:
-                cypher += f" WHERE {where_clause}"
-            cypher += " RETURN n"
-            if order_by_clause:
-                cypher += f" {order_by_clause}"
-            cypher += limit_clause
-
-        elif spec.operation == Operation.COUNT:
-            cypher = f"MATCH (n:{labels_str})"
-            if where_clause:
-                cypher += f" WHERE {where_clause}"
-            cypher += " RETURN count(n) as count"
-
-        elif spec.operation == Operation.EXISTS:
-            cypher = f"MATCH (n:{labels_str})"
-            if where_clause:
-                cypher += f" WHERE {where_clause}"
-            cypher += " RETURN count(n) > 0 as exists"
-
-        elif spec.operation == Operation.DELETE:
-            cypher = f"MATCH (n:{labels_str})"
-            if where_clause:
-                cypher += f" WHERE {where_clause}"
-            cypher += " DELETE n"
+            parts.append(self._root_window(order_by_clause, limit="$__limit" if limited else None))
+            parts.append(" RETURN n")
+        else:
+            parts.append(_DERIVED_TAILS[spec.operation])
 
+        cypher = "".join(parts)
+
+        if len(self._derived_templates) < _MAX_DERIVED_TEMPLATES:
+            self._derived_templates[key] = (cypher, tuple(params))
+        if limited:
+            params["__limit"] = spec.limit
         return cypher, params
 
     def build_where_clause(
-        self, conditions: List[Condition], logical_op: LogicalOperator, param_values: List[Any]
+        self,
+        conditions: Sequence[Condition],
+        logical_op: LogicalOperator,
+        param_values: List[Any],
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build WHERE clause from conditions.
@@ -211,126 +364,86 @@ class QueryBuilder:
         if not conditions:
             return "", {}
 
-        clauses = []
-        params = {}
+        clauses: List[str] = []
+        params: Dict[str, Any] = {}
         param_idx = 0
 
         for condition in conditions:
-            clause, condition_params, param_idx = self._build_condition_clause(
-                condition, param_values, param_idx
+            param_idx = self._build_condition_clause(
+                condition, param_values, param_idx, clauses, params
             )
-            clauses.append(clause)
-            params.update(condition_params)
 
         where_clause = f" {logical_op.value} ".join(clauses)
         return where_clause, params
 
     def _build_condition_clause(
-        self, condition: Condition, param_values: List[Any], param_idx: int
-    ) -> tuple[str, Dict[str, Any], int]:
+        self,
+        condition: Condition,
+        param_values: List[Any],
+        param_idx: int,
+        clauses: List[str],
+        params: Dict[str, Any],
+    ) -> int:
         """
         Build a single condition clause.
 
+        Args:
+            condition: Condition to render
+            param_values: Parameter values
+            param_idx: Index of the condition's first parameter value
+            clauses: List the rendered clause is appended to
+            params: Dictionary the condition's parameters are added to
+
         Returns:
-            Tuple of (clause_string, params_dict, next_param_idx)
-        """
-        prop = f"n.{condition.property_name}"
-        params = {}
-
-        if condition.operator == Operator.EQUALS:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} = ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.NOT_EQUALS:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} <> ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.GREATER_THAN:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} > ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.GREATER_THAN_EQUAL:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} >= ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.LESS_THAN:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} < ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.LESS_THAN_EQUAL:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} <= ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.BETWEEN:
-            param_name1 = f"p{param_idx}"
-            param_name2 = f"p{param_idx + 1}"
-            clause = f"{prop} >= ${param_name1} AND {prop} <= ${param_name2}"
-            params[param_name1] = param_values[param_idx]
-            params[param_name2] = param_values[param_idx + 1]
-            param_idx += 2
-
-        elif condition.operator == Operator.IN:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} IN ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.NOT_IN:
-            param_name = f"p{param_idx}"
-            clause = f"NOT {prop} IN ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.IS_NULL:
-            clause = f"{prop} IS NULL"
-
-        elif condition.operator == Operator.IS_NOT_NULL:
-            clause = f"{prop} IS NOT NULL"
-
-        elif condition.operator == Operator.CONTAINING:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} CONTAINS ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.STARTING_WITH:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} STARTS WITH ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.ENDING_WITH:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} ENDS WITH ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
-
-        elif condition.operator == Operator.LIKE:
-            param_name = f"p{param_idx}"
-            clause = f"{prop} =~ ${param_name}"
-            params[param_name] = param_values[param_idx]
-            param_idx += 1
+            Index of the next unused parameter value
+        """
+        # Unknown operators fall back to equality
+        template, arity = _CONDITION_TEMPLATES.get(
+            condition.operator, _CONDITION_TEMPLATES[Operator.EQUALS]
+        )
 
-        else:
-            clause = f"{prop} = ${param_idx}"
-            params[f"p{param_idx}"] = param_values[param_idx]
-            param_idx += 1
+        names = []
+        for offset in range(arity):
+            name = f"p{param_idx + offset}"
+            params[name] = param_values[param_idx + offset]
+            names.append(name)
+
+        clauses.append(template.format(f"n.{condition.property_name}", *names))
+        return param_idx + arity
+
+    def _root_window(
+        self,
+        order_by_clause: str = "",
+        skip: Optional[int] = None,
+        limit: Optional[Union[int, str]] = None,
+    ) -> str:
+        """
+        Build a WITH clause that orders and slices the root nodes.
+
+        Placing ORDER BY/SKIP/LIMIT right after the root MATCH means anything
+        projected afterwards only sees the rows that survive the slice.
+
+        Args:
+            order_by_clause: ORDER BY clause (empty for no ordering)
+            skip: Number of rows to skip, if any
+            limit: Maximum number of rows or a parameter reference, if any
+
+        Returns:
+            WITH clause with a leading space (empty if nothing to apply)
+        """
+        if not order_by_clause and skip is None and limit is None:
+            return ""
 
-        return clause, params, param_idx
+        window = " WITH n"
+        if order_by_clause:
+            window += f" {order_by_clause}"
+        if skip is not None:
+            window += f" SKIP {skip}"
+        if limit is not None:
+            window += f" LIMIT {limit}"
+        return window
 
-    def build_order_by_clause(self, ordering: List[OrderClause]) -> str:
+    def build_order_by_clause(self, ordering: Sequence[OrderClause]) -> str:
         """
         Build ORDER BY clause from ordering specifications.
 
@@ -347,7 +460,11 @@ class QueryBuilder:
         return "ORDER BY " + ", ".join(clauses)
 
     def build_relationship_load_query(
-        self, relationship_meta: RelationshipMetadata, source_id: int, target_class: Type
+        self,
+        relationship_meta: RelationshipMetadata,
+        source_id: int,
+        target_class: Type,
+        projection: Optional[Tuple[str, ...]] = None,
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build query to load related entities through a relationship.
@@ -356,6 +473,9 @@ class QueryBuilder:
             relationship_meta: Relationship metadata
             source_id: ID of source entity
             target_class: Target entity class
+            projection: Optional Python names of the properties to return; rows then
+                hold the target's internal ID followed by one column per property
+                instead of the whole node
 
         Returns:
             Tuple of (cypher_query, parameters)
@@ -365,29 +485,75 @@ class QueryBuilder:
         if target_metadata is None:
             raise ValueError(f"Target class {target_class.__name__} is not a valid entity")
 
-        target_labels = ":".join(target_metadata.labels)
+        target_labels = target_metadata.labels_str
 
-        # Build relationship pattern based on direction
-        if relationship_meta.direction == "OUTGOING":
-            rel_pattern = f"-[:{relationship_meta.relationship_type}]->"
-        elif relationship_meta.direction == "INCOMING":
-            rel_pattern = f"<-[:{relationship_meta.relationship_type}]-"
-        elif relationship_meta.direction == "BOTH":
-            rel_pattern = f"-[:{relationship_meta.relationship_type}]-"
-        else:
+        # Relationship pattern for the direction
+        rel_pattern = relationship_meta.pattern
+        if rel_pattern is None:
             raise ValueError(f"Invalid direction: {relationship_meta.direction}")
 
+        # Return only the requested properties, or the whole node
+        if projection is not None:
+            columns = ["id(target) AS target_id"]
+            for name in projection:
+                prop = target_metadata.get_property_by_python_name(name)
+                if prop is None:
+                    raise ValueError(f"Unknown property '{name}' on {target_class.__name__}")
+                columns.append(f"target.{prop.graph_name} AS {prop.graph_name}")
+            return_clause = ", ".join(columns)
+        else:
+            return_clause = "target"
+
         # Build query
-        cypher = f"""
-        MATCH (source){rel_pattern}(target:{target_labels})
-        WHERE id(source) = $source_id
-        RETURN target
-        """
+        cypher = (
+            f"MATCH (source){rel_pattern}(target:{target_labels}) "
+            "WHERE id(source) = $source_id "
+            f"RETURN {return_clause}"
+        )
 
         params = {"source_id": source_id}
 
         return cypher, params
 
+    def build_relationship_batch_load_query(
+        self, relationship_meta: RelationshipMetadata, source_ids: List[int], target_class: Type
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build query to load related entities for several source entities at once.
+
+        Each row holds a related node followed by the ID of the source it belongs to.
+
+        Args:
+            relationship_meta: Relationship metadata
+            source_ids: IDs of source entities
+            target_class: Target entity class
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        # Get target entity metadata
+        target_metadata = get_entity_metadata(target_class)
+        if target_metadata is None:
+            raise ValueError(f"Target class {target_class.__name__} is not a valid entity")
+
+        target_labels = target_metadata.labels_str
+
+        # Relationship pattern for the direction
+        rel_pattern = relationship_meta.pattern
+        if rel_pattern is None:
+            raise ValueError(f"Invalid direction: {relationship_meta.direction}")
+
+        # Build query
+        cypher = (
+            f"MATCH (source){rel_pattern}(target:{target_labels}) "
+            "WHERE id(source) IN $source_ids "
+            "RETURN target, id(source) AS source_id"
+        )
+
+        params = {"source_ids": source_ids}
+
+        return cypher, params
+
     def build_relationship_create_query(
         self, relationship_meta: RelationshipMetadata, source_id: int, target_id: int
     ) -> tuple[str, Dict[str, Any]]:
@@ -402,27 +568,52 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        # Build relationship pattern based on direction
-        if relationship_meta.direction == "OUTGOING":
-            rel_pattern = f"CREATE (source)-[:{relationship_meta.relationship_type}]->(target)"
-        elif relationship_meta.direction == "INCOMING":
-            rel_pattern = f"CREATE (source)<-[:{relationship_meta.relationship_type}]-(target)"
-        elif relationship_meta.direction == "BOTH":
-            rel_pattern = f"CREATE (source)-[:{relationship_meta.relationship_type}]-(target)"
-        else:
+        # Relationship pattern for the direction
+        if relationship_meta.pattern is None:
             raise ValueError(f"Invalid direction: {relationship_meta.direction}")
+        rel_pattern = f"CREATE (source){relationship_meta.pattern}(target)"
 
         # Build query - match both nodes by ID, then create edge
-        cypher = f"""
-        MATCH (source), (target)
-        WHERE id(source) = $source_id AND id(target) = $target_id
-        {rel_pattern}
-        """
+        cypher = (
+            "MATCH (source), (target) "
+            "WHERE id(source) = $source_id AND id(target) = $target_id "
+            f"{rel_pattern}"
+        )
 
         params = {"source_id": source_id, "target_id": target_id}
 
         return cypher, params
 
+    def build_relationship_create_batch_query(
+        self, relationship_meta: RelationshipMetadata, pairs: List[Dict[str, int]]
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build query to create many relationship edges of one type in a single round-trip.
+
+        Args:
+            relationship_meta: Relationship metadata
+            pairs: List of {"source_id": ..., "target_id": ...} node ID pairs
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        # Relationship pattern for the direction
+        if relationship_meta.pattern is None:
+            raise ValueError(f"Invalid direction: {relationship_meta.direction}")
+        rel_pattern = f"CREATE (source){relationship_meta.pattern}(target)"
+
+        # Build query - unwind the ID pairs, match both nodes, then create each edge
+        cypher = (
+            "UNWIND $pairs AS pair "
+            "MATCH (source), (target) "
+            "WHERE id(source) = pair.source_id AND id(target) = pair.target_id "
+            f"{rel_pattern}"
+        )
+
+        params = {"pairs": pairs}
+
+        return cypher, params
+
     def build_relationship_delete_query(
         self, relationship_meta: RelationshipMetadata, source_id: int
     ) -> tuple[str, Dict[str, Any]]:
@@ -436,29 +627,20 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        # Build relationship pattern based on direction
-        if relationship_meta.direction == "OUTGOING":
-            rel_pattern = f"-[r:{relationship_meta.relationship_type}]->"
-        elif relationship_meta.direction == "INCOMING":
-            rel_pattern = f"<-[r:{relationship_meta.relationship_type}]-"
-        elif relationship_meta.direction == "BOTH":
-            rel_pattern = f"-[r:{relationship_meta.relationship_type}]-"
-        else:
+        # Relationship pattern for the direction, with the edge bound to r
+        rel_pattern = relationship_meta.bound_pattern
+        if rel_pattern is None:
             raise ValueError(f"Invalid direction: {relationship_meta.direction}")
 
         # Build query - match all relationships of this type from source and delete them
-        cypher = f"""
-        MATCH (source){rel_pattern}(target)
-        WHERE id(source) = $source_id
-        DELETE r
-        """
+        cypher = f"MATCH (source){rel_pattern}(target) WHERE id(source) = $source_id DELETE r"
 
         params = {"source_id": source_id}
 
         return cypher, params
 
     def build_eager_loading_query(
-        self, metadata: EntityMetadata, entity_id: Any, fetch_hints: List[str]
+        self, metadata: EntityMetadata, entity_id: Any, fetch_hints: Sequence[str]
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build query with eager loading for specified relationships.
@@ -466,142 +648,77 @@ class QueryBuilder:
         Args:
             metadata: Entity metadata
             entity_id: ID of entity to fetch
-            fetch_hints: List of relationship names to eagerly load
+            fetch_hints: Relationship names to eagerly load
 
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
-
-        # Start with main entity match
-        if metadata.id_property and metadata.id_property.id_generator is not None:
-            where_clause = "WHERE id(n) = $id"
-        else:
-            where_clause = "WHERE n.id = $id"
-
-        cypher_parts = [f"MATCH (n:{labels_str})", where_clause]
-
-        # Add OPTIONAL MATCH for each relationship to fetch
-        return_parts = ["n"]
-
-        for hint in fetch_hints:
-            # Find relationship metadata
-            rel_meta = metadata.get_relationship_by_python_name(hint)
-            if rel_meta is None:
-                continue
-
-            # Resolve target class if needed
-            target_class = rel_meta.target_class
-            if target_class is None and rel_meta.target_class_name:
-                # Try to resolve from registry
-                from .registry import get_entity_class
-
-                target_class = get_entity_class(rel_meta.target_class_name)
-
-            if target_class is None:
-                continue
-
-            # Get target metadata
-            target_metadata = get_entity_metadata(target_class)
-            if target_metadata is None:
-                continue
-
-            target_labels = ":".join(target_metadata.labels)
-            var_name = f"{hint}_target"
-
-            # Build relationship pattern
-            if rel_meta.direction == "OUTGOING":
-                rel_pattern = f"-[:{rel_meta.relationship_type}]->"
-            elif rel_meta.direction == "INCOMING":
-                rel_pattern = f"<-[:{rel_meta.relationship_type}]-"
-            elif rel_meta.direction == "BOTH":
-                rel_pattern = f"-[:{rel_meta.relationship_type}]-"
-            else:
-                continue
-
-            # Add OPTIONAL MATCH
-            cypher_parts.append(f"OPTIONAL MATCH (n){rel_pattern}({var_name}:{target_labels})")
-
-            # Add to RETURN with collection
-            return_parts.append(f"collect(DISTINCT {var_name}) as {hint}")
-
-        # Build final query
-        cypher_parts.append("RETURN " + ", ".join(return_parts))
-        cypher = "\n".join(cypher_parts)
+        # Start with main entity match, using the same ID predicate as find_by_id
+        cypher = _eager_loading_query(
+            _id_match(metadata.labels_str, _uses_internal_id(metadata)),
+            self._eager_fragments(metadata, fetch_hints),
+        )
 
         params = {"id": entity_id}
 
         return cypher, params
 
     def build_eager_loading_query_all(
-        self, metadata: EntityMetadata, fetch_hints: List[str]
+        self,
+        metadata: EntityMetadata,
+        fetch_hints: Sequence[str],
+        pageable: Optional["Pageable"] = None,
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build query with eager loading for all entities.
 
         Args:
             metadata: Entity metadata
-            fetch_hints: List of relationship names to eagerly load
+            fetch_hints: Relationship names to eagerly load
+            pageable: Optional pagination, applied to the root nodes before
+                any relationship is expanded
 
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        # Start with main entity match, sliced to the requested page
+        match = f"MATCH (n:{metadata.labels_str})"
+        order_by_clause = ""
+        if pageable is not None:
+            if pageable.sort_by:
+                order_by_clause = f"ORDER BY n.{pageable.sort_by} {pageable.direction}"
+            match += self._root_window(order_by_clause, pageable.skip(), pageable.size)
+
+        # Aggregation does not keep row order, so ORDER BY is re-applied on the page
+        cypher = _eager_loading_query(
+            match, self._eager_fragments(metadata, fetch_hints), order_by_clause
+        )
 
-        # Start with main entity match
-        cypher_parts = [f"MATCH (n:{labels_str})"]
+        params: Dict[str, Any] = {}
 
-        # Add OPTIONAL MATCH for each relationship to fetch
-        return_parts = ["n"]
+        return cypher, params
 
-        for hint in fetch_hints:
-            # Find relationship metadata
-            rel_meta = metadata.get_relationship_by_python_name(hint)
-            if rel_meta is None:
-                continue
-
-            # Resolve target class if needed
-            target_class = rel_meta.target_class
-            if target_class is None and rel_meta.target_class_name:
-                # Try to resolve from registry
-                from .registry import get_entity_class
-
-                target_class = get_entity_class(rel_meta.target_class_name)
-
-            if target_class is None:
-                continue
-
-            # Get target metadata
-            target_metadata = get_entity_metadata(target_class)
-            if target_metadata is None:
-                continue
-
-            target_labels = ":".join(target_metadata.labels)
-            var_name = f"{hint}_target"
-
-            # Build relationship pattern
-            if rel_meta.direction == "OUTGOING":
-                rel_pattern = f"-[:{rel_meta.relationship_type}]->"
-            elif rel_meta.direction == "INCOMING":
-                rel_pattern = f"<-[:{rel_meta.relationship_type}]-"
-            elif rel_meta.direction == "BOTH":
-                rel_pattern = f"-[:{rel_meta.relationship_type}]-"
-            else:
-                continue
-
-            # Add OPTIONAL MATCH
-            cypher_parts.append(f"OPTIONAL MATCH (n){rel_pattern}({var_name}:{target_labels})")
-
-            # Add to RETURN with collection
-            return_parts.append(f"collect(DISTINCT {var_name}) as {hint}")
-
-        # Build final query
-        cypher_parts.append("RETURN " + ", ".join(return_parts))
-        cypher = "\n".join(cypher_parts)
+    def _eager_fragments(
+        self, metadata: EntityMetadata, fetch_hints: Sequence[str]
+    ) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Resolve fetch hints to (hint, edge pattern, target labels) triples.
 
-        params: Dict[str, Any] = {}
+        Unknown or unresolvable relationships are skipped.
 
-        return cypher, params
+        Args:
+            metadata: Entity metadata
+            fetch_hints: Relationship names to eagerly load
+
+        Returns:
+            Tuple of fragments, usable as a cache key
+        """
+        fragments = []
+        for hint in fetch_hints:
+            fragment = metadata.get_eager_fragment(hint)
+            if fragment is not None:
+                fragments.append((hint, *fragment))
+        return tuple(fragments)
 
     def build_count_query_with_conditions(
         self, metadata: EntityMetadata, spec: QuerySpec, param_values: List[Any]
@@ -617,7 +734,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        labels_str = metadata.labels_str
 
         # Build WHERE clause
         where_clause, params = self.build_where_clause(
@@ -633,7 +750,7 @@ class QueryBuilder:
         return cypher, params
 
     def build_paginated_query(
-        self, metadata: EntityMetadata, pageable: "Pageable"
+        self, metadata: EntityMetadata, pageable: "Pageable", limit: Optional[int] = None
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build paginated query for find_all.
@@ -641,21 +758,25 @@ class QueryBuilder:
         Args:
             metadata: Entity metadata
             pageable: Pagination parameters
+            limit: Rows to fetch, when different from the page size (e.g. one
+                extra probe row to detect a next page)
 
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
-
-        # Build query
-        cypher = f"MATCH (n:{labels_str}) RETURN n"
+        labels_str = metadata.labels_str
 
         # Add ORDER BY if specified
+        order_by_clause = ""
         if pageable.sort_by:
-            cypher += f" ORDER BY n.{pageable.sort_by} {pageable.direction}"
+            order_by_clause = f"ORDER BY n.{pageable.sort_by} {pageable.direction}"
 
-        # Add SKIP and LIMIT
-        cypher += f" SKIP {pageable.skip()} LIMIT {pageable.size}"
+        # Build query - order and slice the nodes before projecting them
+        cypher = f"MATCH (n:{labels_str})"
+        if limit is None:
+            limit = pageable.size
+        cypher += self._root_window(order_by_clause, pageable.skip(), limit)
+        cypher += " RETURN n"
 
         params: Dict[str, Any] = {}
         return cypher, params
@@ -679,7 +800,7 @@ class QueryBuilder:
         Returns:
             Tuple of (cypher_query, parameters)
         """
-        labels_str = ":".join(metadata.labels)
+        labels_str = metadata.labels_str
 
         # Build WHERE clause
         where_clause, params = self.build_where_clause(
@@ -690,16 +811,60 @@ class QueryBuilder:
         cypher = f"MATCH (n:{labels_str})"
         if where_clause:
             cypher += f" WHERE {where_clause}"
-        cypher += " RETURN n"
 
         # Add ORDER BY - prefer pageable sort, fall back to spec ordering
         if pageable.sort_by:
-            cypher += f" ORDER BY n.{pageable.sort_by} {pageable.direction}"
-        elif spec.ordering:
+            order_by_clause = f"ORDER BY n.{pageable.sort_by} {pageable.direction}"
+        else:
             order_by_clause = self.build_order_by_clause(spec.ordering)
-            cypher += f" {order_by_clause}"
 
-        # Add SKIP and LIMIT
-        cypher += f" SKIP {pageable.skip()} LIMIT {pageable.size}"
+        # Order and slice the matched nodes before projecting them
+        cypher += self._root_window(order_by_clause, pageable.skip(), pageable.size)
+        cypher += " RETURN n"
+
+        return cypher, params
+
+    def build_keyset_query(
+        self,
+        metadata: EntityMetadata,
+        keyset: "Keyset",
+        conditions: Optional[List[Condition]] = None,
+        param_values: Optional[List[Any]] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build a keyset (seek) paginated query.
+
+        Starts after ``keyset.last_value`` instead of skipping rows, and fetches
+        one extra row so the caller can tell whether another page follows. The
+        sort value is returned as a ``cursor`` column.
+
+        Args:
+            metadata: Entity metadata
+            keyset: Keyset pagination parameters
+            conditions: Optional extra conditions, combined with AND
+            param_values: Parameter values for conditions
+
+        Returns:
+            Tuple of (cypher_query, parameters)
+        """
+        labels_str = metadata.labels_str
+        sort_key = f"n.{keyset.sort_by}"
+
+        where_clause, params = self.build_where_clause(
+            conditions or [], LogicalOperator.AND, param_values or []
+        )
+        clauses = [where_clause] if where_clause else []
+        if keyset.last_value is not None:
+            comparison = ">" if keyset.direction == "ASC" else "<"
+            clauses.insert(0, f"{sort_key} {comparison} $cursor")
+            params["cursor"] = keyset.last_value
+
+        cypher = f"MATCH (n:{labels_str})"
+        if clauses:
+            cypher += " WHERE " + " AND ".join(clauses)
+        cypher += self._root_window(
+            f"ORDER BY {sort_key} {keyset.direction}", limit=keyset.size + 1
+        )
+        cypher += f" RETURN n, {sort_key} AS cursor"
 
         return cypher, params
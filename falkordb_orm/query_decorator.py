@@ -1,14 +1,85 @@
 """Custom query decorator for user-defined Cypher queries."""
 
 import inspect
-from typing import Any, Callable, Optional, Type, TypeVar
+import re
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar
 
 T = TypeVar("T")
 
+# First identifier after the last RETURN; the greedy prefix skips earlier ones
+_RETURN_VAR = re.compile(
+    r".*\bRETURN\s+(?:DISTINCT\s+)?([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE | re.DOTALL
+)
+
+# Return types whose result is the first column of the first row
+_PRIMITIVE_TYPES = (int, float, str, bool)
+
+# Parameter kinds that a positional argument can fill
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _parameter_names(method: Callable) -> Tuple[str, ...]:
+    """
+    Get the positional parameter names of a query method, excluding ``self``.
+
+    Plain functions expose their positional parameters on ``__code__``; wrapped
+    functions and other callables fall back to ``inspect.signature``.
+
+    Args:
+        method: Decorated query method
+
+    Returns:
+        Names that positional arguments bind to, in declaration order
+    """
+    code = getattr(method, "__code__", None)
+    if code is not None and not hasattr(method, "__wrapped__"):
+        names = code.co_varnames[: code.co_argcount]
+    else:
+        names = tuple(
+            name
+            for name, param in inspect.signature(method).parameters.items()
+            if param.kind in _POSITIONAL_KINDS
+        )
+    return tuple(name for name in names if name != "self")
+
+
+def _entity_return_type(returns: Optional[Type]) -> Optional[Type]:
+    """
+    Get the entity class a query's results map to.
+
+    Args:
+        returns: Declared return type
+
+    Returns:
+        The entity class for ``Entity`` or ``List[Entity]``, otherwise None
+    """
+    if hasattr(returns, "__node_metadata__"):
+        return returns
+
+    # Handle List[Entity] and similar generic types
+    if getattr(returns, "__origin__", None) is list:
+        args = getattr(returns, "__args__", ())
+        if args and hasattr(args[0], "__node_metadata__"):
+            return args[0]
+
+    return None
+
 
 class QueryMethod:
     """Descriptor for custom query methods."""
 
+    __slots__ = (
+        "cypher",
+        "returns",
+        "write",
+        "method",
+        "name",
+        "_param_names",
+        "_var_name",
+        "_returns_primitive",
+        "_entity_type",
+    )
+
     def __init__(
         self,
         cypher: str,
@@ -29,7 +100,16 @@ class QueryMethod:
         self.returns = returns
         self.write = write
         self.method = method
-        self._param_names: Optional[list] = None
+
+        # Positional parameter names, read once
+        self._param_names: Tuple[str, ...] = ()
+        if method is not None:
+            self._param_names = _parameter_names(method)
+
+        # The query and return type are fixed, so result handling is decided once
+        self._var_name = self._compute_var_name(cypher)
+        self._returns_primitive = returns in _PRIMITIVE_TYPES
+        self._entity_type = _entity_return_type(returns)
 
     def __set_name__(self, owner: Type, name: str) -> None:
         """Called when descriptor is assigned to class attribute."""
@@ -78,22 +158,13 @@ class QueryMethod:
         Returns:
             Parameter dictionary for Cypher query
         """
-        params = {}
-
-        # Get parameter names from method signature
-        if self.method:
-            sig = inspect.signature(self.method)
-            param_names = [name for name in sig.parameters.keys() if name != "self"]
-
-            # Map positional args to parameter names
-            for i, arg in enumerate(args):
-                if i < len(param_names):
-                    params[param_names[i]] = arg
-
-        # Add keyword arguments
-        params.update(kwargs)
+        # kwargs is a fresh dict for every call, so it can be used as-is
+        if not args:
+            return kwargs
 
-        return params
+        # Map positional args to parameter names (extra positionals are dropped),
+        # then add keyword arguments, in one dict
+        return dict(zip(self._param_names, args), **kwargs)
 
     def _map_results(self, result: Any, repository: Any) -> Any:
         """
@@ -110,7 +181,7 @@ class QueryMethod:
             # No results
             if self.returns is None:
                 return None
-            elif self.returns in (int, float, str, bool):
+            elif self._returns_primitive:
                 return 0 if self.returns in (int, float) else None
             else:
                 return []
@@ -120,53 +191,25 @@ class QueryMethod:
             return None
 
         # Primitive return types
-        if self.returns in (int, float, str, bool):
+        if self._returns_primitive:
             return result.result_set[0][0]
 
-        # Entity return type - map to objects
-        if hasattr(self.returns, "__node_metadata__"):
-            entities = []
-            for record in result.result_set:
-                # Assume first column is the entity node
-                entity = repository.mapper.map_from_record(
-                    record, self.returns, var_name=self._get_var_name()
-                )
-                entities.append(entity)
-            return entities
-
-        # List return type
-        if hasattr(self.returns, "__origin__"):
-            # Handle List[Entity] and similar generic types
-            origin = getattr(self.returns, "__origin__", None)
-            if origin is list:
-                args = getattr(self.returns, "__args__", ())
-                if args and hasattr(args[0], "__node_metadata__"):
-                    entity_type = args[0]
-                    entities = []
-                    for record in result.result_set:
-                        entity = repository.mapper.map_from_record(
-                            record, entity_type, var_name=self._get_var_name()
-                        )
-                        entities.append(entity)
-                    return entities
+        # Entity or List[Entity] return type - map to objects
+        if self._entity_type is not None:
+            map_record = repository.mapper.map_from_record
+            entity_type, var_name = self._entity_type, self._var_name
+            return [
+                map_record(record, entity_type, var_name=var_name) for record in result.result_set
+            ]
 
         # Default: return first column of all rows
         return [record[0] for record in result.result_set]
 
-    def _get_var_name(self) -> str:
-        """Extract variable name from Cypher RETURN clause."""
-        # Simple heuristic: look for RETURN statement and extract first variable
-        cypher_upper = self.cypher.upper()
-        if "RETURN" in cypher_upper:
-            return_idx = cypher_upper.rfind("RETURN")
-            after_return = self.cypher[return_idx + 6 :].strip()
-            # Extract first word/identifier
-            var_name = after_return.split()[0].split(",")[0].strip()
-            # Remove any AS alias
-            if " AS " in var_name.upper():
-                var_name = var_name.split()[0]
-            return var_name
-        return "n"  # Default fallback
+    @staticmethod
+    def _compute_var_name(cypher: str) -> str:
+        """Extract the first variable of the last RETURN clause (default: 'n')."""
+        match = _RETURN_VAR.match(cypher)
+        return match.group(1) if match else "n"
 
 
 def query(
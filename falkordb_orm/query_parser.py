@@ -1,9 +1,10 @@
 """Query parser for deriving Cypher queries from method names."""
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
 
 from .exceptions import QueryException
 
@@ -44,7 +45,7 @@ class LogicalOperator(Enum):
     OR = "OR"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Condition:
     """Represents a single WHERE clause condition."""
 
@@ -58,7 +59,7 @@ class Condition:
     """Number of parameters required (e.g., 2 for BETWEEN)."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class OrderClause:
     """Represents an ORDER BY clause."""
 
@@ -69,20 +70,20 @@ class OrderClause:
     """Sort direction: ASC or DESC."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class QuerySpec:
     """Structured representation of a derived query."""
 
     operation: Operation
     """The query operation (find, count, exists, delete)."""
 
-    conditions: List[Condition] = field(default_factory=list)
-    """List of WHERE conditions."""
+    conditions: Tuple[Condition, ...] = ()
+    """WHERE conditions."""
 
     logical_operator: LogicalOperator = LogicalOperator.AND
     """Logical operator for combining conditions (AND/OR)."""
 
-    ordering: List[OrderClause] = field(default_factory=list)
+    ordering: Tuple[OrderClause, ...] = ()
     """ORDER BY clauses."""
 
     limit: Optional[int] = None
@@ -110,10 +111,30 @@ class QueryParser:
         ("_in", Operator.IN),
     ]
 
+    # All suffixes in one pattern anchored at the end; the lazy property group
+    # makes the longest matching suffix win, as with the ordered list above
+    _SUFFIX_RE = re.compile(
+        r"^(.*?)(" + "|".join(re.escape(suffix) for suffix, _ in OPERATOR_PATTERNS) + r")$"
+    )
+    _SUFFIX_TO_OPERATOR = dict(OPERATOR_PATTERNS)
+
+    # operation_[first_|top_N_]conditions[_order_by_ordering]; the lazy groups stop
+    # at the first and second _order_by_, anything after the second is ignored
+    _METHOD_RE = re.compile(
+        r"^(" + "|".join(op.value for op in Operation) + r")_"
+        r"(?:(first)_|top_(\d+)_)?"
+        r"(.*?)"
+        r"(?:_order_by_(.*?)(?:_order_by_.*)?)?$",
+        re.DOTALL,
+    )
+
     def parse_method_name(self, method_name: str) -> QuerySpec:
         """
         Parse a repository method name into a QuerySpec.
 
+        Results are cached per parser class, so each name is parsed once per
+        process; the returned QuerySpec is frozen and shared between callers.
+
         Args:
             method_name: The method name to parse (e.g., "find_by_name_and_age")
 
@@ -133,30 +154,23 @@ class QueryParser:
             >>> spec.conditions[0].operator
             <Operator.GREATER_THAN: '>'>
         """
-        original_name = method_name
-
-        # Extract operation
-        operation = self._extract_operation(method_name)
-        if not operation:
-            raise QueryException(f"Invalid query method: {original_name}")
-
-        # Remove operation prefix
-        remaining = method_name[len(operation.value) + 1 :]  # +1 for underscore
+        return _parse_cached(type(self), method_name)
 
-        # Extract limit (first/top_N)
-        limit = self._extract_limit(remaining)
-        if limit is not None:
-            remaining = self._remove_limit_prefix(remaining)
+    def _parse_method_name(self, method_name: str) -> QuerySpec:
+        """Parse a method name without consulting the cache."""
+        # Split into operation, limit (first/top_N), conditions and ordering
+        match = self._METHOD_RE.match(method_name)
+        if not match:
+            raise QueryException(f"Invalid query method: {method_name}")
 
-        # Split by order_by if present
-        parts = remaining.split("_order_by_")
-        conditions_part = parts[0]
-        ordering_part = parts[1] if len(parts) > 1 else None
+        operation_name, first, top, conditions_part, ordering_part = match.groups()
+        operation = Operation(operation_name)
+        limit = 1 if first else int(top) if top is not None else None
 
         # Parse conditions
         # Handle special case: find_all without conditions
         if not conditions_part or conditions_part == "" or conditions_part == "all":
-            conditions = []
+            conditions: List[Condition] = []
             logical_op = LogicalOperator.AND
         else:
             conditions, logical_op = self._parse_conditions(conditions_part)
@@ -164,44 +178,15 @@ class QueryParser:
         # Parse ordering
         ordering = self._parse_ordering(ordering_part) if ordering_part else []
 
+        # Specs are cached and shared, so they only hold immutable sequences
         return QuerySpec(
             operation=operation,
-            conditions=conditions,
+            conditions=tuple(conditions),
             logical_operator=logical_op,
-            ordering=ordering,
+            ordering=tuple(ordering),
             limit=limit,
         )
 
-    def _extract_operation(self, method_name: str) -> Optional[Operation]:
-        """Extract the operation from method name."""
-        for op in Operation:
-            if method_name.startswith(op.value + "_"):
-                return op
-        return None
-
-    def _extract_limit(self, text: str) -> Optional[int]:
-        """Extract limit from first/top_N prefix."""
-        if text.startswith("first_"):
-            return 1
-
-        # Match top_N pattern
-        match = re.match(r"top_(\d+)_", text)
-        if match:
-            return int(match.group(1))
-
-        return None
-
-    def _remove_limit_prefix(self, text: str) -> str:
-        """Remove first/top_N prefix from text."""
-        if text.startswith("first_"):
-            return text[6:]  # Remove "first_"
-
-        match = re.match(r"top_(\d+)_", text)
-        if match:
-            return text[len(match.group(0)) :]
-
-        return text
-
     def _parse_conditions(self, text: str) -> tuple[List[Condition], LogicalOperator]:
         """
         Parse conditions from text like 'by_name_and_age_greater_than'.
@@ -232,15 +217,16 @@ class QueryParser:
     def _parse_single_condition(self, text: str) -> Condition:
         """Parse a single condition like 'age_greater_than'."""
         # Try to match operator patterns
-        for suffix, operator in self.OPERATOR_PATTERNS:
-            if text.endswith(suffix):
-                property_name = text[: -len(suffix)]
-                param_count = 2 if operator == Operator.BETWEEN else 1
-                if operator in (Operator.IS_NULL, Operator.IS_NOT_NULL):
-                    param_count = 0
-                return Condition(
-                    property_name=property_name, operator=operator, param_count=param_count
-                )
+        match = self._SUFFIX_RE.match(text)
+        if match:
+            property_name, suffix = match.groups()
+            operator = self._SUFFIX_TO_OPERATOR[suffix]
+            param_count = 2 if operator == Operator.BETWEEN else 1
+            if operator in (Operator.IS_NULL, Operator.IS_NOT_NULL):
+                param_count = 0
+            return Condition(
+                property_name=property_name, operator=operator, param_count=param_count
+            )
 
         # No operator suffix - default to equals
         return Condition(property_name=text, operator=Operator.EQUALS, param_count=1)
@@ -270,3 +256,9 @@ class QueryParser:
             i += 2
 
         return ordering
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(parser_class: Type[QueryParser], method_name: str) -> QuerySpec:
+    """Parse a method name once per parser class; failures are not cached."""
+    return parser_class()._parse_method_name(method_name)
@@ -1,6 +1,6 @@
 """Relationship loading and management."""
 
-from typing import Any, Generic, Iterator, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
 
 from .metadata import RelationshipMetadata
 
@@ -14,6 +14,17 @@ class LazyList(Generic[T]):
     Loads related entities on first access and caches them.
     """
 
+    __slots__ = (
+        "_graph",
+        "_source_id",
+        "_relationship_meta",
+        "_entity_class",
+        "_mapper",
+        "_query_builder",
+        "_loaded",
+        "_items",
+    )
+
     def __init__(
         self,
         graph: Any,
@@ -56,10 +67,9 @@ class LazyList(Generic[T]):
         result = self._graph.query(cypher, params)
 
         # Map results to entities
-        self._items = []
-        for record in result.result_set:
-            entity = self._mapper.map_from_record(record, self._entity_class, "target")
-            self._items.append(entity)
+        map_record = self._mapper.map_from_record
+        entity_class = self._entity_class
+        self._items = [map_record(record, entity_class, "target") for record in result.result_set]
 
         self._loaded = True
 
@@ -97,6 +107,17 @@ class LazySingle(Generic[T]):
     Loads related entity on first access and caches it.
     """
 
+    __slots__ = (
+        "_graph",
+        "_source_id",
+        "_relationship_meta",
+        "_entity_class",
+        "_mapper",
+        "_query_builder",
+        "_loaded",
+        "_item",
+    )
+
     def __init__(
         self,
         graph: Any,
@@ -240,6 +261,7 @@ class RelationshipManager:
         self._mapper = mapper
         self._query_builder = query_builder
         self._entity_tracker: set = set()
+        self._related_cache: Dict[type, Tuple[Any, Optional[str]]] = {}
 
     def save_relationships(
         self, source_entity: Any, source_id: int, metadata: Any, is_update: bool = False
@@ -297,6 +319,24 @@ class RelationshipManager:
             # Clean up tracker for this entity
             self._entity_tracker.discard(entity_key)
 
+    def _related_metadata(self, entity_type: type) -> Tuple[Any, Optional[str]]:
+        """
+        Get metadata and ID attribute name for a related entity type, using cache.
+
+        Args:
+            entity_type: Related entity class
+
+        Returns:
+            Tuple of (entity metadata, ID property python name or None)
+        """
+        cached = self._related_cache.get(entity_type)
+        if cached is None:
+            entity_metadata = self._mapper.get_entity_metadata(entity_type)
+            id_property = entity_metadata.id_property
+            cached = (entity_metadata, id_property.python_name if id_property else None)
+            self._related_cache[entity_type] = cached
+        return cached
+
     def _get_or_save_related_entity(
         self, entity: Any, rel_meta: RelationshipMetadata
     ) -> Optional[int]:
@@ -313,12 +353,11 @@ class RelationshipManager:
         if entity is None:
             return None
 
-        # Get entity metadata
-        entity_metadata = self._mapper.get_entity_metadata(type(entity))
+        _, id_name = self._related_metadata(type(entity))
 
         # Check if entity has an ID
-        if entity_metadata.id_property:
-            entity_id = getattr(entity, entity_metadata.id_property.python_name, None)
+        if id_name is not None:
+            entity_id = getattr(entity, id_name, None)
 
             # If has ID, return it
             if entity_id is not None:
@@ -334,7 +373,7 @@ class RelationshipManager:
                 saved_entity = target_repo.save(entity)
 
                 # Return the saved entity's ID
-                return getattr(saved_entity, entity_metadata.id_property.python_name, None)
+                return getattr(saved_entity, id_name, None)
 
         return None
 
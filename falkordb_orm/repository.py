@@ -5,7 +5,7 @@ from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Type,
 from .exceptions import EntityNotFoundException, QueryException
 from .mapper import EntityMapper
 from .metadata import EntityMetadata
-from .pagination import Page, Pageable
+from .pagination import CountCache, Keyset, KeysetSlice, Page, Pageable, Slice
 from .query_builder import QueryBuilder
 from .query_parser import QueryParser, QuerySpec, Operation
 
@@ -22,15 +22,17 @@ class Repository(Generic[T]):
         T: Entity type
     """
 
-    def __init__(self, graph: Any, entity_class: Type[T]):
+    def __init__(self, graph: Any, entity_class: Type[T], count_cache: Optional[CountCache] = None):
         """
         Initialize repository.
 
         Args:
             graph: FalkorDB graph instance
             entity_class: Entity class type
+            count_cache: Optional cache for pagination counts
         """
         self.graph = graph
+        self.count_cache = count_cache
         self.entity_class = entity_class
         self.query_builder = QueryBuilder()
         self.mapper = EntityMapper(graph=graph, query_builder=self.query_builder)
@@ -287,7 +289,7 @@ class Repository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN sum(n.{property_name}) as total"
 
             result = self.graph.query(cypher, {})
@@ -314,7 +316,7 @@ class Repository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN avg(n.{property_name}) as average"
 
             result = self.graph.query(cypher, {})
@@ -341,7 +343,7 @@ class Repository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN min(n.{property_name}) as minimum"
 
             result = self.graph.query(cypher, {})
@@ -368,7 +370,7 @@ class Repository(Generic[T]):
             QueryException: If query execution fails
         """
         try:
-            labels_str = ":".join(self.metadata.labels)
+            labels_str = self.metadata.labels_str
             cypher = f"MATCH (n:{labels_str}) RETURN max(n.{property_name}) as maximum"
 
             result = self.graph.query(cypher, {})
@@ -385,6 +387,8 @@ class Repository(Generic[T]):
         """
         Find all entities with pagination.
 
+        Use find_all_slice to page without counting all matches.
+
         Args:
             pageable: Pagination parameters
 
@@ -404,20 +408,20 @@ class Repository(Generic[T]):
         try:
             # Get total count
             count_cypher, count_params = self.query_builder.build_count_query(self.metadata)
-            count_result = self.graph.query(count_cypher, count_params)
-            total_elements = count_result.result_set[0][0] if count_result.result_set else 0
 
-            # Get paginated results
-            cypher, params = self.query_builder.build_paginated_query(self.metadata, pageable)
-            result = self.graph.query(cypher, params)
+            def load_count() -> int:
+                count_result = self.graph.query(count_cypher, count_params)
+                return count_result.result_set[0][0] if count_result.result_set else 0
 
-            # Map entities
-            entities: List[T] = []
-            for record in result.result_set:
-                entity = self.mapper.map_from_record(
-                    record, self.entity_class, header=result.header
+            if self.count_cache is not None:
+                total_elements = self.count_cache.get_or_load(
+                    count_cypher, count_params, load_count
                 )
-                entities.append(entity)
+            else:
+                total_elements = load_count()
+
+            # Get paginated results
+            entities = self._find_page(pageable)
 
             # Create and return Page
             return Page(
@@ -430,6 +434,101 @@ class Repository(Generic[T]):
         except Exception as e:
             raise QueryException(f"Failed to find paginated entities: {e}") from e
 
+    def find_all_slice(self, pageable: Pageable) -> Slice[T]:
+        """
+        Find one page of entities without counting all of them.
+
+        Fetches one row more than the page size; if it comes back, there is a
+        next page.
+
+        Args:
+            pageable: Pagination parameters
+
+        Returns:
+            Slice object containing results and whether more follow
+
+        Raises:
+            QueryException: If query execution fails
+
+        Example:
+            >>> page = repo.find_all_slice(Pageable(page=0, size=10))
+            >>> for entity in page:
+            ...     print(entity.name)
+            >>> page.has_next()
+            True
+        """
+        try:
+            # One probe row past the page tells whether a next page exists
+            entities = self._find_page(pageable, limit=pageable.size + 1)
+            return Slice(
+                content=entities[: pageable.size],
+                page_number=pageable.page,
+                page_size=pageable.size,
+                has_more=len(entities) > pageable.size,
+            )
+
+        except Exception as e:
+            raise QueryException(f"Failed to find paginated entities: {e}") from e
+
+    def find_all_keyset(self, keyset: Keyset) -> KeysetSlice[T]:
+        """
+        Find one page of entities with keyset (seek) pagination.
+
+        Each page starts after the last sort value of the previous one, so deep
+        pages cost no more than the first. Pages can only be walked in order.
+
+        Args:
+            keyset: Keyset pagination parameters
+
+        Returns:
+            KeysetSlice with the entities and the cursor for the next page
+
+        Raises:
+            QueryException: If query execution fails
+
+        Example:
+            >>> page = repo.find_all_keyset(Keyset(sort_by="email", size=50))
+            >>> while page.has_next():
+            ...     page = repo.find_all_keyset(page.next_keyset())
+        """
+        try:
+            cypher, params = self.query_builder.build_keyset_query(self.metadata, keyset)
+            result = self.graph.query(cypher, params)
+
+            rows = result.result_set[: keyset.size]
+            content = [
+                self.mapper.map_from_record(record, self.entity_class, header=result.header)
+                for record in rows
+            ]
+            return KeysetSlice(
+                content=content,
+                keyset=keyset,
+                has_more=len(result.result_set) > keyset.size,
+                last_value=rows[-1][-1] if rows else None,
+            )
+
+        except Exception as e:
+            raise QueryException(f"Failed to find paginated entities: {e}") from e
+
+    def _find_page(self, pageable: Pageable, limit: Optional[int] = None) -> List[T]:
+        """
+        Run the paginated query and map its rows.
+
+        Args:
+            pageable: Pagination parameters
+            limit: Rows to fetch instead of the page size, if given
+
+        Returns:
+            Entities on the page (plus the probe row, if requested)
+        """
+        cypher, params = self.query_builder.build_paginated_query(self.metadata, pageable, limit)
+        result = self.graph.query(cypher, params)
+
+        return [
+            self.mapper.map_from_record(record, self.entity_class, header=result.header)
+            for record in result.result_set
+        ]
+
     def delete(self, entity: T) -> None:
         """
         Delete entity.
@@ -129,13 +129,12 @@ class SchemaManager:
                 for entity_class in entity_classes:
                     metadata = get_entity_metadata(entity_class)
                     if metadata and metadata.primary_label == label:
-                        for p in metadata.properties:
-                            if p.graph_name == prop_name:
-                                if p.unique:
-                                    idx_type = "UNIQUE"
-                                elif p.index_type:
-                                    idx_type = p.index_type
-                                break
+                        p = metadata.get_property_by_graph_name(prop_name)
+                        if p is not None:
+                            if p.unique:
+                                idx_type = "UNIQUE"
+                            elif p.index_type:
+                                idx_type = p.index_type
                         break
 
                 missing_indexes.append((label, prop_name, idx_type))
@@ -10,6 +10,31 @@ from .metadata import get_entity_metadata
 
 T = TypeVar("T")
 
+# Values of these types cannot change in place, so snapshots store them as-is
+_IMMUTABLE = (int, float, str, bool, bytes, type(None))
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Copy a property value for change tracking as cheaply as possible.
+
+    Args:
+        value: Property value
+
+    Returns:
+        The value itself if immutable, a shallow copy for containers of
+        immutable items, a deep copy otherwise
+    """
+    if isinstance(value, _IMMUTABLE):
+        return value
+    if isinstance(value, (list, set)):
+        if all(isinstance(item, _IMMUTABLE) for item in value):
+            return copy.copy(value)
+    elif isinstance(value, dict):
+        if all(isinstance(item, _IMMUTABLE) for item in value.values()):
+            return copy.copy(value)
+    return copy.deepcopy(value)
+
 
 class Session:
     """
@@ -302,10 +327,10 @@ class Session:
             state = {}
             for prop in metadata.properties:
                 value = getattr(entity, prop.python_name, None)
-                # Deep copy to detect changes
+                # Copy to detect changes
                 if value is not None:
                     try:
-                        state[prop.python_name] = copy.deepcopy(value)
+                        state[prop.python_name] = _copy_value(value)
                     except Exception:
                         # If can't deep copy, store reference
                         state[prop.python_name] = value
@@ -105,6 +105,8 @@ class TypeRegistry:
 
     def __init__(self) -> None:
         self._converters: Dict[Type, TypeConverter] = {}
+        # Bumped on every registration so callers can invalidate cached lookups
+        self.version = 0
         self._register_defaults()
 
     def _register_defaults(self) -> None:
@@ -123,6 +125,7 @@ class TypeRegistry:
             converter: TypeConverter instance
         """
         self._converters[python_type] = converter
+        self.version += 1
 
     def get_converter(self, python_type: Type) -> TypeConverter:
         """
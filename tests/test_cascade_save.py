@@ -395,6 +395,172 @@ class TestRelationshipManager:
         # Should not process relationships (early return)
         assert not mapper.called
 
+    def test_related_metadata_looked_up_once_per_type(self):
+        """Test related entity metadata is resolved once per type across a collection."""
+        graph = Mock()
+        mapper = Mock()
+        mapper.get_entity_metadata = Mock(side_effect=get_entity_metadata)
+        query_builder = Mock()
+        query_builder.build_relationship_create_query = Mock(return_value=("CREATE query", {}))
+
+        manager = RelationshipManager(graph, mapper, query_builder)
+
+        alice = Person(name="Alice", age=30)
+        alice.friends = [Person(name=f"Friend {i}", age=20) for i in range(5)]
+        for i, friend in enumerate(alice.friends, start=2):
+            friend.id = i
+
+        manager.save_relationships(alice, 1, get_entity_metadata(Person))
+
+        mapper.get_entity_metadata.assert_called_once_with(Person)
+        assert query_builder.build_relationship_create_query.call_count == 5
+
+    def test_async_save_relationships_batches_edges(self):
+        """Test async save_relationships creates a collection's edges in one query."""
+        import asyncio
+
+        from falkordb_orm.async_relationships import AsyncRelationshipManager
+        from falkordb_orm.query_builder import QueryBuilder
+
+        queries = []
+
+        async def mock_query(cypher, params):
+            queries.append((cypher, params))
+            return Mock(result_set=[])
+
+        graph = Mock()
+        graph.query = mock_query
+
+        mapper = Mock()
+        mapper.get_entity_metadata = lambda cls: get_entity_metadata(cls)
+
+        manager = AsyncRelationshipManager(graph, mapper, QueryBuilder())
+
+        alice = Person(name="Alice", age=30)
+        alice.id = 1
+        bob = Person(name="Bob", age=28)
+        bob.id = 2
+        carol = Person(name="Carol", age=27)
+        carol.id = 3
+        alice.friends = [bob, carol]
+
+        asyncio.run(manager.save_relationships(alice, 1, get_entity_metadata(Person)))
+
+        assert len(queries) == 1
+        cypher, params = queries[0]
+        assert "UNWIND" in cypher
+        assert [pair["target_id"] for pair in params["pairs"]] == [2, 3]
+
+    def test_async_cascade_inserts_related_entity_in_one_query(self):
+        """Test async cascade save inserts a new related entity with a single query."""
+        import asyncio
+
+        from falkordb_orm.async_mapper import AsyncEntityMapper
+        from falkordb_orm.async_relationships import AsyncRelationshipManager
+        from falkordb_orm.query_builder import QueryBuilder
+
+        queries = []
+
+        async def mock_query(cypher, params):
+            queries.append(cypher)
+            return Mock(result_set=[[2]])
+
+        graph = Mock()
+        graph.query = mock_query
+        query_builder = QueryBuilder()
+        mapper = AsyncEntityMapper(graph=graph, query_builder=query_builder)
+
+        manager = AsyncRelationshipManager(graph, mapper, query_builder)
+
+        employee = Employee(name="Alice", position="Engineer")
+        employee.id = 1
+        employee.company = Company(name="Acme", industry="Tech")
+
+        asyncio.run(manager.save_relationships(employee, 1, get_entity_metadata(Employee)))
+
+        assert employee.company.id == 2
+        assert len(queries) == 2
+        assert "CREATE (n:Company)" in queries[0]
+        assert "RETURN id(n) as node_id" in queries[0]
+        assert "WORKS_FOR" in queries[1]
+
+    def test_async_cascade_creates_shared_descendant_once(self):
+        """Test an unsaved entity reached through two concurrent branches is created once."""
+        import asyncio
+
+        from falkordb_orm.async_mapper import AsyncEntityMapper
+        from falkordb_orm.async_relationships import AsyncRelationshipManager
+        from falkordb_orm.query_builder import QueryBuilder
+
+        created = []
+
+        async def mock_query(cypher, params):
+            await asyncio.sleep(0)
+            if cypher.startswith("UNWIND $rows"):
+                created.append(params["rows"][0]["props"]["name"])
+                return Mock(result_set=[[len(created) + 1]])
+            return Mock(result_set=[])
+
+        graph = Mock()
+        graph.query = mock_query
+        query_builder = QueryBuilder()
+        mapper = AsyncEntityMapper(graph=graph, query_builder=query_builder)
+
+        manager = AsyncRelationshipManager(graph, mapper, query_builder)
+
+        # A -> B, A -> C, B -> D, C -> D
+        a = Person(name="A", age=1)
+        a.id = 1
+        b = Person(name="B", age=2)
+        c = Person(name="C", age=3)
+        d = Person(name="D", age=4)
+        a.friends = [b, c]
+        b.friends = [d]
+        c.friends = [d]
+
+        asyncio.run(manager.save_relationships(a, 1, get_entity_metadata(Person)))
+
+        assert sorted(created) == ["B", "C", "D"]
+
+    def test_async_concurrent_saves_track_entities_separately(self):
+        """Test concurrent async saves of the same entity each create their edges."""
+        import asyncio
+
+        from falkordb_orm.async_relationships import AsyncRelationshipManager
+        from falkordb_orm.query_builder import QueryBuilder
+
+        queries = []
+
+        async def mock_query(cypher, params):
+            queries.append((cypher, params))
+            await asyncio.sleep(0)
+            return Mock(result_set=[])
+
+        graph = Mock()
+        graph.query = mock_query
+
+        mapper = Mock()
+        mapper.get_entity_metadata = lambda cls: get_entity_metadata(cls)
+
+        manager = AsyncRelationshipManager(graph, mapper, QueryBuilder())
+
+        alice = Person(name="Alice", age=30)
+        alice.id = 1
+        bob = Person(name="Bob", age=28)
+        bob.id = 2
+        alice.friends = [bob]
+
+        async def save_twice():
+            metadata = get_entity_metadata(Person)
+            await asyncio.gather(
+                manager.save_relationships(alice, 1, metadata),
+                manager.save_relationships(alice, 1, metadata),
+            )
+
+        asyncio.run(save_twice())
+
+        assert len(queries) == 2
+
 
 class TestBidirectionalRelationships:
     """Test bidirectional relationship handling."""
@@ -33,7 +33,9 @@ def test_node_decorator_with_list_labels():
     metadata = get_entity_metadata(Person)
     assert metadata is not None
     assert metadata.labels == ["Person", "Individual"]
+    assert metadata.labels_str == "Person:Individual"
     assert metadata.primary_label == "Person"
+    assert metadata.get_property_by_python_name("name").param_name == "prop_name"
 
 
 def test_node_decorator_without_label():
@@ -131,6 +133,7 @@ def test_property_metadata_extraction():
     assert "name" in prop_names
     assert "email" in prop_names
     assert "age" in prop_names
+    assert metadata.property_names == tuple(prop_names)
 
 
 def test_entity_instantiation():
@@ -150,3 +153,123 @@ def test_entity_instantiation():
 
     metadata = get_entity_metadata(Person)
     assert metadata is not None
+
+
+def test_slotted_entity_detection():
+    """Test that slotted entities are flagged and default unset slots to None."""
+
+    @node("Person")
+    class Person:
+        __slots__ = ("id", "name", "age")
+        id: Optional[int]
+        name: str
+        age: int
+
+    @node("Plain")
+    class Plain:
+        id: Optional[int] = None
+        name: str
+
+    assert get_entity_metadata(Person).uses_slots is True
+    assert get_entity_metadata(Plain).uses_slots is False
+
+    person = Person(name="Alice")
+    assert person.name == "Alice"
+    assert person.id is None
+    assert person.age is None
+    assert not hasattr(person, "__dict__")
+
+
+def test_entity_setattr_not_wrapped():
+    """Test that @node leaves attribute assignment on the plain object path."""
+
+    @node("Person")
+    class Person:
+        id: Optional[int] = None
+        name: str
+        age: int
+
+    assert Person.__setattr__ is object.__setattr__
+
+    person = Person(name="Alice", age=25)
+    person.age = 26
+    assert vars(person) == {"id": None, "name": "Alice", "age": 26}
+
+
+def test_descriptor_values_stored_under_attribute_name():
+    """Test that descriptor-backed values are plain instance attributes."""
+
+    @node("Person")
+    class Person:
+        id: Optional[int] = generated_id()
+        name: str = property()
+
+    person = Person(name="Alice")
+    assert person.__dict__["name"] == "Alice"
+    assert person.id is None
+
+    person.id = 7
+    assert vars(person)["id"] == 7
+
+
+def test_inherited_descriptors_are_mapped():
+    """Test that descriptors declared on a base class are picked up."""
+
+    class Base:
+        name: str = property("full_name")
+
+    @node("Child")
+    class Child(Base):
+        id: Optional[int] = generated_id()
+        age: int = property()
+
+    metadata = get_entity_metadata(Child)
+    assert metadata.property_names == ("age", "id", "name")
+    assert metadata.get_property_by_python_name("name").graph_name == "full_name"
+
+
+def test_resolve_relationship_target():
+    """Test resolving relationship targets from type hints."""
+    from typing import List
+
+    from falkordb_orm.decorators import _resolve_target
+
+    @node("Company")
+    class Company:
+        id: Optional[int] = None
+
+    # Deliberately left undecorated: a forward reference only resolves to its name
+    class Person:
+        pass
+
+    assert _resolve_target(List[Company]) == (Company, "Company", True)
+    assert _resolve_target(Optional[Company]) == (Company, "Company", False)
+    assert _resolve_target(List["Person"]) == (None, "Person", True)
+    assert _resolve_target(int) == (None, None, False)
+
+
+def test_type_hints_with_and_without_forward_references():
+    """Test that plain and string annotations resolve to the same metadata."""
+    from typing import List
+
+    from falkordb_orm.decorators import relationship
+
+    @node("Company")
+    class Company:
+        id: Optional[int] = None
+        name: str
+
+    @node("Employee")
+    class Employee:
+        id: Optional[int] = None
+        age: "int"
+        employer: Optional[Company] = relationship("WORKS_FOR")
+        colleagues: List["Employee"] = relationship("KNOWS")
+
+    company_meta = get_entity_metadata(Company)
+    assert company_meta.get_property_by_python_name("name").python_type is str
+
+    employee_meta = get_entity_metadata(Employee)
+    assert employee_meta.get_property_by_python_name("age").python_type in (int, "int")
+    assert employee_meta.get_relationship_by_python_name("employer").target_class is Company
+    assert employee_meta.get_relationship_by_python_name("colleagues").is_collection
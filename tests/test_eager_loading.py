@@ -134,6 +134,52 @@ class TestEagerLoading:
         assert "OPTIONAL MATCH" in cypher
         assert "KNOWS" in cypher
 
+    def test_eager_loading_query_all_pages_root_nodes(self):
+        """Test a pageable slices the root nodes before relationships are expanded."""
+        from falkordb_orm.metadata import get_entity_metadata
+        from falkordb_orm.pagination import Pageable
+        from falkordb_orm.query_builder import QueryBuilder
+
+        cypher, _ = QueryBuilder().build_eager_loading_query_all(
+            get_entity_metadata(Person),
+            ["friends"],
+            Pageable(page=1, size=10, sort_by="name", direction="ASC"),
+        )
+
+        window = cypher.index("WITH n ORDER BY n.name ASC SKIP 10 LIMIT 10")
+        assert window < cypher.index("OPTIONAL MATCH")
+        assert cypher.endswith("ORDER BY n.name ASC")
+
+    def test_eager_fragments_resolved_once(self):
+        """Test eager fragments resolve forward references and are cached."""
+        from falkordb_orm.metadata import get_entity_metadata
+
+        metadata = get_entity_metadata(Developer)
+        metadata.eager_fragments.clear()
+
+        fragment = metadata.get_eager_fragment("team")
+
+        assert fragment == ("-[:MEMBER_OF]->", "Team")
+        assert metadata.eager_fragments == {"team": fragment}
+        assert metadata.get_eager_fragment("team") is fragment
+        assert metadata.get_eager_fragment("missing") is None
+
+    def test_eager_loading_query_reused_for_same_hints(self):
+        """Test the same fetch hints reuse one cached query string."""
+        from falkordb_orm.metadata import get_entity_metadata
+        from falkordb_orm.query_builder import QueryBuilder
+
+        builder = QueryBuilder()
+        metadata = get_entity_metadata(Person)
+
+        first, _ = builder.build_eager_loading_query_all(metadata, ("friends", "company"))
+        second, _ = builder.build_eager_loading_query_all(metadata, ["friends", "company"])
+        by_id, params = builder.build_eager_loading_query(metadata, 7, ("friends", "unknown"))
+
+        assert second is first
+        assert "unknown" not in by_id
+        assert params == {"id": 7}
+
     def test_multiple_fetch_hints(self):
         """Test eager loading with multiple fetch hints."""
         # Setup mocks
@@ -231,6 +277,31 @@ class TestEagerLoading:
         # Should collect relationships
         assert "collect" in cypher.lower()
 
+    def test_eager_loading_maps_list_record_columns(self):
+        """Test related nodes are read from their header column in list records."""
+        graph = Mock()
+        graph.query = Mock(
+            return_value=Mock(
+                result_set=[
+                    [
+                        Mock(properties={"name": "Dev Team"}, id=1),
+                        [
+                            Mock(properties={"name": "Alice"}, id=2),
+                            None,
+                            Mock(properties={"name": "Bob"}, id=3),
+                        ],
+                    ]
+                ],
+                header=[[0, "n"], [1, "members"]],
+            )
+        )
+
+        repo = Repository(graph, Team)
+        team = repo.find_by_id(1, fetch=["members"])
+
+        assert team.name == "Dev Team"
+        assert [member.name for member in team.members] == ["Alice", "Bob"]
+
     def test_eager_loading_single_relationship(self):
         """Test eager loading of single (Optional) relationships."""
         # Setup mocks
@@ -0,0 +1,52 @@
+"""Tests for ORM exceptions."""
+
+import pickle
+
+from falkordb_orm.exceptions import (
+    EntityNotFoundException,
+    FalkorDBORMException,
+    QueryException,
+)
+
+
+class TestExceptionFormatting:
+    """Test exception message formatting."""
+
+    def test_str_includes_details(self):
+        """Test that str() appends the details to the message."""
+        error = QueryException("Query failed", query="MATCH (n) RETURN n")
+
+        assert str(error) == "Query failed (query=MATCH (n) RETURN n)"
+        assert error.args == ("Query failed",)
+
+    def test_str_without_details(self):
+        """Test that an exception without details shows only its message."""
+        assert str(FalkorDBORMException("Something broke")) == "Something broke"
+
+    def test_str_reflects_later_detail_changes(self):
+        """Test that details added after construction show up in the message."""
+        error = FalkorDBORMException("Save failed", {"entity_type": "Person"})
+        assert str(error) == "Save failed (entity_type=Person)"
+
+        error.details["entity_id"] = 7
+        assert str(error) == "Save failed (entity_type=Person, entity_id=7)"
+
+    def test_repr_shows_formatted_message(self):
+        """Test that repr() shows the class name and the formatted message."""
+        error = EntityNotFoundException("Person not found", entity_type="Person", entity_id=1)
+
+        assert repr(error) == (
+            "EntityNotFoundException('Person not found (entity_type=Person, entity_id=1)')"
+        )
+
+    def test_pickle_round_trip(self):
+        """Test that exceptions keep their message and details through pickling."""
+        error = QueryException("Query failed", query="MATCH (n) RETURN n", params={"id": 1})
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is QueryException
+        assert restored.message == "Query failed"
+        assert restored.details == {"query": "MATCH (n) RETURN n", "params": {"id": 1}}
+        assert str(restored) == str(error)
+        assert repr(restored) == repr(error)
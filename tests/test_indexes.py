@@ -105,6 +105,71 @@ class TestIndexManager:
         queries2 = manager.ensure_indexes(TestPerson)
         assert len(queries2) >= 2
 
+    def test_ensure_indexes_skips_existing(self):
+        """Test ensure_indexes only creates indexes missing from db.indexes()."""
+        graph = Mock()
+        graph.query = Mock(
+            return_value=Mock(
+                result_set=[["TestProduct", "sku", "UNIQUE"], ["TestProduct", "price", "RANGE"]]
+            )
+        )
+
+        manager = IndexManager(graph)
+        queries = manager.ensure_indexes(TestProduct)
+
+        assert len(queries) == 1
+        assert "category" in queries[0]
+        # One db.indexes() call plus the missing index
+        assert graph.query.call_count == 2
+
+        graph.query.reset_mock()
+        graph.query.return_value = Mock(
+            result_set=[
+                ["TestProduct", "sku", "UNIQUE"],
+                ["TestProduct", "category", "RANGE"],
+                ["TestProduct", "price", "RANGE"],
+            ]
+        )
+
+        assert manager.ensure_indexes(TestProduct) == []
+        graph.query.assert_called_once()
+        assert "db.indexes()" in graph.query.call_args[0][0]
+
+    def test_ensure_indexes_reads_server_index_format(self):
+        """Test list-valued properties and db.constraints() are read as the server reports them."""
+        graph = Mock()
+        queries = []
+
+        def mock_query(cypher, params=None):
+            queries.append(cypher)
+            if "db.indexes()" in cypher:
+                return Mock(
+                    result_set=[
+                        [
+                            "TestProduct",
+                            ["sku", "category", "price"],
+                            {"sku": ["RANGE"], "category": ["RANGE"], "price": ["RANGE"]},
+                        ]
+                    ]
+                )
+            if "db.constraints()" in cypher:
+                return Mock(result_set=[["UNIQUE", "TestProduct", ["sku"]]])
+            return Mock(result_set=[])
+
+        graph.query = mock_query
+        manager = IndexManager(graph)
+
+        indexes = manager.list_indexes(TestProduct)
+        assert [(idx.property_name, idx.index_type) for idx in indexes] == [
+            ("sku", "RANGE"),
+            ("category", "RANGE"),
+            ("price", "RANGE"),
+        ]
+
+        queries.clear()
+        assert manager.ensure_indexes(TestProduct) == []
+        assert len(queries) == 2
+
     def test_list_indexes(self):
         """Test listing indexes."""
         graph = Mock()
@@ -143,6 +208,31 @@ class TestIndexManager:
         assert len(indexes) == 1
         assert indexes[0].label == "TestPerson"
 
+    def test_list_indexes_filters_on_server(self):
+        """Test list_indexes passes the entity label to db.indexes()."""
+        graph = Mock()
+        graph.query = Mock(return_value=Mock(result_set=[["TestPerson", "age", "RANGE"]]))
+
+        manager = IndexManager(graph)
+        indexes = manager.list_indexes(TestPerson)
+
+        cypher, params = graph.query.call_args[0]
+        assert "WHERE label = $label" in cypher
+        assert params == {"label": "TestPerson"}
+        assert [idx.property_name for idx in indexes] == ["age"]
+
+    def test_list_indexes_falls_back_without_yield_support(self):
+        """Test list_indexes retries unfiltered when the filtered call fails."""
+        graph = Mock()
+        result = Mock(result_set=[["TestPerson", "age", "RANGE"], ["Other", "x", "RANGE"]])
+        graph.query = Mock(side_effect=[Exception("syntax error"), result])
+
+        manager = IndexManager(graph)
+        indexes = manager.list_indexes(TestPerson)
+
+        assert graph.query.call_args[0] == ("CALL db.indexes()",)
+        assert [idx.label for idx in indexes] == ["TestPerson"]
+
     def test_create_index_for_property_manual(self):
         """Test manual index creation for specific property."""
         graph = Mock()
@@ -167,6 +257,18 @@ class TestIndexManager:
         assert "ssn" in query
         assert "UNIQUE" in query
 
+    def test_create_index_rejects_unsafe_names(self):
+        """Test names that could alter the DDL are rejected before querying."""
+        graph = Mock()
+        manager = IndexManager(graph)
+
+        with pytest.raises(ValueError, match="Invalid property name"):
+            manager.create_index_for_property("Person", "email) DETACH DELETE n //")
+        with pytest.raises(ValueError, match="Invalid label"):
+            manager.drop_index_for_property("Person')", "email")
+
+        assert not graph.query.called
+
     def test_drop_index_for_property(self):
         """Test dropping specific index."""
         graph = Mock()
@@ -200,6 +302,18 @@ class TestIndexManager:
         # TestProduct has 3 indexed fields: sku (unique), category, price
         assert len(queries) >= 3
 
+    def test_index_queries_are_built_once(self):
+        """Test repeated calls reuse the same query strings."""
+        graph = Mock()
+        graph.query = Mock(return_value=Mock(result_set=[]))
+
+        manager = IndexManager(graph)
+        first = manager.create_indexes(TestProduct)
+        second = IndexManager(graph).create_indexes(TestProduct)
+
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
     def test_no_indexes_for_non_decorated_class(self):
         """Test error when class is not decorated."""
         graph = Mock()
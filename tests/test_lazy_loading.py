@@ -1,9 +1,15 @@
 """Tests for lazy loading of relationships."""
 
+import asyncio
 from typing import List, Optional
 from unittest.mock import Mock
 
+import pytest
+
+from falkordb_orm.async_mapper import AsyncEntityMapper
+from falkordb_orm.async_relationships import AsyncLazyList
 from falkordb_orm.decorators import node, generated_id, relationship
+from falkordb_orm.query_builder import QueryBuilder
 from falkordb_orm.relationships import LazyList, LazySingle, create_lazy_proxy
 from falkordb_orm.metadata import RelationshipMetadata
 
@@ -28,6 +34,36 @@ class Employee:
     company: Optional[Company] = relationship("WORKS_FOR", target=Company)
 
 
+@pytest.fixture
+def async_graph():
+    """
+    Factory for mock graphs whose async query records each call and returns fixed rows.
+
+    The factory takes the rows to return, an optional result header and an optional
+    error to raise instead, and returns a (graph, queries) tuple where queries collects
+    the (cypher, params) pair of every call.
+    """
+
+    def build(result_set=None, header=None, error=None):
+        queries = []
+
+        async def mock_query(cypher, params=None):
+            queries.append((cypher, params))
+            if error is not None:
+                raise error
+            result = Mock()
+            result.result_set = [] if result_set is None else result_set
+            if header is not None:
+                result.header = header
+            return result
+
+        graph = Mock()
+        graph.query = mock_query
+        return graph, queries
+
+    return build
+
+
 class TestLazyList:
     """Tests for LazyList proxy."""
 
@@ -506,3 +542,159 @@ class TestCreateLazyProxy:
         )
 
         assert isinstance(proxy, LazySingle)
+
+
+class TestLazyProxySlots:
+    """Tests for the slotted layout of lazy proxies."""
+
+    def test_lazy_proxies_have_no_instance_dict(self):
+        """Test lazy proxies store their state in slots."""
+        from falkordb_orm.async_relationships import AsyncLazyList, AsyncLazySingle
+
+        rel_meta = RelationshipMetadata(
+            python_name="friends", relationship_type="KNOWS", direction="OUTGOING"
+        )
+
+        for proxy_class in (LazyList, LazySingle, AsyncLazyList, AsyncLazySingle):
+            proxy = proxy_class(Mock(), 1, rel_meta, Person, Mock(), Mock())
+            with pytest.raises(AttributeError):
+                object.__setattr__(proxy, "unexpected", 1)
+
+
+class TestRelationshipBatchLoader:
+    """Tests for batching async lazy relationship loads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_query(self, async_graph):
+        """Test that loads awaited together are fetched with a single query."""
+        graph, queries = async_graph(
+            [
+                [Mock(id=10, properties={"name": "Bob"}), 1],
+                [Mock(id=11, properties={"name": "Carol"}), 1],
+                [Mock(id=12, properties={"name": "Dave"}), 2],
+            ],
+            header=[[1, "target"], [1, "source_id"]],
+        )
+        mapper = AsyncEntityMapper(graph=graph, query_builder=QueryBuilder())
+        rel_meta = mapper.get_entity_metadata(Person).relationships[0]
+
+        proxies = [
+            AsyncLazyList(
+                graph=graph,
+                source_id=source_id,
+                relationship_meta=rel_meta,
+                entity_class=Person,
+                mapper=mapper,
+                query_builder=mapper._query_builder,
+                loader=mapper._batch_loader,
+            )
+            for source_id in (1, 2)
+        ]
+
+        first, second = await asyncio.gather(*(proxy.load() for proxy in proxies))
+
+        assert len(queries) == 1
+        assert queries[0][1] == {"source_ids": [1, 2]}
+        assert [p.name for p in first] == ["Bob", "Carol"]
+        assert [p.name for p in second] == ["Dave"]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_waiter(self, async_graph):
+        """Test a failed batch query fails each waiting load and releases its task."""
+        graph, _ = async_graph(error=RuntimeError("connection lost"))
+        mapper = AsyncEntityMapper(graph=graph, query_builder=QueryBuilder())
+        loader = mapper._batch_loader
+        rel_meta = mapper.get_entity_metadata(Person).relationships[0]
+
+        futures = [loader.load(rel_meta, Person, source_id) for source_id in (1, 2)]
+        await asyncio.sleep(0)
+        assert len(loader._tasks) == 1
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        assert [str(error) for error in results] == ["connection lost", "connection lost"]
+        assert not loader._tasks
+
+
+class TestAsyncLazyListStream:
+    """Tests for streaming async lazy lists."""
+
+    @pytest.mark.asyncio
+    async def test_iteration_streams_then_serves_cache(self, async_graph):
+        """Test that async iteration maps rows as it goes and caches them for later passes."""
+        graph, queries = async_graph(
+            [
+                [Mock(id=10, properties={"name": "Bob"})],
+                [Mock(id=11, properties={"name": "Carol"})],
+            ]
+        )
+        mapper = AsyncEntityMapper(graph=graph, query_builder=QueryBuilder())
+
+        proxy = AsyncLazyList(
+            graph=graph,
+            source_id=1,
+            relationship_meta=mapper.get_entity_metadata(Person).relationships[0],
+            entity_class=Person,
+            mapper=mapper,
+            query_builder=mapper._query_builder,
+        )
+
+        first = [person.name async for person in proxy]
+        second = [person.name async for person in proxy]
+        loaded = await proxy.load()
+
+        assert first == second == ["Bob", "Carol"]
+        assert [person.name for person in loaded] == ["Bob", "Carol"]
+        assert len(queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_iteration_uses_batch_loader(self, async_graph):
+        """Test that iterating proxies with a loader coalesces their loads."""
+        graph, queries = async_graph(
+            [
+                [Mock(id=10, properties={"name": "Bob"}), 1],
+                [Mock(id=12, properties={"name": "Dave"}), 2],
+            ],
+            header=[[1, "target"], [1, "source_id"]],
+        )
+        mapper = AsyncEntityMapper(graph=graph, query_builder=QueryBuilder())
+        rel_meta = mapper.get_entity_metadata(Person).relationships[0]
+
+        proxies = [
+            AsyncLazyList(
+                graph,
+                source_id,
+                rel_meta,
+                Person,
+                mapper,
+                mapper._query_builder,
+                loader=mapper._batch_loader,
+            )
+            for source_id in (1, 2)
+        ]
+
+        async def collect(proxy):
+            return [person.name async for person in proxy]
+
+        assert await asyncio.gather(*(collect(proxy) for proxy in proxies)) == [["Bob"], ["Dave"]]
+        assert [params for _, params in queries] == [{"source_ids": [1, 2]}]
+
+    @pytest.mark.asyncio
+    async def test_projected_load_fetches_only_selected_properties(self, async_graph):
+        """Test that a relationship declared with only= loads projected columns."""
+
+        @node("Member")
+        class Member:
+            id: Optional[int] = generated_id()
+            name: str
+            friends: List[Person] = relationship("KNOWS", target=Person, only=["name"])
+
+        graph, queries = async_graph([[10, "Bob"], [11, "Carol"]])
+        mapper = AsyncEntityMapper(graph=graph, query_builder=QueryBuilder())
+
+        member = await mapper.map_from_node(Mock(id=1, properties={"name": "Ann"}), Member)
+        people = await member.friends.load()
+
+        assert member.friends._only == ("name",)
+        assert "target.name AS name" in queries[0][0]
+        assert [p.name for p in people] == ["Bob", "Carol"]
@@ -77,6 +77,22 @@ def test_map_to_cypher_create():
     assert params["prop_age"] == 30
 
 
+def test_map_to_cypher_create_reuses_statement():
+    """Test entities setting the same properties share one rendered statement."""
+    mapper = EntityMapper()
+    alice = Person(id=None, name="Alice", email="alice@example.com", age=30)
+    bob = Person(id=None, name="Bob", email="bob@example.com", age=25)
+    carol = Person(id=None, name="Carol", email=None, age=41)
+
+    alice_cypher, _ = mapper.map_to_cypher_create(alice)
+    bob_cypher, bob_params = mapper.map_to_cypher_create(bob)
+    carol_cypher, _ = mapper.map_to_cypher_create(carol)
+
+    assert bob_cypher is alice_cypher
+    assert bob_params["prop_name"] == "Bob"
+    assert "email" not in carol_cypher
+
+
 def test_map_to_cypher_merge():
     """Test generating MERGE Cypher statement."""
     mapper = EntityMapper()
@@ -90,6 +106,44 @@ def test_map_to_cypher_merge():
     assert params["id"] == 1
 
 
+def test_map_to_cypher_create_batch():
+    """Test generating one CREATE statement for several entities."""
+    from falkordb_orm.decorators import interned
+
+    @node("Citizen")
+    class Citizen:
+        id: Optional[int] = generated_id()
+        name: str
+        country: str = interned()
+
+    mapper = EntityMapper()
+    alice = Citizen(name="Alice", country="France")
+    bob = Citizen(name="Bob")
+
+    cypher, params = mapper.map_to_cypher_create_batch([alice, bob])
+
+    assert cypher.startswith("UNWIND $rows AS row CREATE (n:Citizen)")
+    assert "n += row.props" in cypher
+    assert "intern(row.interned.country)" in cypher
+    assert params["rows"] == [
+        {"props": {"name": "Alice"}, "interned": {"country": "France"}},
+        {"props": {"name": "Bob"}, "interned": {}},
+    ]
+
+
+def test_map_to_cypher_merge_batch():
+    """Test generating one MERGE statement for several entities."""
+    mapper = EntityMapper()
+    alice = Person(id=1, name="Alice", email="alice@example.com", age=30)
+    bob = Person(id=2, name="Bob", email="bob@example.com", age=25)
+
+    cypher, params = mapper.map_to_cypher_merge_batch([alice, bob])
+
+    assert "MERGE (n:Person {id: row.id})" in cypher
+    assert [row["id"] for row in params["rows"]] == [1, 2]
+    assert "id" not in params["rows"][0]["props"]
+
+
 def test_map_from_node():
     """Test mapping FalkorDB node to entity."""
 
@@ -138,3 +192,87 @@ def test_map_to_properties_with_auto_generated_id():
     # Auto-generated ID should be skipped if None
     assert "name" in props
     assert props["name"] == "Bob"
+
+
+def test_async_mapper_builds_slotted_entity():
+    """Test async mapper populates slotted entities directly."""
+    import asyncio
+    from unittest.mock import Mock
+
+    from falkordb_orm.async_mapper import AsyncEntityMapper
+
+    @node("SlottedPerson")
+    class SlottedPerson:
+        __slots__ = ("id", "name", "age")
+        id: Optional[int]
+        name: str
+        age: int
+
+    mapper = AsyncEntityMapper()
+    graph_node = Mock(id=None, properties={"id": 7, "name": "Alice", "age": 30})
+
+    entity = asyncio.run(mapper.map_from_node(graph_node, SlottedPerson))
+
+    assert isinstance(entity, SlottedPerson)
+    assert entity.id == 7
+    assert entity.name == "Alice"
+    assert entity.age == 30
+
+
+def test_property_codecs_follow_registered_converters():
+    """Test converters registered after first use are picked up."""
+    from falkordb_orm.types import TypeConverter, TypeRegistry
+
+    class Email:
+        def __init__(self, address: str):
+            self.address = address
+
+    class EmailConverter(TypeConverter):
+        def to_graph(self, value):
+            return value.address
+
+        def from_graph(self, value):
+            return Email(value)
+
+    @node("Contact")
+    class Contact:
+        id: Optional[int] = None
+        email: Optional[Email] = None
+
+    mapper = EntityMapper()
+    mapper._type_registry = TypeRegistry()
+    contact = Contact(id=1, email=Email("alice@example.com"))
+
+    assert mapper.map_to_properties(contact)["email"] is contact.email
+
+    mapper._type_registry.register(Email, EmailConverter())
+
+    assert mapper.map_to_properties(contact)["email"] == "alice@example.com"
+
+    class MockNode:
+        id = 1
+        properties = {"id": 1, "email": "bob@example.com"}
+
+    entity = mapper.map_from_node(MockNode(), Contact)
+    assert isinstance(entity.email, Email)
+    assert entity.email.address == "bob@example.com"
+
+
+def test_map_from_record_uses_header_column():
+    """Test list records are read from the column named in the header."""
+
+    class MockNode:
+        def __init__(self, name):
+            self.id = 1
+            self.properties = {"name": name, "email": f"{name}@example.com", "age": 30}
+
+    mapper = EntityMapper()
+    header = [[1, "node_id"], [1, "n"]]
+    rows = [[10, MockNode("alice")], [11, MockNode("bob")]]
+
+    names = [mapper.map_from_record(row, Person, header=header).name for row in rows]
+
+    assert names == ["alice", "bob"]
+    assert mapper.column_index(header, "node_id") == 0
+    assert mapper.column_index([[1, "n"]], "n") == 0
+    assert mapper.column_index([[1, "n"]], "missing") is None
@@ -4,7 +4,16 @@ import pytest
 from typing import Optional
 from unittest.mock import Mock
 
-from falkordb_orm import node, generated_id, Repository, Pageable, Page
+from falkordb_orm import (
+    node,
+    generated_id,
+    Repository,
+    Pageable,
+    Page,
+    Slice,
+    CountCache,
+    Keyset,
+)
 
 
 @node("Person")
@@ -74,6 +83,17 @@ class TestPageable:
         assert first_page.size == 10
         assert first_page.sort_by == "age"
 
+    def test_pageable_can_be_changed_in_place(self):
+        """Test Pageable fields can be updated and derived values follow."""
+        pageable = Pageable(page=1, size=10)
+
+        pageable.page = 3
+        pageable.size = 20
+        pageable.sort_by = "name"
+
+        assert pageable.skip() == 60
+        assert pageable.next() == Pageable(page=4, size=20, sort_by="name")
+
     def test_pageable_validation_negative_page(self):
         """Test that negative page number raises error."""
         with pytest.raises(ValueError, match="Page number must be >= 0"):
@@ -121,6 +141,15 @@ class TestPage:
         page4 = Page(content=[], page_number=0, page_size=10, total_elements=0)
         assert page4.total_pages == 0
 
+    def test_page_count_follows_in_place_changes(self):
+        """Test the page count reflects metadata changed after construction."""
+        page = Page(content=[], page_number=0, page_size=10, total_elements=25)
+        assert page.total_pages == 3
+
+        page.total_elements = 5
+        assert page.total_pages == 1
+        assert page.is_last()
+
     def test_page_has_next(self):
         """Test has_next method."""
         # First page with more pages
@@ -321,6 +350,120 @@ class TestRepositoryPagination:
         assert page.has_next() is False
 
 
+class TestSlicePagination:
+    """Test count-free pagination with a probe row."""
+
+    def _page_result(self, count):
+        return Mock(
+            result_set=[[Mock(properties={"name": f"P{i}", "age": i}, id=i)] for i in range(count)],
+            header=[[0, "n"]],
+        )
+
+    def test_find_all_slice_detects_next_page(self):
+        """Test the extra row sets has_more and is dropped from the content."""
+        graph = Mock()
+        graph.query = Mock(return_value=self._page_result(3))
+
+        repo = Repository(graph, Person)
+        page = repo.find_all_slice(Pageable(page=1, size=2))
+
+        assert graph.query.call_count == 1
+        cypher = graph.query.call_args[0][0]
+        assert "SKIP 2 LIMIT 3" in cypher
+        assert "count(" not in cypher
+        assert isinstance(page, Slice)
+        assert [p.name for p in page] == ["P0", "P1"]
+        assert page.has_next() is True
+        assert page.has_previous() is True
+
+    def test_find_all_slice_last_page(self):
+        """Test a short result marks the last page."""
+        graph = Mock()
+        graph.query = Mock(return_value=self._page_result(2))
+
+        page = Repository(graph, Person).find_all_slice(Pageable(page=0, size=2))
+
+        assert len(page) == 2
+        assert page.is_last() is True
+        assert page.has_next() is False
+
+    def test_probe_row_stays_internal_to_slices(self):
+        """Test only find_all_slice fetches past the page size."""
+        graph = Mock()
+        graph.query = Mock(side_effect=[Mock(result_set=[[9]]), self._page_result(5)])
+
+        pageable = Pageable(page=0, size=5)
+        page = Repository(graph, Person).find_all_paginated(pageable)
+
+        assert "LIMIT 5 " in graph.query.call_args[0][0]
+        assert isinstance(page, Page)
+        assert not hasattr(pageable, "fetch_plus_one")
+
+    def test_count_cache_reuses_count_until_expired(self):
+        """Test cached counts skip the count query within the TTL."""
+        now = [0.0]
+        cache = CountCache(ttl=30.0, clock=lambda: now[0])
+        graph = Mock()
+        graph.query = Mock(
+            side_effect=[Mock(result_set=[[7]]), self._page_result(1), self._page_result(1)]
+        )
+
+        repo = Repository(graph, Person, count_cache=cache)
+        first = repo.find_all_paginated(Pageable(page=0, size=5))
+        second = repo.find_all_paginated(Pageable(page=1, size=5))
+
+        assert graph.query.call_count == 3
+        assert first.total_elements == second.total_elements == 7
+
+        now[0] = 31.0
+        graph.query = Mock(side_effect=[Mock(result_set=[[8]]), self._page_result(1)])
+        assert repo.find_all_paginated(Pageable(page=0, size=5)).total_elements == 8
+
+
+class TestKeysetPagination:
+    """Test keyset (seek) pagination."""
+
+    def _keyset_result(self, names):
+        return Mock(
+            result_set=[
+                [Mock(properties={"name": name, "age": 30}, id=i), name]
+                for i, name in enumerate(names)
+            ],
+            header=[[0, "n"], [1, "cursor"]],
+        )
+
+    def test_first_page_has_no_cursor(self):
+        """Test the first page orders and limits without a cursor condition."""
+        graph = Mock()
+        graph.query = Mock(return_value=self._keyset_result(["Alice", "Bob", "Carol"]))
+
+        page = Repository(graph, Person).find_all_keyset(Keyset(sort_by="name", size=2))
+
+        cypher, params = graph.query.call_args[0]
+        assert cypher == (
+            "MATCH (n:Person) WITH n ORDER BY n.name ASC LIMIT 3 RETURN n, n.name AS cursor"
+        )
+        assert params == {}
+        assert [p.name for p in page] == ["Alice", "Bob"]
+        assert page.has_next() is True
+        assert page.next_keyset() == Keyset(sort_by="name", last_value="Bob", size=2)
+
+    def test_next_page_seeks_past_cursor(self):
+        """Test later pages filter on the cursor instead of using SKIP."""
+        graph = Mock()
+        graph.query = Mock(return_value=self._keyset_result(["Ann"]))
+
+        keyset = Keyset(sort_by="name", last_value="Bob", direction="DESC", size=2)
+        page = Repository(graph, Person).find_all_keyset(keyset)
+
+        cypher, params = graph.query.call_args[0]
+        assert "WHERE n.name < $cursor" in cypher
+        assert "SKIP" not in cypher
+        assert params == {"cursor": "Bob"}
+        assert page.has_next() is False
+        assert page.next_keyset() is None
+
+
 class TestPaginationNavigation:
     """Test page navigation patterns."""
 
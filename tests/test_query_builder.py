@@ -118,3 +118,190 @@ def test_build_exists_by_id_query():
     assert "Person" in cypher
     assert "count(n) > 0" in cypher
     assert params["id"] == 123
+
+
+def test_build_relationship_create_batch_query():
+    """Test building a batched relationship CREATE query."""
+    from falkordb_orm.metadata import RelationshipMetadata
+
+    builder = QueryBuilder()
+    rel_meta = RelationshipMetadata(
+        python_name="friends", relationship_type="KNOWS", direction="OUTGOING"
+    )
+    pairs = [{"source_id": 1, "target_id": 2}, {"source_id": 1, "target_id": 3}]
+
+    cypher, params = builder.build_relationship_create_batch_query(rel_meta, pairs)
+
+    assert "UNWIND $pairs AS pair" in cypher
+    assert "CREATE (source)-[:KNOWS]->(target)" in cypher
+    assert params == {"pairs": pairs}
+
+
+def test_build_relationship_load_query_with_projection():
+    """Test building a relationship load query that returns selected properties."""
+    import pytest
+
+    from falkordb_orm.metadata import RelationshipMetadata
+
+    builder = QueryBuilder()
+    rel_meta = RelationshipMetadata(
+        python_name="friends", relationship_type="KNOWS", direction="OUTGOING"
+    )
+
+    cypher, params = builder.build_relationship_load_query(rel_meta, 1, Person, ("name",))
+
+    assert "RETURN id(target) AS target_id, target.name AS name" in cypher
+    assert params == {"source_id": 1}
+
+    with pytest.raises(ValueError):
+        builder.build_relationship_load_query(rel_meta, 1, Person, ("nickname",))
+
+
+def test_build_derived_query_reuses_template():
+    """Test derived queries of the same shape share one query text."""
+    from falkordb_orm.query_parser import QueryParser
+
+    builder = QueryBuilder()
+    metadata = get_entity_metadata(Person)
+    spec = QueryParser().parse_method_name("find_by_name_and_age_between")
+
+    first, first_params = builder.build_derived_query(metadata, spec, ["Alice", 20, 30])
+    second, second_params = builder.build_derived_query(metadata, spec, ["Bob", 40, 50])
+
+    assert second is first
+    assert first_params == {"p0": "Alice", "p1": 20, "p2": 30}
+    assert second_params == {"p0": "Bob", "p1": 40, "p2": 50}
+
+
+def test_build_where_clause_operators():
+    """Test condition clauses and parameter numbering across operators."""
+    from falkordb_orm.query_parser import Condition, LogicalOperator, Operator
+
+    builder = QueryBuilder()
+    conditions = [
+        Condition("age", Operator.BETWEEN, 2),
+        Condition("email", Operator.IS_NULL, 0),
+        Condition("name", Operator.NOT_IN),
+    ]
+
+    clause, params = builder.build_where_clause(conditions, LogicalOperator.OR, [18, 65, ["Alice"]])
+
+    assert clause == "n.age >= $p0 AND n.age <= $p1 OR n.email IS NULL OR NOT n.name IN $p2"
+    assert params == {"p0": 18, "p1": 65, "p2": ["Alice"]}
+
+
+def test_derived_template_cache_is_per_query_kind():
+    """Test cached derived templates are not reused for count or paginated queries."""
+    from falkordb_orm.pagination import Pageable
+    from falkordb_orm.query_parser import QueryParser
+
+    builder = QueryBuilder()
+    metadata = get_entity_metadata(Person)
+    spec = QueryParser().parse_method_name("find_by_name")
+
+    builder.build_derived_query(metadata, spec, ["Alice"])
+    count_cypher, _ = builder.build_count_query_with_conditions(metadata, spec, ["Alice"])
+    page_cypher, _ = builder.build_paginated_derived_query(
+        metadata, spec, ["Alice"], Pageable(page=1, size=10)
+    )
+
+    assert "count(n)" in count_cypher
+    assert "LIMIT 10" in page_cypher
+
+
+def test_derived_query_limits_root_nodes_before_return():
+    """Test ORDER BY and LIMIT are applied to the matched nodes in a WITH clause."""
+    from falkordb_orm.pagination import Pageable
+    from falkordb_orm.query_parser import QueryParser
+
+    builder = QueryBuilder()
+    metadata = get_entity_metadata(Person)
+    spec = QueryParser().parse_method_name("find_top_10_by_age_order_by_name_asc")
+
+    cypher, params = builder.build_derived_query(metadata, spec, [30])
+    page_cypher, _ = builder.build_paginated_derived_query(
+        metadata, spec, [30], Pageable(page=2, size=5)
+    )
+
+    assert (
+        cypher
+        == "MATCH (n:Person) WHERE n.age = $p0 WITH n ORDER BY n.name ASC LIMIT $__limit RETURN n"
+    )
+    assert params == {"p0": 30, "__limit": 10}
+    assert page_cypher.endswith("WITH n ORDER BY n.name ASC SKIP 10 LIMIT 5 RETURN n")
+
+
+def test_build_keyset_query_with_conditions():
+    """Test keyset queries combine the cursor with extra conditions."""
+    from falkordb_orm.pagination import Keyset
+    from falkordb_orm.query_parser import Condition, Operator
+
+    builder = QueryBuilder()
+    metadata = get_entity_metadata(Person)
+    keyset = Keyset(sort_by="age", last_value=30, size=10)
+
+    cypher, params = builder.build_keyset_query(
+        metadata, keyset, [Condition("name", Operator.EQUALS)], ["Alice"]
+    )
+
+    assert cypher == (
+        "MATCH (n:Person) WHERE n.age > $cursor AND n.name = $p0 "
+        "WITH n ORDER BY n.age ASC LIMIT 11 RETURN n, n.age AS cursor"
+    )
+    assert params == {"p0": "Alice", "cursor": 30}
+
+
+def test_derived_query_binds_limit_as_parameter():
+    """Test limits share one cached template and reject non-integers."""
+    from dataclasses import replace
+
+    import pytest
+    from falkordb_orm.query_parser import QueryParser
+
+    builder = QueryBuilder()
+    metadata = get_entity_metadata(Person)
+    parser = QueryParser()
+
+    top5, params5 = builder.build_derived_query(
+        metadata, parser.parse_method_name("find_top_5_by_age"), [30]
+    )
+    top10, params10 = builder.build_derived_query(
+        metadata, parser.parse_method_name("find_top_10_by_age"), [40]
+    )
+
+    assert top5 is top10
+    assert params5 == {"p0": 30, "__limit": 5}
+    assert params10 == {"p0": 40, "__limit": 10}
+
+    spec = replace(
+        parser.parse_method_name("find_top_5_by_age"), limit="5; MATCH (m) DETACH DELETE m"
+    )
+    with pytest.raises(ValueError):
+        builder.build_derived_query(metadata, spec, [30])
+
+
+def test_id_scoped_queries_share_match_prefix():
+    """Test find/delete/exists by ID differ only in their trailing clause."""
+    builder = QueryBuilder()
+    auto = get_entity_metadata(AutoPerson)
+
+    find, params = builder.build_match_by_id_query(auto, 5)
+    delete, _ = builder.build_delete_by_id_query(auto, 5)
+    exists, _ = builder.build_exists_by_id_query(auto, 5)
+
+    assert find == "MATCH (n:AutoPerson) WHERE id(n) = $id RETURN n"
+    assert delete == "MATCH (n:AutoPerson) WHERE id(n) = $id DELETE n"
+    assert exists == "MATCH (n:AutoPerson) WHERE id(n) = $id RETURN count(n) > 0 as exists"
+    assert params == {"id": 5}
+    assert builder.build_match_by_id_query(auto, 6)[0] is find
+
+
+def test_root_window_keeps_zero_limit():
+    """Test a zero limit is applied rather than treated as no limit."""
+    builder = QueryBuilder()
+
+    assert builder._root_window(limit=0) == " WITH n LIMIT 0"
+    assert builder._root_window("ORDER BY n.age ASC", skip=0, limit=0) == (
+        " WITH n ORDER BY n.age ASC SKIP 0 LIMIT 0"
+    )
+    assert builder._root_window() == ""
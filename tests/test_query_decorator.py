@@ -0,0 +1,105 @@
+"""Tests for the custom query decorator."""
+
+from typing import List, Optional
+from unittest.mock import Mock
+
+from falkordb_orm import node, query, Repository
+
+
+@node("Person")
+class Person:
+    id: Optional[int] = None
+    name: str
+    age: int
+
+
+class PersonRepository(Repository[Person]):
+    @query("MATCH (p:Person) WHERE p.age > $min AND p.age < $max RETURN p", returns=Person)
+    def find_by_age_range(self, min: int, max: int):
+        pass
+
+    @query("MATCH (p:Person)-[:KNOWS]->(f:Person) RETURN f, p", returns=List[Person])
+    def find_friends(self):
+        pass
+
+    @query("MATCH (p:Person) RETURN count(p)", returns=int)
+    def count_people(self):
+        pass
+
+
+def test_positional_and_keyword_arguments_become_parameters():
+    """Test positional args are named from the method signature."""
+    graph = Mock()
+    graph.query = Mock(return_value=Mock(result_set=[]))
+    repo = PersonRepository(graph, Person)
+
+    repo.find_by_age_range(20, max=30)
+
+    assert graph.query.call_args[0][1] == {"min": 20, "max": 30}
+
+
+def test_parameter_names_read_once():
+    """Test the signature is inspected when the query is declared, not per call."""
+    method = PersonRepository.__dict__["find_by_age_range"]
+
+    assert method._param_names == ("min", "max")
+    assert method._build_parameters((1, 2, 3), {}) == {"min": 1, "max": 2}
+    assert method._build_parameters((), {"max": 9}) == {"max": 9}
+    assert method._build_parameters((1,), {"min": 5}) == {"min": 5}
+
+
+def test_parameter_names_follow_wrapped_methods():
+    """Test wrapped methods use the wrapped signature and only positional names."""
+    import functools
+
+    from falkordb_orm.query_decorator import _parameter_names
+
+    def find(self, name, limit=10, *rest, active=True):
+        pass
+
+    @functools.wraps(find)
+    def wrapper(*args, **kwargs):
+        return find(*args, **kwargs)
+
+    assert _parameter_names(find) == ("name", "limit")
+    assert _parameter_names(wrapper) == ("name", "limit")
+
+
+def test_result_handling_decided_at_declaration():
+    """Test the RETURN variable and entity type are resolved once per query."""
+    friends = PersonRepository.__dict__["find_friends"]
+
+    assert friends._var_name == "f"
+    assert friends._entity_type is Person
+    assert PersonRepository.__dict__["count_people"]._entity_type is None
+
+
+def test_results_mapped_by_declared_return_type():
+    """Test List[Entity] rows map from the RETURN variable and primitives unwrap."""
+    graph = Mock()
+    repo = PersonRepository(graph, Person)
+
+    graph.query = Mock(
+        return_value=Mock(
+            result_set=[[Mock(properties={"name": "Bob", "age": 40}, id=2), Mock()]],
+            header=[[0, "f"], [1, "p"]],
+        )
+    )
+    friends = repo.find_friends()
+
+    graph.query = Mock(return_value=Mock(result_set=[]))
+    empty_count = repo.count_people()
+
+    assert [friend.name for friend in friends] == ["Bob"]
+    assert empty_count == 0
+
+
+def test_return_variable_parsing():
+    """Test the RETURN variable comes from the last RETURN clause."""
+    from falkordb_orm.query_decorator import QueryMethod
+
+    parse = QueryMethod._compute_var_name
+
+    assert parse("MATCH (p:Person) RETURN p.name AS name") == "p"
+    assert parse("CALL { MATCH (a) RETURN a } MATCH (b)\nreturn DISTINCT b, a") == "b"
+    assert parse("MATCH (p:Person) DETACH DELETE p") == "n"
@@ -301,3 +301,18 @@ def test_parse_find_all_order_by():
     assert len(spec.ordering) == 1
     assert spec.ordering[0].property_name == "name"
     assert spec.ordering[0].direction == "ASC"
+
+
+def test_parse_results_shared_across_parsers():
+    """Test each method name is parsed once and the frozen spec is shared."""
+    from dataclasses import FrozenInstanceError
+
+    spec = QueryParser().parse_method_name("find_by_name_and_age_greater_than")
+
+    assert QueryParser().parse_method_name("find_by_name_and_age_greater_than") is spec
+    with pytest.raises(FrozenInstanceError):
+        spec.limit = 5
+    assert isinstance(spec.conditions, tuple)
+    assert isinstance(spec.ordering, tuple)
+    with pytest.raises(AttributeError):
+        spec.conditions.append(spec.conditions[0])
@@ -71,6 +71,8 @@ def test_relationship_with_incoming_direction():
 
     assert followers_rel is not None
     assert followers_rel.direction == "INCOMING"
+    assert followers_rel.pattern == "<-[:FOLLOWS]-"
+    assert followers_rel.bound_pattern == "<-[r:FOLLOWS]-"
 
 
 def test_relationship_with_both_direction():
@@ -87,6 +89,7 @@ def test_relationship_with_both_direction():
 
     assert connections_rel is not None
     assert connections_rel.direction == "BOTH"
+    assert connections_rel.pattern == "-[:CONNECTED]-"
 
 
 def test_relationship_with_cascade():
@@ -1,10 +1,11 @@
 """Tests for session management."""
 
+import asyncio
 import pytest
-from typing import Optional
-from unittest.mock import Mock
+from typing import List, Optional
+from unittest.mock import Mock, patch
 
-from falkordb_orm import node, property, generated_id
+from falkordb_orm import node, property, generated_id, relationship
 from falkordb_orm.session import Session
 from falkordb_orm.async_session import AsyncSession
 from falkordb_orm.exceptions import QueryException
@@ -20,6 +21,35 @@ class Person:
     email: Optional[str] = property()
 
 
+@pytest.fixture
+def async_graph():
+    """
+    Factory for mock graphs whose async query records each call and returns fixed rows.
+
+    The factory takes the rows to return (or a callable mapping query params to rows)
+    and an optional result header, and returns a (graph, queries) tuple where queries
+    collects the (cypher, params) pair of every call.
+    """
+
+    def build(result_set=None, header=None):
+        queries = []
+
+        async def mock_query(cypher, params=None):
+            queries.append((cypher, params))
+            result = Mock()
+            rows = result_set(params) if callable(result_set) else result_set
+            result.result_set = [] if rows is None else rows
+            if header is not None:
+                result.header = header
+            return result
+
+        graph = Mock()
+        graph.query = mock_query
+        return graph, queries
+
+    return build
+
+
 class TestSessionBasics:
     """Test basic session functionality."""
 
@@ -469,6 +499,23 @@ class TestChangeTracking:
 
         assert session._is_entity_modified(person)
 
+    def test_detect_in_place_container_changes(self):
+        """Test that flat and nested container mutations are both detected."""
+        graph = Mock()
+        session = Session(graph)
+
+        person = Person(id=1, name="Alice", age=25, email=["alice@example.com"])
+        session._capture_state(person)
+        assert session._original_state[id(person)]["email"] is not person.email
+
+        person.email.append("alice@work.com")
+        assert session._is_entity_modified(person)
+
+        person.email = [["alice@example.com"]]
+        session._capture_state(person)
+        person.email[0].append("alice@work.com")
+        assert session._is_entity_modified(person)
+
     def test_state_capture_on_get(self):
         """Test state is captured when entity is loaded."""
         graph = Mock()
@@ -567,6 +614,248 @@ class TestAsyncSession:
         assert not session.has_pending_changes
 
 
+class TestAsyncSessionGet:
+    """Test async session get caching."""
+
+    @pytest.mark.asyncio
+    async def test_get_remembers_missing_ids(self, async_graph):
+        """Test that a missing ID is queried once within the TTL when opted in."""
+        graph, queries = async_graph()
+        session = AsyncSession(graph, absent_ttl=5.0)
+
+        assert await session.get(Person, 42) is None
+        assert await session.get(Person, 42) is None
+        assert len(queries) == 1
+
+        # Without an explicit TTL, misses are never remembered
+        graph, queries = async_graph()
+        session = AsyncSession(graph)
+
+        assert await session.get(Person, 42) is None
+        assert await session.get(Person, 42) is None
+        assert len(queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_expire_after_ttl(self, async_graph):
+        """Test a remembered miss is queried again once its TTL has passed."""
+        graph, queries = async_graph()
+        session = AsyncSession(graph, absent_ttl=5.0)
+
+        now = [100.0]
+        with patch("falkordb_orm.async_session.time.monotonic", lambda: now[0]):
+            await session.get(Person, 42)
+            now[0] = 104.0
+            await session.get(Person, 42)
+            assert len(queries) == 1
+
+            now[0] = 106.0
+            await session.get(Person, 42)
+            assert len(queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_prefetches_relationships(self, async_graph):
+        """Test that prefetched relationships are loaded with the entity."""
+
+        @node("Member")
+        class Member:
+            id: Optional[int] = generated_id(generator=None)
+            name: str = property()
+            friends: List[Person] = relationship("KNOWS", target=Person)
+
+        graph, queries = async_graph(
+            [
+                {
+                    "n": Mock(id=1, properties={"name": "Alice"}),
+                    "friends": [Mock(id=2, properties={"name": "Bob"})],
+                }
+            ]
+        )
+        session = AsyncSession(graph)
+
+        member = await session.get(Member, 1, prefetch=("friends",))
+
+        assert len(queries) == 1
+        assert "OPTIONAL MATCH" in queries[0][0]
+        assert [friend.name for friend in member.friends] == ["Bob"]
+        assert session._identity_map[(Member, 1)] is member
+
+    @pytest.mark.asyncio
+    async def test_get_prefetch_maps_list_rows_by_header(self, async_graph):
+        """Test prefetch maps FalkorDB list rows through the result header."""
+
+        @node("Member")
+        class Member:
+            id: Optional[int] = generated_id()
+            name: str = property()
+            friends: List[Person] = relationship("KNOWS", target=Person)
+
+        graph, queries = async_graph(
+            [
+                [
+                    [Mock(id=2, properties={"name": "Bob"})],
+                    Mock(id=1, properties={"name": "Alice"}),
+                ]
+            ],
+            header=[[0, "friends"], [1, "n"]],
+        )
+        session = AsyncSession(graph)
+
+        member = await session.get(Member, 1, prefetch=("friends",))
+
+        assert queries[0][0].startswith("MATCH (n:Member) WHERE id(n) = $id")
+        assert member.name == "Alice"
+        assert [friend.name for friend in member.friends] == ["Bob"]
+
+    @pytest.mark.asyncio
+    async def test_get_prefetch_miss_not_remembered(self, async_graph):
+        """Test a prefetch miss does not hide the entity from later plain gets."""
+        graph, queries = async_graph()
+        session = AsyncSession(graph, absent_ttl=5.0)
+
+        await session.get(Person, 42, prefetch=("friends",))
+
+        assert await session.get(Person, 42) is None
+        assert len(queries) == 2
+
+
+class TestAsyncSessionChangeTracking:
+    """Test async session snapshot-based change tracking."""
+
+    def test_snapshot_detects_in_place_list_change(self):
+        """Test that mutating a list property marks the entity as modified."""
+        session = AsyncSession(Mock())
+        person = Person(name="Alice", age=25)
+        person.email = ["alice@example.com"]
+
+        session._capture_state(person)
+        assert not session._is_entity_modified(person)
+
+        person.email.append("alice@work.com")
+        assert session._is_entity_modified(person)
+
+    def test_assignment_marks_entity_modified(self):
+        """Test that assigning a property shows up in the snapshot diff."""
+        session = AsyncSession(Mock())
+        person = Person(name="Alice", age=25)
+
+        session._capture_state(person)
+        assert not session._is_entity_modified(person)
+
+        person.age = 26
+        assert session._is_entity_modified(person)
+
+        session._capture_state(person)
+        assert not session._is_entity_modified(person)
+
+    def test_snapshot_ignores_dict_order(self):
+        """Test that a dict rebuilt in another key order is not reported as modified."""
+        session = AsyncSession(Mock())
+        person = Person(name="Alice", age=25)
+        person.email = {"home": "a@example.com", "work": "a@work.com"}
+
+        session._capture_state(person)
+        person.email = {"work": "a@work.com", "home": "a@example.com"}
+
+        assert not session._is_entity_modified(person)
+
+    def test_snapshot_detects_container_type_change(self):
+        """Test that swapping a list for an equal tuple (or a set for a frozenset) is a change."""
+        session = AsyncSession(Mock())
+        person = Person(name="Alice", age=25)
+
+        for before, after in (
+            (["a", "b"], ("a", "b")),
+            (("a", "b"), ["a", "b"]),
+            ({"a"}, frozenset({"a"})),
+        ):
+            person.email = before
+            session._capture_state(person)
+            person.email = after
+            assert session._is_entity_modified(person)
+
+    @pytest.mark.asyncio
+    async def test_rollback_restores_snapshot(self):
+        """Test that rollback restores scalar and container values."""
+        session = AsyncSession(Mock())
+        person = Person(name="Alice", age=25)
+        person.email = {"home": "alice@example.com"}
+        session._identity_map[(Person, 1)] = person
+        session._capture_state(person)
+
+        person.age = 26
+        person.email["home"] = "changed@example.com"
+        await session.rollback()
+
+        assert person.age == 25
+        assert person.email == {"home": "alice@example.com"}
+
+
+class TestAsyncSessionFlush:
+    """Test async session flush concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_inserts_per_type(self, async_graph):
+        """Test that new entities of one type are inserted with a single query."""
+        graph, queries = async_graph(lambda params: [[10 + i] for i in range(len(params["rows"]))])
+
+        session = AsyncSession(graph)
+        people = [Person(name=f"Person {i}", age=20 + i) for i in range(3)]
+        for person in people:
+            session.add(person)
+
+        await session.flush()
+
+        assert len(queries) == 1
+        assert "UNWIND $rows AS row CREATE" in queries[0][0]
+        assert sorted(person.id for person in people) == [10, 11, 12]
+        assert all(session._identity_map[(Person, p.id)] is p for p in people)
+
+    @pytest.mark.asyncio
+    async def test_flush_respects_max_concurrency(self):
+        """Test that a flush phase never runs more than max_concurrency batches."""
+        in_flight = [0]
+        peak = [0]
+
+        async def operation(batch):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+
+        session = AsyncSession(Mock(), max_concurrency=2)
+        await session._run_phase(operation, [[object()] for _ in range(5)])
+
+        assert peak[0] == 2
+
+    def test_invalid_max_concurrency(self):
+        """Test that a non-positive max_concurrency is rejected."""
+        with pytest.raises(ValueError):
+            AsyncSession(Mock(), max_concurrency=0)
+
+
+class TestAsyncSessionPool:
+    """Test async sessions backed by a connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_session_selects_graph_from_pool(self):
+        """Test that a session takes its graph from the pool and leaves it open."""
+        pool = Mock()
+        session = AsyncSession(pool=pool, graph_name="social")
+
+        pool.select_graph.assert_called_once_with("social")
+        assert session.graph is pool.select_graph.return_value
+
+        await session.close()
+        assert not pool.close.called
+
+    def test_session_requires_graph_or_pool(self):
+        """Test that a session without a graph needs both pool and graph_name."""
+        with pytest.raises(ValueError):
+            AsyncSession()
+        with pytest.raises(ValueError):
+            AsyncSession(pool=Mock())
+
+
 class TestSessionEdgeCases:
     """Test session edge cases."""
 